@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+measure the time to validate and load a large synthetic project file
+(by default 500 workpackages x 100 tasks, i.e., 50k tasks)
+
+usage: python -m benchmarks.loading --workpackages 500 --tasks 100
+"""
+
+import os
+import time
+import argparse
+import tempfile
+
+import yaml
+import cerberus
+
+from proma.models import Project, Validator, proma_schema
+
+from benchmarks.synthetic import write_project
+
+
+def measure(func, *args) -> float:
+    """
+    returns the duration of the function call in seconds
+
+    :param func: function
+    :type func: Callable
+    :return: duration in seconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    func(*args)
+
+    return time.perf_counter() - start
+
+
+def validate_cerberus(doc: dict):
+    v = cerberus.Validator(proma_schema)
+    if v.validate(doc) is False:
+        raise Exception(v.errors)
+
+
+def validate_proma(doc: dict):
+    v = Validator(proma_schema)
+    if v.validate(doc) is False:
+        raise Exception(v.errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workpackages", type=int, default=500)
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument(
+        "--cerberus",
+        action="store_true",
+        help="also validate with cerberus (slow)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "project.yml")
+        write_project(
+            filename,
+            workpackages=args.workpackages,
+            tasks=args.tasks,
+        )
+
+        with open(filename, "r") as f:
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            doc = yaml.load(f, Loader=loader)
+
+        print(f"{args.workpackages * args.tasks} tasks")
+        print(f"validate (proma):    {measure(validate_proma, doc):8.3f}s")
+        if args.cerberus:
+            duration = measure(validate_cerberus, doc)
+            print(f"validate (cerberus): {duration:8.3f}s")
+        print(
+            "Project.create_from: "
+            f"{measure(Project.create_from, filename):8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
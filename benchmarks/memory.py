@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+measure the memory footprint of the drawing primitives
+
+usage: python -m benchmarks.memory --count 20000
+"""
+
+import gc
+import argparse
+import tracemalloc
+
+from proma.draw.base import Position, Size, Dimension, Margin, Padding
+from proma.draw.shapes import Text, Label, Cell
+
+
+# factories of the measured objects
+FACTORIES = {
+    "Position": lambda i: Position(i, 0),
+    "Size": lambda i: Size(i, 25),
+    "Dimension": lambda i: Dimension(i, 0, 25, 25),
+    "Margin": lambda i: Margin(i, 0, 0, 0),
+    "Padding": lambda i: Padding(i, 0, 0, 0),
+    "Text": lambda i: Text(i, 0, text=""),
+    "Label": lambda i: Label(i, 0, 25, 25),
+    "Cell": lambda i: Cell(i, 0, 25, 25),
+}
+
+
+def measure(factory, count: int) -> float:
+    """
+    returns the average number of bytes allocated per object
+
+    :param factory: function that creates an object for an index
+    :type factory: callable
+    :param count: number of objects that are created
+    :type count: int
+    :return: bytes per object
+    :rtype: float
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [factory(i) for i in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    assert len(objects) == count
+
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=2000,
+        help="rows of the chart used for the estimate",
+    )
+    parser.add_argument(
+        "--cols",
+        type=int,
+        default=1500,
+        help="columns of the chart used for the estimate",
+    )
+    args = parser.parse_args()
+
+    for name, factory in FACTORIES.items():
+        print(f"{name:>10}: {measure(factory, args.count):8.1f} bytes")
+
+    # estimate for a chart with one cell per row and column
+    per_cell = measure(FACTORIES["Cell"], args.count)
+    total = per_cell * args.rows * args.cols / 1024**2
+    print(f"cells of a {args.rows}x{args.cols} chart: {total:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
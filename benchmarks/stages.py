@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+measure the stages of rendering a synthetic project, i.e., loading the
+project, constructing the timetable, laying out the gantt chart, drawing
+and serializing the SVG, per view; each view is measured in a separate
+process, thus the peak RSS of its stages is not influenced by the others
+
+the results are written as JSON, which can be compared to the results
+of a previous run to detect regressions
+
+usage: python -m benchmarks.stages --workpackages 50 --tasks 100 \\
+           --output results.json [--compare baseline.json]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import svgwrite
+
+from proma.models import Project
+from proma.render import (
+    DEFAULT_CSS,
+    DEFAULT_SIZE,
+    VIEW_FORMATS,
+    create_gantt,
+)
+from proma.utils.timetable import Timetable
+
+from benchmarks.svgsize import count_elements
+from benchmarks.synthetic import write_project
+
+
+# version of the results => increase when the format changes
+RESULTS_VERSION = 1
+
+# measured stages in order
+STAGES = ("load", "timetable", "layout", "draw", "serialize")
+
+# stages that are faster are not compared (too noisy)
+MIN_COMPARED_SECONDS = 0.01
+
+
+def peak_rss() -> int:
+    """
+    returns the peak resident set size of the current process
+
+    :return: peak RSS in bytes
+    :rtype: int
+    """
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # bytes on macOS, KiB otherwise
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def measure_view(
+    filename: str,
+    view: str,
+    compact: bool,
+) -> dict:
+    """
+    render the project file in the given view and measure each stage
+
+    :param filename: filename of the project
+    :type filename: str
+    :param view: view, i.e., "day" or "week"
+    :type view: str
+    :param compact: draw empty cells as merged paths
+    :type compact: bool
+    :return: duration and peak RSS per stage and size of the SVG
+    :rtype: dict
+    """
+    stages = {}
+
+    def stage(name, func):
+        start = time.perf_counter()
+        result = func()
+        stages[name] = {
+            "seconds": time.perf_counter() - start,
+            "peak_rss": peak_rss(),
+        }
+
+        return result
+
+    def create_timetable() -> Timetable:
+        timetable = Timetable(
+            start_date=project.start_date,
+            end_date=project.end_date,
+            formats=VIEW_FORMATS[view],
+        )
+
+        # levels are only materialized on access
+        timetable.items_per_hierarchy
+        timetable.lowest_level
+
+        return timetable
+
+    project = stage("load", lambda: Project.create_from(filename))
+    stage("timetable", create_timetable)
+    gantt = stage(
+        "layout",
+        lambda: create_gantt(project, view=view, compact=compact),
+    )
+
+    # same drawing as the rendering without streaming
+    dwg = svgwrite.Drawing(size=DEFAULT_SIZE, debug=False)
+    dwg.add_stylesheet(DEFAULT_CSS, "default")
+    stage("draw", lambda: dwg.add(gantt.draw(dwg)))
+    svg = stage("serialize", dwg.tostring)
+
+    return {
+        "view": view,
+        "compact": compact,
+        "stages": stages,
+        "elements": count_elements(svg),
+        "svg_bytes": len(svg.encode("utf-8")),
+    }
+
+
+def run(
+    filename: str,
+    views: list,
+    compact: bool,
+) -> list:
+    """
+    measure the views of the project file, each in a new process
+
+    :param filename: filename of the project
+    :type filename: str
+    :param views: views
+    :type views: list
+    :param compact: draw empty cells as merged paths
+    :type compact: bool
+    :return: results per view
+    :rtype: list
+    """
+    # new interpreter per view => independent peak RSS
+    context = multiprocessing.get_context("spawn")
+
+    results = []
+    for view in views:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(
+                pool.submit(measure_view, filename, view, compact).result()
+            )
+
+    return results
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    threshold: float,
+) -> list:
+    """
+    compare the durations of the stages with the baseline and return
+    the stages that are slower than threshold times the baseline
+
+    :param results: results of this run
+    :type results: dict
+    :param baseline: results of a previous run
+    :type baseline: dict
+    :param threshold: maximum ratio of the durations
+    :type threshold: float
+    :return: descriptions of the regressions
+    :rtype: list
+    """
+    previous = {
+        (result["view"], result["compact"]): result
+        for result in baseline.get("results", [])
+    }
+
+    regressions = []
+    for result in results["results"]:
+        base = previous.get((result["view"], result["compact"]))
+        if base is None:
+            continue
+
+        for name in STAGES:
+            seconds = result["stages"][name]["seconds"]
+            base_seconds = base["stages"][name]["seconds"]
+            if max(seconds, base_seconds) < MIN_COMPARED_SECONDS:
+                continue
+
+            ratio = seconds / max(base_seconds, 1e-9)
+            print(
+                f"{result['view']:>4} {name:<10} {base_seconds:8.3f}s -> "
+                f"{seconds:8.3f}s (x{ratio:.2f})"
+            )
+            if ratio > threshold:
+                regressions.append(
+                    f"{result['view']} {name}: x{ratio:.2f} "
+                    f"({base_seconds:.3f}s -> {seconds:.3f}s)"
+                )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--workpackages", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--milestones", type=float, default=0.2)
+    parser.add_argument("--events", type=int, default=5)
+    parser.add_argument("--dependencies", type=float, default=0.2)
+    parser.add_argument("--max-dependencies", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--views",
+        nargs="+",
+        choices=list(VIEW_FORMATS),
+        default=list(VIEW_FORMATS),
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="draw empty cells as merged paths",
+    )
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", help="results of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="maximum ratio of the durations compared to the baseline",
+    )
+    args = parser.parse_args()
+
+    project_args = {
+        "workpackages": args.workpackages,
+        "tasks": args.tasks,
+        "days": args.days,
+        "milestones": args.milestones,
+        "events": args.events,
+        "dependencies": args.dependencies,
+        "max_dependencies": args.max_dependencies,
+        "seed": args.seed,
+    }
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "project.yml")
+        write_project(filename, **project_args)
+
+        results = {
+            "version": RESULTS_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "project": project_args,
+            "compact": args.compact,
+            "results": run(filename, args.views, args.compact),
+        }
+
+    print(f"{args.workpackages * args.tasks} tasks")
+    for result in results["results"]:
+        for name, stage in result["stages"].items():
+            print(
+                f"{result['view']:>4} {name:<10} {stage['seconds']:8.3f}s "
+                f"{stage['peak_rss'] / 1024**2:8.1f} MiB peak RSS"
+            )
+        print(
+            f"{result['view']:>4} {result['elements']} elements, "
+            f"{result['svg_bytes'] / 1024**2:.2f} MiB"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("regressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
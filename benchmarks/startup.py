@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+measure the import time of the command line interface with
+"python -X importtime" and check that the heavy dependencies, e.g.,
+svgwrite or yaml, are not imported at startup (i.e., they are imported
+lazily by the commands that need them)
+
+the results are written as JSON, which can be compared to the results
+of a previous run to detect regressions; exits with 1 on a regression
+or when a heavy module is imported at startup
+
+usage: python -m benchmarks.startup --runs 10 \\
+           --output results.json [--compare baseline.json]
+"""
+
+import sys
+import json
+import argparse
+import platform
+import subprocess
+
+
+# version of the results => increase when the format changes
+RESULTS_VERSION = 1
+
+# module whose import is measured
+DEFAULT_MODULE = "proma.cmd"
+
+# modules that must not be imported at startup
+HEAVY_MODULES = (
+    "svgwrite",
+    "yaml",
+    "dateutil",
+    "pytimeparse",
+    "cerberus",
+    "multiprocessing",
+    "http.server",
+    "proma.draw",
+    "proma.models",
+    "proma.render",
+)
+
+# number of the slowest modules in the results
+SLOWEST_COUNT = 10
+
+
+def import_times(module: str) -> dict:
+    """
+    import the module in a new interpreter and returns the self and
+    cumulative import time of each imported module
+
+    :param module: name of the module
+    :type module: str
+    :return: (self, cumulative) import time in seconds per module
+    :rtype: dict
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time:  <self us> | <cumulative us> | <indented name>
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:") :].split("|")
+        if not fields[0].strip().isdigit():
+            # header
+            continue
+
+        times[fields[2].strip()] = (
+            int(fields[0]) / 1e6,
+            int(fields[1]) / 1e6,
+        )
+
+    return times
+
+
+def measure(
+    module: str,
+    runs: int,
+) -> dict:
+    """
+    measure the import time of the module in the given number of new
+    interpreters and return the fastest run
+
+    :param module: name of the module
+    :type module: str
+    :param runs: number of runs
+    :type runs: int
+    :return: import time, imported modules and the slowest modules
+    :rtype: dict
+    """
+    best = None
+    for _ in range(runs):
+        times = import_times(module)
+        if (best is None) or (times[module][1] < best[module][1]):
+            best = times
+
+    slowest = sorted(best.items(), key=lambda item: item[1][0])
+    heavy = [
+        heavy
+        for heavy in HEAVY_MODULES
+        if any(
+            (name == heavy) or name.startswith(f"{heavy}.") for name in best
+        )
+    ]
+
+    return {
+        "module": module,
+        "seconds": best[module][1],
+        "modules": len(best),
+        "slowest": [
+            {"module": name, "seconds": self_seconds}
+            for name, (self_seconds, _) in slowest[::-1][:SLOWEST_COUNT]
+        ],
+        "heavy": heavy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", help="results of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="maximum ratio of the import time compared to the baseline",
+    )
+    args = parser.parse_args()
+
+    result = measure(args.module, args.runs)
+    results = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "result": result,
+    }
+
+    print(
+        f"{result['module']}: {result['seconds'] * 1000:.1f}ms "
+        f"({result['modules']} modules, best of {args.runs})"
+    )
+    for slow in result["slowest"]:
+        print(f"  {slow['seconds'] * 1000:8.2f}ms  {slow['module']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    failures = []
+    if result["heavy"]:
+        failures.append(f"heavy modules imported: {result['heavy']}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            base = json.load(f)["result"]
+
+        ratio = result["seconds"] / max(base["seconds"], 1e-9)
+        print(
+            f"{base['seconds'] * 1000:.1f}ms -> "
+            f"{result['seconds'] * 1000:.1f}ms (x{ratio:.2f})"
+        )
+        if ratio > args.threshold:
+            failures.append(f"import time: x{ratio:.2f}")
+
+    if failures:
+        print("regressions:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+compare size and number of elements of the rendered SVG
+with and without compact mode
+
+usage: python -m benchmarks.svgsize --workpackages 10 --tasks 10
+"""
+
+import re
+import argparse
+import tempfile
+
+import svgwrite
+
+from proma.draw.widgets.gantt.gantt import Gantt
+from proma.models import Project
+from proma.utils.timetable import (
+    YEAR_MONTH_WEEK_FMT,
+    YEAR_QUARTER_MONTH_WEEK_DAY_FMT,
+)
+
+from benchmarks.synthetic import write_project
+
+
+def render(
+    project: Project,
+    formats: dict,
+    compact: bool,
+) -> str:
+    """
+    render the project's gantt chart and return the SVG
+
+    :param project: project
+    :type project: Project
+    :param formats: formats of the timetable
+    :type formats: dict
+    :param compact: use compact mode
+    :type compact: bool
+    :return: SVG
+    :rtype: str
+    """
+    dwg = svgwrite.Drawing(size=("1900", "600"))
+    gantt = Gantt(
+        x=100,
+        y=100,
+        project=project,
+        formats=formats,
+        compact=compact,
+    )
+    dwg.add(gantt.draw(dwg))
+
+    return dwg.tostring()
+
+
+def count_elements(svg: str) -> int:
+    """
+    returns the number of elements in the SVG
+
+    :param svg: SVG
+    :type svg: str
+    :return: number of elements
+    :rtype: int
+    """
+    return len(re.findall(r"<[a-zA-Z]", svg))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workpackages", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(suffix=".yml") as f:
+        write_project(
+            f.name,
+            workpackages=args.workpackages,
+            tasks=args.tasks,
+            days=args.days,
+        )
+        project = Project.create_from(f.name)
+
+    for view, formats in (
+        ("day", YEAR_QUARTER_MONTH_WEEK_DAY_FMT),
+        ("week", YEAR_MONTH_WEEK_FMT),
+    ):
+        for compact in (False, True):
+            svg = render(project, formats, compact)
+            print(
+                f"{view:>4} compact={compact!s:5}: "
+                f"{count_elements(svg):9d} elements, "
+                f"{len(svg) / 1024**2:8.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+generate synthetic project files for benchmarks
+
+usage: python -m benchmarks.synthetic project.yml --workpackages 10
+"""
+
+import random
+import argparse
+import datetime
+
+import yaml
+
+
+# first day of synthetic projects (same with and without dayfirst)
+START_DATE = datetime.date(2023, 1, 1)
+
+
+def generate_project(
+    workpackages: int = 10,
+    tasks: int = 10,
+    days: int = 365,
+    seed: int = 0,
+    milestones: float = 0.0,
+    events: int = 0,
+    dependencies: float = 0.0,
+    max_dependencies: int = 1,
+) -> dict:
+    """
+    generate a synthetic project document as read from a project file
+
+    :param workpackages: number of workpackages, defaults to 10
+    :type workpackages: int, optional
+    :param tasks: number of tasks per workpackage, defaults to 10
+    :type tasks: int, optional
+    :param days: number of days the project spans, defaults to 365
+    :type days: int, optional
+    :param seed: seed of the random generator, defaults to 0
+    :type seed: int, optional
+    :param milestones: share of tasks with a milestone, defaults to 0.0
+    :type milestones: float, optional
+    :param events: number of events, defaults to 0
+    :type events: int, optional
+    :param dependencies: share of tasks that depend on a previous task,
+        defaults to 0.0
+    :type dependencies: float, optional
+    :param max_dependencies: maximum number of previous tasks a task
+        depends on, defaults to 1
+    :type max_dependencies: int, optional
+    :return: project document
+    :rtype: dict
+    """
+    rnd = random.Random(seed)
+    end_date = START_DATE + datetime.timedelta(days=days)
+
+    # separate generator => same tasks with and without the extras
+    extras = random.Random(seed + 1)
+
+    doc = {
+        "name": "synthetic",
+        "responsible": "John Doe",
+        "start_date": START_DATE.isoformat(),
+        "end_date": end_date.isoformat(),
+    }
+
+    if events > 0:
+        doc["events"] = [
+            {
+                "name": f"Event {e}",
+                "date": (
+                    START_DATE
+                    + datetime.timedelta(days=extras.randint(0, days - 1))
+                ).isoformat(),
+            }
+            for e in range(events)
+        ]
+
+    doc["workpackages"] = []
+
+    # names of all previous tasks for dependencies
+    task_names = []
+
+    for w in range(workpackages):
+        wp = {"name": f"Work Package {w}", "responsible": "John Doe"}
+        wp["tasks"] = []
+        for t in range(tasks):
+            # task that ends within the project
+            duration = rnd.randint(1, min(20, days - 1))
+            start = START_DATE + datetime.timedelta(
+                days=rnd.randint(0, days - duration - 1)
+            )
+            task = {
+                "name": f"Task {w}.{t}",
+                "start_date": start.isoformat(),
+                "duration": f"{duration}d",
+            }
+
+            if task_names and (extras.random() < dependencies):
+                if max_dependencies <= 1:
+                    task["depends_on"] = extras.choice(task_names)
+                else:
+                    count = extras.randint(1, max_dependencies)
+                    task["depends_on"] = extras.sample(
+                        task_names, min(count, len(task_names))
+                    )
+
+            if extras.random() < milestones:
+                # milestone within the task
+                date = start + datetime.timedelta(
+                    days=extras.randint(0, duration - 1)
+                )
+                task["milestones"] = [
+                    {
+                        "name": f"Milestone {w}.{t}",
+                        "responsible": "John Doe",
+                        "date": date.isoformat(),
+                    }
+                ]
+
+            wp["tasks"].append(task)
+            task_names.append(task["name"])
+        doc["workpackages"].append(wp)
+
+    return doc
+
+
+def write_project(
+    filename: str,
+    multi_document: bool = False,
+    **kwargs,
+):
+    """
+    generate a synthetic project and write it to the given file
+
+    :param filename: name of the project file
+    :type filename: str
+    :param multi_document: write each workpackage as separate yaml
+        document after the project's header, defaults to False
+    :type multi_document: bool, optional
+    """
+    doc = generate_project(**kwargs)
+    with open(filename, "w") as f:
+        if multi_document is False:
+            yaml.safe_dump(doc, f, sort_keys=False)
+            return
+
+        workpackages = doc.pop("workpackages")
+        yaml.safe_dump_all([doc, *workpackages], f, sort_keys=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("filename")
+    parser.add_argument("--workpackages", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=10)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--milestones",
+        type=float,
+        default=0.0,
+        help="share of tasks with a milestone",
+    )
+    parser.add_argument("--events", type=int, default=0)
+    parser.add_argument(
+        "--dependencies",
+        type=float,
+        default=0.0,
+        help="share of tasks that depend on a previous task",
+    )
+    parser.add_argument(
+        "--max-dependencies",
+        type=int,
+        default=1,
+        help="maximum number of previous tasks a task depends on",
+    )
+    parser.add_argument(
+        "--multi-document",
+        action="store_true",
+        help="one yaml document per workpackage",
+    )
+    args = parser.parse_args()
+
+    write_project(
+        args.filename,
+        multi_document=args.multi_document,
+        workpackages=args.workpackages,
+        tasks=args.tasks,
+        days=args.days,
+        seed=args.seed,
+        milestones=args.milestones,
+        events=args.events,
+        dependencies=args.dependencies,
+        max_dependencies=args.max_dependencies,
+    )
+
+
+if __name__ == "__main__":
+    main()
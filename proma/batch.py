@@ -0,0 +1,327 @@
+import os
+import glob
+import json
+import time
+import logging
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Optional
+
+from proma.models import Project
+from proma.render import DEFAULT_CSS, render_gantt
+from proma.utils.rendercache import CACHE_VERSION, RenderCache, fingerprint
+
+
+# prepare logger
+log = logging.getLogger(__file__)
+
+# file in the output directory that stores the fingerprints of the inputs
+STATE_FILENAME = ".proma-batch.json"
+
+# suffixes of project files, when a directory is given
+PROJECT_SUFFIXES = (".yml", ".yaml")
+
+
+@dataclass
+class BatchJob:
+    """
+    rendering of a single project file
+    """
+
+    filename: str
+    output_filename: str
+    fingerprint: str
+    view: str = "day"
+    compact: bool = False
+    stream: bool = False
+    cache: Optional[RenderCache] = None
+    snapshot: bool = False
+    strict_dates: bool = False
+
+
+@dataclass
+class BatchResult:
+    """
+    result of a single project file of the batch
+    """
+
+    filename: str
+    output_filename: str
+    status: str
+    duration: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.status == "failed"
+
+
+def collect_files(patterns: Iterable[str]) -> List[str]:
+    """
+    returns the project files matching the given glob patterns,
+    files or directories (searched recursively for YAML files)
+
+    :param patterns: glob patterns, files or directories
+    :type patterns: Iterable[str]
+    :raises ValueError: raised when a pattern does not match any file
+    :return: sorted list of project files without duplicates
+    :rtype: List[str]
+    """
+    filenames = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            # all project files in directory
+            matches = [
+                str(p)
+                for p in Path(pattern).rglob("*")
+                if p.suffix in PROJECT_SUFFIXES and p.is_file()
+            ]
+        else:
+            matches = [
+                p
+                for p in glob.glob(pattern, recursive=True)
+                if os.path.isfile(p)
+            ]
+
+        if not matches:
+            # pattern without files is most likely a typo
+            raise ValueError(
+                f"No project files found for '{pattern}'! Abort."
+            )
+
+        filenames.update(matches)
+
+    return sorted(filenames)
+
+
+def input_files(filename: str) -> List[str]:
+    """
+    returns the files the project is loaded from; if they cannot be
+    determined, only the project file itself, since the error is
+    reported when the project is rendered
+
+    :param filename: filename of the project
+    :type filename: str
+    :return: project file and included files
+    :rtype: List[str]
+    """
+    try:
+        return Project.input_files(filename)
+
+    except Exception:
+        return [filename]
+
+
+def load_state(output_dir: str) -> dict:
+    """
+    returns the fingerprints of the previous batch in the output directory
+
+    :param output_dir: output directory
+    :type output_dir: str
+    :return: fingerprints per project file
+    :rtype: dict
+    """
+    try:
+        with open(os.path.join(output_dir, STATE_FILENAME), "r") as f:
+            return json.load(f)
+
+    except (OSError, ValueError):
+        # no (valid) previous state => render all
+        return {}
+
+
+def save_state(output_dir: str, state: dict):
+    """
+    save the fingerprints of the batch in the output directory
+
+    :param output_dir: output directory
+    :type output_dir: str
+    :param state: fingerprints per project file
+    :type state: dict
+    """
+    with open(os.path.join(output_dir, STATE_FILENAME), "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def render_job(job: BatchJob) -> BatchResult:
+    """
+    render the project file of the job; errors are returned as
+    result instead of being raised, thus a failing project does not
+    stop the batch
+
+    :param job: job
+    :type job: BatchJob
+    :return: result
+    :rtype: BatchResult
+    """
+    start = time.perf_counter()
+    try:
+        render_gantt(
+            filename=job.filename,
+            output_filename=job.output_filename,
+            view=job.view,
+            compact=job.compact,
+            stream=job.stream,
+            cache=job.cache,
+            snapshot=job.snapshot,
+            strict_dates=job.strict_dates,
+        )
+
+    except Exception as e:
+        return BatchResult(
+            filename=job.filename,
+            output_filename=job.output_filename,
+            status="failed",
+            duration=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+    return BatchResult(
+        filename=job.filename,
+        output_filename=job.output_filename,
+        status="rendered",
+        duration=time.perf_counter() - start,
+    )
+
+
+def render_batch(
+    filenames: List[str],
+    output_dir: str = ".",
+    view: str = "day",
+    compact: bool = False,
+    stream: bool = False,
+    workers: Optional[int] = None,
+    force: bool = False,
+    cache: Optional[RenderCache] = None,
+    snapshot: bool = False,
+    strict_dates: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    render the gantt charts of the project files in a process pool;
+    project files whose inputs have not changed since the last batch
+    in the output directory are skipped
+
+    :param filenames: filenames of the projects
+    :type filenames: List[str]
+    :param output_dir: output directory of the SVGs, defaults to "."
+    :type output_dir: str, optional
+    :param view: view, i.e., "day" or "week", defaults to "day"
+    :type view: str, optional
+    :param compact: draw empty cells as merged paths, defaults to False
+    :type compact: bool, optional
+    :param stream: write the SVGs while drawing, defaults to False
+    :type stream: bool, optional
+    :param workers: number of processes, defaults to None (cpu count)
+    :type workers: Optional[int], optional
+    :param force: render also unchanged files, defaults to False
+    :type force: bool, optional
+    :param cache: cache of rendered SVGs, defaults to None (no cache)
+    :type cache: Optional[RenderCache], optional
+    :param snapshot: use snapshots of the loaded projects, defaults to False
+    :type snapshot: bool, optional
+    :param strict_dates: only accept ISO 8601 and explicit date formats,
+        defaults to False
+    :type strict_dates: bool, optional
+    :raises ValueError: raised when project files have the same name
+    :yield: result per project file in order of completion
+    :rtype: Iterator[BatchResult]
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    # output files are named after the project files
+    output_filenames = {}
+    for filename in filenames:
+        output_filename = os.path.join(
+            output_dir,
+            f"{Path(filename).stem}.svg",
+        )
+        if output_filename in output_filenames:
+            raise ValueError(
+                f"The project files '{output_filenames[output_filename]}' "
+                f"and '{filename}' have the same output '{output_filename}'!"
+                " Abort."
+            )
+        output_filenames[output_filename] = filename
+
+    state = load_state(output_dir)
+    jobs = []
+    for output_filename, filename in output_filenames.items():
+        job = BatchJob(
+            filename=filename,
+            output_filename=output_filename,
+            fingerprint=fingerprint(
+                [*input_files(filename), DEFAULT_CSS],
+                view=view,
+                compact=compact,
+                stream=stream,
+                strict_dates=strict_dates,
+                # => render again, when the output changes after an upgrade
+                cache_version=CACHE_VERSION,
+            ),
+            view=view,
+            compact=compact,
+            stream=stream,
+            cache=cache,
+            snapshot=snapshot,
+            strict_dates=strict_dates,
+        )
+
+        key = os.path.abspath(filename)
+        if (
+            (force is False)
+            and (state.get(key) == job.fingerprint)
+            and os.path.isfile(output_filename)
+        ):
+            # inputs unchanged since last batch
+            yield BatchResult(filename, output_filename, status="skipped")
+            continue
+
+        # invalidate, since the output is overwritten
+        state.pop(key, None)
+        jobs.append(job)
+
+    fingerprints = {job.filename: job.fingerprint for job in jobs}
+    try:
+        if (workers == 1) or (len(jobs) <= 1):
+            # no need for a process pool
+            results = map(render_job, jobs)
+            for result in results:
+                if not result.failed:
+                    key = os.path.abspath(result.filename)
+                    state[key] = fingerprints[result.filename]
+                yield result
+
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(render_job, job) for job in jobs]
+                for future in as_completed(futures):
+                    result = future.result()
+                    if not result.failed:
+                        key = os.path.abspath(result.filename)
+                        state[key] = fingerprints[result.filename]
+                    yield result
+
+    finally:
+        # keep fingerprints of rendered files, even if interrupted
+        save_state(output_dir, state)
+
+
+def summary(results: List[BatchResult]) -> dict:
+    """
+    returns the number of files per status and the total duration
+
+    :param results: results of the batch
+    :type results: List[BatchResult]
+    :return: summary
+    :rtype: dict
+    """
+    counts = {"rendered": 0, "skipped": 0, "failed": 0}
+    for result in results:
+        counts[result.status] += 1
+
+    return {
+        **counts,
+        "duration": sum(result.duration for result in results),
+    }
+
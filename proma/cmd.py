@@ -1,19 +1,34 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import time
+import cProfile
 import logging
+import functools
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
 
-import svgwrite
 import click
 
-from proma.utils.timetable import (
-    YEAR_MONTH_WEEK_FMT,
-    YEAR_QUARTER_MONTH_WEEK_DAY_FMT,
+from proma.consts import (
+    VIEWS,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_HOST,
+    DEFAULT_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_SVG_CACHE_SIZE,
+    DEFAULT_WORKERS,
 )
-from proma.draw.widgets.gantt.gantt import Gantt
+from proma.utils.instrumentation import instrumentation
 
-from proma.models import Project
+if TYPE_CHECKING:
+    from proma.utils.rendercache import RenderCache
+
+# the modules that load the models and draw the charts (svgwrite, yaml,
+# dateutil, ...) are imported by the commands that need them, thus the
+# startup, e.g., of "proma --help", stays fast
 
 
 # prepare logger
@@ -31,44 +46,484 @@ def cli(debug: bool):
         logging.basicConfig(level=logging.DEBUG)
 
 
+def cache_options(func):
+    """
+    add the options of the render cache to the command
+    """
+    func = click.option(
+        "--cache-size",
+        type=click.IntRange(min=0),
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        show_default=True,
+        help="maximum size of the cache in MiB",
+    )(func)
+    func = click.option(
+        "--cache-dir",
+        type=click.Path(file_okay=False),
+        help="cache directory (default: $PROMA_CACHE_DIR or ~/.cache/proma)",
+    )(func)
+    func = click.option(
+        "--cache/--no-cache",
+        default=True,
+        help="reuse previously rendered SVGs if the inputs are unchanged",
+    )(func)
+
+    return func
+
+
+def instrumentation_options(func):
+    """
+    add the options to print the timings and counters of the command's
+    stages and to dump its cProfile statistics afterwards
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, timings: bool, profile: Optional[str], **kwargs):
+        if timings is True:
+            instrumentation.enable()
+
+        profiler = cProfile.Profile() if profile is not None else None
+        start = time.perf_counter()
+        try:
+            if profiler is not None:
+                return profiler.runcall(func, *args, **kwargs)
+
+            return func(*args, **kwargs)
+
+        finally:
+            duration = time.perf_counter() - start
+            if profiler is not None:
+                # e.g., python -m pstats <profile>
+                profiler.dump_stats(profile)
+                log.debug(f"saved profile to '{profile}'")
+
+            if timings is True:
+                instrumentation.disable()
+                click.echo(instrumentation.report(duration), err=True)
+
+    wrapper = click.option(
+        "--profile",
+        type=click.Path(dir_okay=False),
+        help="dump the cProfile statistics to the file (see pstats)",
+    )(wrapper)
+    wrapper = click.option(
+        "--timings/--no-timings",
+        default=False,
+        help="print the time of each stage and the counters afterwards",
+    )(wrapper)
+
+    return wrapper
+
+
+def get_cache(
+    cache: bool,
+    cache_dir: Optional[str],
+    cache_size: int,
+) -> Optional["RenderCache"]:
+    """
+    returns the render cache based on the command line options
+
+    :param cache: use cache
+    :type cache: bool
+    :param cache_dir: cache directory
+    :type cache_dir: Optional[str]
+    :param cache_size: maximum size of the cache in MiB
+    :type cache_size: int
+    :return: render cache or None, if it is disabled
+    :rtype: Optional[RenderCache]
+    """
+    if cache is False:
+        return None
+
+    from proma.utils.rendercache import RenderCache
+
+    return RenderCache(cache_dir, max_size=cache_size * 1024 * 1024)
+
+
 @cli.command()
 @click.argument("filename")
 @click.option(
     "--view",
-    type=click.Choice(["day", "week"]),
+    type=click.Choice(VIEWS),
     show_default=True,
     default="day",
 )
-def gantt(filename: str, view: str):
+@click.option(
+    "--compact/--no-compact",
+    default=False,
+    help="draw empty cells as merged paths (requires css for paths)",
+)
+@click.option(
+    "--stream/--no-stream",
+    default=False,
+    help="write the SVG while drawing instead of building it in memory",
+)
+@cache_options
+@click.option(
+    "--snapshot/--no-snapshot",
+    default=False,
+    help="load the project from a snapshot next to the file if unchanged",
+)
+@click.option(
+    "--strict-dates/--no-strict-dates",
+    default=False,
+    help="only accept ISO 8601 and explicit date formats (no guessing)",
+)
+@click.option(
+    "--start-date",
+    type=click.DateTime(),
+    help="first date of the rendered window",
+)
+@click.option(
+    "--end-date",
+    type=click.DateTime(),
+    help="last date of the rendered window",
+)
+@click.option(
+    "--first-row",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="first workpackage/task row of the rendered window",
+)
+@click.option(
+    "--row-count",
+    type=click.IntRange(min=1),
+    help="number of workpackage/task rows of the rendered window",
+)
+@click.option(
+    "--tile-days",
+    type=click.IntRange(min=1),
+    help="split the window into tiles of the given number of days",
+)
+@click.option(
+    "--tile-rows",
+    type=click.IntRange(min=1),
+    help="split the window into tiles of the given number of rows",
+)
+@click.option(
+    "--watch/--no-watch",
+    default=False,
+    help="re-render the chart whenever the project files change",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=DEFAULT_INTERVAL,
+    show_default=True,
+    help="interval in seconds to check the project files in watch mode",
+)
+@click.option(
+    "--critical-path/--no-critical-path",
+    default=False,
+    help="highlight the tasks and dependencies on the critical path",
+)
+@instrumentation_options
+def gantt(
+    filename: str,
+    view: str,
+    compact: bool,
+    stream: bool,
+    cache: bool,
+    cache_dir: Optional[str],
+    cache_size: int,
+    snapshot: bool,
+    strict_dates: bool,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    first_row: int,
+    row_count: Optional[int],
+    tile_days: Optional[int],
+    tile_rows: Optional[int],
+    watch: bool,
+    interval: float,
+    critical_path: bool,
+):
     """
     create gantt chart from given project filename
     """
+    from proma.draw.widgets.gantt.viewport import Viewport, ViewportError
+    from proma.models import Project
+    from proma.render import create_gantt, render_gantt, save_gantt
+
+    # window of the chart that is rendered
+    viewport = Viewport(
+        start_date=start_date,
+        end_date=end_date,
+        first_row=first_row,
+        row_count=row_count,
+    )
+
+    if watch is True:
+        if (tile_days is not None) or (tile_rows is not None):
+            raise click.UsageError("Tiles cannot be watched! Abort.")
+
+        from proma.watch import Watcher
+
+        # keep the chart in memory and re-render it on changes
+        # => no render cache and no snapshots needed
+        watcher = Watcher(
+            filename,
+            view=view,
+            compact=compact,
+            viewport=viewport,
+            strict_dates=strict_dates,
+            interval=interval,
+            critical_path=critical_path,
+        )
+        click.echo(f"watching '{filename}' (press Ctrl+C to stop)...")
+        try:
+            for result in watcher.watch():
+                if result.failed:
+                    click.echo(
+                        f"failed   {result.duration:8.3f}s  {result.error}"
+                    )
+                    continue
+
+                click.echo(
+                    f"rendered {result.duration:8.3f}s  "
+                    f"{result.output_filename} ({len(result.changed)} of "
+                    f"{result.workpackage_count} workpackages changed)"
+                )
+
+        except KeyboardInterrupt:
+            pass
+
+        return
+
+    if (tile_days is None) and (tile_rows is None):
+        # draw gantt
+        try:
+            render_gantt(
+                filename,
+                view=view,
+                compact=compact,
+                stream=stream,
+                viewport=viewport,
+                cache=get_cache(cache, cache_dir, cache_size),
+                snapshot=snapshot,
+                strict_dates=strict_dates,
+                critical_path=critical_path,
+            )
+        except ViewportError as e:
+            # --start-date/--end-date do not overlap the project
+            raise click.UsageError(str(e))
+
+        return
+
     # get project data from file
     log.debug(f"loading project file from '{filename}'...")
-    project = Project.create_from(filename)
+    project = Project.create_from(
+        filename,
+        snapshot=snapshot,
+        strict_dates=strict_dates,
+    )
+
+    # split the window into tiles that are drawn independently
+    try:
+        tile_start_date, tile_end_date = viewport.clamp_dates(
+            project.start_date,
+            project.end_date,
+        )
+    except ViewportError as e:
+        # --start-date/--end-date do not overlap the project
+        raise click.UsageError(str(e))
+    project_rows = len(project.workpackages) + project.entries
+    if row_count is not None:
+        project_rows = min(project_rows, first_row + row_count)
+
+    for row_index, col_index, tile in Viewport.tiles(
+        start_date=tile_start_date,
+        end_date=tile_end_date,
+        row_count=max(project_rows - first_row, 0),
+        tile_days=tile_days,
+        tile_rows=tile_rows,
+    ):
+        # tile's rows are relative to the window
+        tile = replace(tile, first_row=first_row + tile.first_row)
+        if (tile.row_count is not None) and (row_count is not None):
+            tile = replace(
+                tile,
+                row_count=min(
+                    tile.row_count,
+                    first_row + row_count - tile.first_row,
+                ),
+            )
+
+        gantt = create_gantt(
+            project=project,
+            view=view,
+            compact=compact,
+            viewport=tile,
+            critical_path=critical_path,
+        )
+        save_gantt(
+            gantt,
+            f"{Path(filename).stem}_{row_index}_{col_index}.svg",
+            stream=stream,
+        )
+
+
+@cli.command()
+@click.argument("patterns", nargs=-1, required=True)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default=".",
+    show_default=True,
+    help="directory of the rendered SVGs",
+)
+@click.option(
+    "--view",
+    type=click.Choice(VIEWS),
+    show_default=True,
+    default="day",
+)
+@click.option(
+    "--compact/--no-compact",
+    default=False,
+    help="draw empty cells as merged paths (requires css for paths)",
+)
+@click.option(
+    "--stream/--no-stream",
+    default=False,
+    help="write the SVGs while drawing instead of building them in memory",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="number of worker processes (default: number of CPUs)",
+)
+@cache_options
+@click.option(
+    "--snapshot/--no-snapshot",
+    default=False,
+    help="load the project from a snapshot next to the file if unchanged",
+)
+@click.option(
+    "--strict-dates/--no-strict-dates",
+    default=False,
+    help="only accept ISO 8601 and explicit date formats (no guessing)",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    help="render also project files whose inputs have not changed",
+)
+def batch(
+    patterns: Tuple[str],
+    output_dir: str,
+    view: str,
+    compact: bool,
+    stream: bool,
+    cache: bool,
+    cache_dir: Optional[str],
+    cache_size: int,
+    snapshot: bool,
+    strict_dates: bool,
+    workers: Optional[int],
+    force: bool,
+):
+    """
+    create gantt charts of all project files matching the given
+    glob patterns, files or directories
+    """
+    from proma.batch import collect_files, render_batch, summary
+
+    try:
+        filenames = collect_files(patterns)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+
+    start = time.perf_counter()
+    results = []
+    for result in render_batch(
+        filenames,
+        output_dir=output_dir,
+        view=view,
+        compact=compact,
+        stream=stream,
+        workers=workers,
+        force=force,
+        cache=get_cache(cache, cache_dir, cache_size),
+        snapshot=snapshot,
+        strict_dates=strict_dates,
+    ):
+        results.append(result)
+        click.echo(
+            f"{result.status:<8} {result.duration:8.3f}s  {result.filename}"
+            + (f"  ({result.error})" if result.failed else "")
+        )
 
-    # draw the gantt chart
-    dwg = svgwrite.Drawing(size=("1900", "600"))
+    s = summary(results)
+    click.echo(
+        f"{s['rendered']} rendered, {s['skipped']} skipped, "
+        f"{s['failed']} failed ({s['duration']:.3f}s render time, "
+        f"{time.perf_counter() - start:.3f}s elapsed)"
+    )
+
+    if s["failed"] > 0:
+        # signal failures to the caller, e.g., nightly jobs
+        raise SystemExit(1)
 
-    # add default css for formatting
-    # TODO: make configurable via parameter?!
-    dwg.add_stylesheet("css/default.css", "default")
 
-    # set format (hierarchy) for output
-    formats = (
-        YEAR_QUARTER_MONTH_WEEK_DAY_FMT
-        if view == "day"
-        else YEAR_MONTH_WEEK_FMT
+@cli.command()
+@click.option(
+    "--host",
+    default=DEFAULT_HOST,
+    show_default=True,
+    help="address the server listens on",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=DEFAULT_PORT,
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="number of threads that handle requests",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_SVG_CACHE_SIZE // (1024 * 1024),
+    show_default=True,
+    help="maximum size of the cached SVGs in MiB",
+)
+def serve(
+    host: str,
+    port: int,
+    workers: int,
+    cache_size: int,
+):
+    """
+    run a local HTTP server that renders gantt charts of project files,
+    which are posted to /gantt (options as query parameters, e.g.,
+    ?view=week&compact=1)
+    """
+    from proma.serve import RenderServer, RenderService
+
+    server = RenderServer(
+        (host, port),
+        RenderService(svg_cache_size=cache_size * 1024 * 1024),
+        workers=workers,
+    )
+    click.echo(
+        f"serving on http://{host}:{server.server_port}/gantt "
+        "(press Ctrl+C to stop)..."
     )
+    try:
+        server.serve_forever()
 
-    # draw gantt
-    gantt = Gantt(x=100, y=100, project=project, formats=formats)
-    dwg.add(gantt.draw(dwg))
+    except KeyboardInterrupt:
+        pass
 
-    # finally, save
-    output_filename = f"{Path(filename).stem}.svg"
-    log.debug(f"saving SVG to '{output_filename}'...")
-    dwg.saveas(output_filename)
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":
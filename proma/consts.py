@@ -0,0 +1,21 @@
+# constants that are needed to set up the command line interface; kept
+# free of heavy imports, thus e.g. "proma --help" does not load svgwrite
+
+# views of the gantt chart (see VIEW_FORMATS in proma.render)
+VIEWS = ("day", "week")
+
+# default maximum size of all entries of the render cache
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+
+# default interval in seconds to check the project files for changes
+DEFAULT_INTERVAL = 0.5
+
+# default address of the server (local only)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+# default number of threads that handle requests
+DEFAULT_WORKERS = 4
+
+# default maximum size of all cached SVGs
+DEFAULT_SVG_CACHE_SIZE = 256 * 1024 * 1024
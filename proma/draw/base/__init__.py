@@ -1,3 +1,4 @@
+from .listener import batch_notifications
 from .position import Position
 from .size import Size
 from .dimension import Dimension
@@ -5,4 +6,11 @@ from .margin import Margin
 from .padding import Padding
 
 
-__all__ = ["Position", "Size", "Dimension", "Margin", "Padding"]
+__all__ = [
+    "batch_notifications",
+    "Position",
+    "Size",
+    "Dimension",
+    "Margin",
+    "Padding",
+]
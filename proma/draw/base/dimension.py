@@ -1,4 +1,7 @@
-from proma.draw.base.listener import OnChangeDimensionListener
+from proma.draw.base.listener import (
+    OnChangeDimensionListener,
+    batch_notifications,
+)
 from proma.draw.base.position import Position
 from proma.draw.base.size import Size
 
@@ -8,6 +11,8 @@ class Dimension(OnChangeDimensionListener):
     dimension (x, y, width, height)
     """
 
+    __slots__ = ("_pos", "_size")
+
     def __init__(
         self,
         x: int,
@@ -250,8 +255,9 @@ class Dimension(OnChangeDimensionListener):
         :param dim: dimension
         :type dim: Dimension
         """
-        self.pos = dim.pos
-        self.size = dim.size
+        with batch_notifications():
+            self.pos = dim.pos
+            self.size = dim.size
 
     @property
     def x1(self) -> int:
@@ -1,14 +1,78 @@
+import threading
+from collections import deque
 from typing import Any
 
+from proma.utils.instrumentation import instrumentation
+
+
+class _BatchState(threading.local):
+    """
+    per thread state of the notification batching
+    """
+
+    def __init__(self):
+        # nesting depth of batch contexts (0 => not batching)
+        self.depth = 0
+
+        # listeners in order of their first pending notification and
+        # the latest notification arguments per listener
+        self.order = deque()
+        self.pending = {}
+
+
+_batch_state = _BatchState()
+
+
+class batch_notifications:
+    """
+    context manager that suspends all notifications and delivers them
+    when the outermost context is left; multiple notifications of the
+    same object are coalesced into a single one with the latest arguments
+
+    notifications that are triggered while delivering are batched as
+    well, thus a cascade of changes only updates each object once
+    """
+
+    def __enter__(self) -> "batch_notifications":
+        _batch_state.depth += 1
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        state = _batch_state
+        if state.depth > 1:
+            # nested context => outermost context delivers
+            state.depth -= 1
+            return
+
+        try:
+            if exc_type is None:
+                # deliver pending notifications (incl. the triggered ones)
+                while state.order:
+                    listener = state.order.popleft()
+                    kwargs = state.pending.pop(id(listener))
+                    listener._deliver(**kwargs)
+
+        finally:
+            state.depth = 0
+            state.order.clear()
+            state.pending.clear()
+
 
 class Listener:
     """
     helper class to manage listeners
     """
 
-    def __init__(self, name: str):
-        self.name = name
-        self.listeners = []
+    __slots__ = ("listeners",)
+
+    # name of the method that is called on the listeners
+    name = None
+
+    def __init__(self):
+        # tuple instead of list, since listeners are rarely added
+        # but there are many instances
+        self.listeners = ()
 
     def add_listener(
         self,
@@ -20,15 +84,41 @@ class Listener:
         :param instance: instance of the class that should be notified
         :type instance: Any
         """
-        self.listeners.append(instance)
+        # the instance instead of its bound method, since a bound method
+        # per registration costs more memory than the lookup costs time
+        self.listeners += (instance,)
+
+    def _deliver(self, **kwargs):
+        """
+        call all previously added listeners by passing given arguments
+        """
+        instrumentation.count("notifications")
+
+        name = self.name
+        for listener in self.listeners:
+            getattr(listener, name)(**kwargs)
 
     def notify(self, **kwargs):
         """
         notify all previously added listeners on notify
-        by passing given arguments
+        by passing given arguments; within batch_notifications()
+        the notification is deferred and coalesced
         """
-        for listener in self.listeners:
-            getattr(listener, self.name)(**kwargs)
+        if not self.listeners:
+            # nobody to notify
+            return
+
+        state = _batch_state
+        if state.depth == 0:
+            # batch the notifications triggered by the listeners
+            with batch_notifications():
+                self._deliver(**kwargs)
+            return
+
+        key = id(self)
+        if key not in state.pending:
+            state.order.append(self)
+        state.pending[key] = kwargs
 
 
 class OnChangePositionListener(Listener):
@@ -36,8 +126,9 @@ class OnChangePositionListener(Listener):
     listener class that is called when position is changed
     """
 
-    def __init__(self):
-        Listener.__init__(self, "on_change_position")
+    __slots__ = ()
+
+    name = "on_change_position"
 
 
 class OnChangeSizeListener(Listener):
@@ -45,8 +136,9 @@ class OnChangeSizeListener(Listener):
     listener class that is called when size is changed
     """
 
-    def __init__(self):
-        Listener.__init__(self, "on_change_size")
+    __slots__ = ()
+
+    name = "on_change_size"
 
 
 class OnChangeDimensionListener(Listener):
@@ -54,5 +146,6 @@ class OnChangeDimensionListener(Listener):
     listener class that is called when dimension is changed
     """
 
-    def __init__(self):
-        Listener.__init__(self, "on_change_dimension")
+    __slots__ = ()
+
+    name = "on_change_dimension"
@@ -3,6 +3,8 @@ class Padding:
     padding (top, right, bottom, left)
     """
 
+    __slots__ = ("top", "right", "bottom", "left")
+
     def __init__(
         self,
         top: int,
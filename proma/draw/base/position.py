@@ -1,4 +1,7 @@
-from proma.draw.base.listener import OnChangePositionListener
+from proma.draw.base.listener import (
+    OnChangePositionListener,
+    batch_notifications,
+)
 
 
 class Position(OnChangePositionListener):
@@ -6,19 +9,23 @@ class Position(OnChangePositionListener):
     position (x, y)
     """
 
+    __slots__ = ("_x", "_y")
+
     def __init__(
         self,
         x: int,
         y: int,
     ):
-        self._x = 0
-        self._y = 0
+        assert isinstance(x, int)
+        assert isinstance(y, int)
+
+        # set initial position directly, since nobody can listen yet
+        self._x = x
+        self._y = y
 
         OnChangePositionListener.__init__(self)
         OnChangePositionListener.add_listener(self, self)
 
-        self.set_xy(x, y)
-
     @property
     def tuple(self) -> tuple:
         """
@@ -94,8 +101,9 @@ class Position(OnChangePositionListener):
         :param y: y
         :type y: int
         """
-        self.x = x
-        self.y = y
+        with batch_notifications():
+            self.x = x
+            self.y = y
 
     def set(
         self,
@@ -109,8 +117,9 @@ class Position(OnChangePositionListener):
         """
         assert isinstance(pos, Position)
 
-        self.x = pos.x
-        self.y = pos.y
+        with batch_notifications():
+            self.x = pos.x
+            self.y = pos.y
 
     def on_change_position(
         self,
@@ -1,4 +1,7 @@
-from proma.draw.base.listener import OnChangeSizeListener
+from proma.draw.base.listener import (
+    OnChangeSizeListener,
+    batch_notifications,
+)
 
 
 class Size(OnChangeSizeListener):
@@ -6,19 +9,23 @@ class Size(OnChangeSizeListener):
     size (width, height)
     """
 
+    __slots__ = ("_width", "_height")
+
     def __init__(
         self,
         width: int,
         height: int,
     ):
-        self._width = 0
-        self._height = 0
+        assert isinstance(width, int)
+        assert isinstance(height, int)
+
+        # set initial size directly, since nobody can listen yet
+        self._width = width
+        self._height = height
 
         OnChangeSizeListener.__init__(self)
         OnChangeSizeListener.add_listener(self, self)
 
-        self.set_wh(width=width, height=height)
-
     @property
     def tuple(self) -> tuple:
         """
@@ -94,8 +101,9 @@ class Size(OnChangeSizeListener):
         :param height: height
         :type height: int
         """
-        self.width = width
-        self.height = height
+        with batch_notifications():
+            self.width = width
+            self.height = height
 
     def set(
         self,
@@ -109,8 +117,9 @@ class Size(OnChangeSizeListener):
         """
         assert isinstance(size, Size)
 
-        self.width = size.width
-        self.height = size.height
+        with batch_notifications():
+            self.width = size.width
+            self.height = size.height
 
     def on_change_size(
         self,
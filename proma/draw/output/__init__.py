@@ -0,0 +1,4 @@
+from .streamingdrawing import StreamingDrawing, StreamingGroup, count_elements
+
+
+__all__ = ["StreamingDrawing", "StreamingGroup", "count_elements"]
@@ -0,0 +1,393 @@
+import io
+from contextlib import contextmanager
+from typing import Any, Iterator, TextIO
+from xml.sax.saxutils import escape
+
+from svgwrite import Drawing
+from svgwrite.base import BaseElement
+from svgwrite.container import Defs, Group
+from svgwrite.path import Path
+from svgwrite.shapes import Polyline
+from svgwrite.text import TSpan
+from svgwrite.utils import strlist
+
+from proma.utils.instrumentation import instrumentation
+
+
+# escaped characters of attribute values and text (same as ElementTree)
+_ATTRIBUTE_ENTITIES = {
+    '"': "&quot;",
+    "\r": "&#13;",
+    "\n": "&#10;",
+    "\t": "&#09;",
+}
+
+# elements whose get_xml() only sets an attribute before the attributes
+# are serialized (same as in svgwrite)
+_PREPARE_ATTRIBUTES = {
+    BaseElement.get_xml: None,
+    TSpan.get_xml: None,
+    Path.get_xml: lambda e: e.attribs.update(d=strlist(e.commands, " ")),
+    Polyline.get_xml: lambda e: e.attribs.update(
+        points=e.points_to_string(e.points)
+    ),
+}
+
+
+def count_elements(element: BaseElement) -> int:
+    """
+    returns the number of elements of the element's tree
+
+    :param element: element
+    :type element: BaseElement
+    :return: number of elements including the element itself
+    :rtype: int
+    """
+    return 1 + sum(
+        count_elements(child) for child in getattr(element, "elements", ())
+    )
+
+
+def _tostring(element: BaseElement) -> str:
+    """
+    returns the same markup as element.tostring(); elements without
+    children are serialized directly instead of via ElementTree, which
+    is much faster for the many small elements of a chart
+
+    :param element: element
+    :type element: BaseElement
+    :return: markup of the element
+    :rtype: str
+    """
+    get_xml = type(element).get_xml
+    if element.elements or (get_xml not in _PREPARE_ATTRIBUTES):
+        # children or special serialization
+        return element.tostring()
+
+    prepare = _PREPARE_ATTRIBUTES[get_xml]
+    if prepare is not None:
+        prepare(element)
+
+    if element.debug:
+        element.validator.check_all_svg_attribute_values(
+            element.elementname, element.attribs
+        )
+
+    attributes = []
+    for key, value in sorted(element.attribs.items()):
+        if value is None:
+            continue
+
+        value = element.value_to_string(value)
+        if value:
+            # just add not empty attributes
+            attributes.append(
+                f' {key}="{escape(value, _ATTRIBUTE_ENTITIES)}"'
+            )
+
+    start = f"<{element.elementname}{''.join(attributes)}"
+    if get_xml is TSpan.get_xml:
+        text = escape(str(element.text))
+        if text:
+            return f"{start}>{text}</{element.elementname}>"
+
+    return f"{start} />"
+
+
+class StreamingGroup(Group):
+    """
+    group of a streaming drawing; its start tag is written when it is
+    created, its children when they are added and its end tag when the
+    group itself is added to its parent
+    """
+
+    def __init__(
+        self,
+        drawing: "StreamingDrawing",
+        **extra,
+    ):
+        Group.__init__(self, factory=drawing, **extra)
+        self._drawing = drawing
+
+    def add(
+        self,
+        element: BaseElement,
+    ) -> BaseElement:
+        """
+        write the element as child of the group
+
+        :param element: element
+        :type element: BaseElement
+        :return: the added element
+        :rtype: BaseElement
+        """
+        self._drawing._write_child(self, element)
+
+        return element
+
+
+class StreamingDefs(Defs):
+    """
+    defs of a streaming drawing; each added element is written
+    in its own defs element at the current position of the stream
+    """
+
+    def __init__(
+        self,
+        drawing: "StreamingDrawing",
+    ):
+        Defs.__init__(self, factory=drawing)
+        self._drawing = drawing
+
+    def add(
+        self,
+        element: BaseElement,
+    ) -> BaseElement:
+        """
+        write the element wrapped in a defs element
+
+        :param element: element
+        :type element: BaseElement
+        :return: the added element
+        :rtype: BaseElement
+        """
+        self._drawing._write(f"<defs>{_tostring(element)}</defs>")
+        if instrumentation.enabled:
+            instrumentation.count("svg_elements", 1 + count_elements(element))
+
+        return element
+
+
+class StreamingDrawing(Drawing):
+    """
+    drawing that writes the SVG directly to a file object while drawing
+    instead of building the complete element tree in memory
+
+    elements are written when they are added; groups must be created
+    and added in nested order, i.e., a group has to be added to its
+    parent before a sibling group is created, which is how the shapes
+    draw themselves
+    """
+
+    def __init__(
+        self,
+        fileobj: TextIO,
+        size: tuple = ("100%", "100%"),
+        **extra,
+    ):
+        Drawing.__init__(self, size=size, **extra)
+
+        self.fileobj = fileobj
+        self.defs = StreamingDefs(self)
+
+        # groups that are written but not yet closed
+        self._open_groups = []
+
+        # buffers that additionally receive everything that is written
+        self._captures = []
+        self._started = False
+        self._closed = False
+
+    def _write(
+        self,
+        s: str,
+    ):
+        """
+        write string to the file object; the SVG start tag is written
+        before the first content
+
+        :param s: string
+        :type s: str
+        """
+        if self._closed is True:
+            raise ValueError(f"{self} is already closed! Abort.")
+
+        if self._started is False:
+            self._started = True
+            self._write_header()
+
+        self.fileobj.write(s)
+        for capture in self._captures:
+            capture.write(s)
+
+    @contextmanager
+    def capture(self) -> Iterator[io.StringIO]:
+        """
+        context manager that captures the markup written within it,
+        e.g., to write it again via write_raw() in a later drawing
+
+        :yield: buffer with the captured markup
+        :rtype: Iterator[io.StringIO]
+        """
+        buffer = io.StringIO()
+        self._captures.append(buffer)
+        try:
+            yield buffer
+
+        finally:
+            self._captures.remove(buffer)
+
+    def _write_header(self):
+        """
+        write the xml header, the stylesheets and the SVG start tag
+        """
+        self.fileobj.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        for stylesheet in self._stylesheets:
+            self.fileobj.write(
+                '<?xml-stylesheet href="%s" type="text/css" '
+                'title="%s" alternate="%s" media="%s"?>\n' % stylesheet
+            )
+
+        # use the attributes of the regular svg element
+        xml = Drawing.get_xml(self)
+        self.fileobj.write(f"<svg{self._attributes(xml.attrib)}>")
+
+    def _attributes(
+        self,
+        attrib: dict,
+    ) -> str:
+        """
+        returns the attributes as string of an xml start tag
+
+        :param attrib: attributes
+        :type attrib: dict
+        :return: attributes string (with leading space)
+        :rtype: str
+        """
+        return "".join(
+            f' {key}="{escape(value, {chr(34): "&quot;"})}"'
+            for key, value in attrib.items()
+        )
+
+    def _write_child(
+        self,
+        parent: Any,
+        element: BaseElement,
+    ):
+        """
+        write the element as child of the parent, which must be the
+        currently open group or the drawing itself
+
+        :param parent: parent group or drawing
+        :type parent: Any
+        :param element: element that is added to the parent
+        :type element: BaseElement
+        :raises ValueError: raised when the element is not added in order
+        """
+        if isinstance(element, StreamingGroup):
+            # group is complete => it must be the innermost open group
+            if not self._open_groups or self._open_groups[-1] is not element:
+                raise ValueError(
+                    f"{element} is not the innermost open group! Abort."
+                )
+            self._open_groups.pop()
+            closing = "</g>"
+            instrumentation.count("svg_elements")
+
+        else:
+            closing = None
+            if instrumentation.enabled:
+                instrumentation.count("svg_elements", count_elements(element))
+
+        current = self._open_groups[-1] if self._open_groups else self
+        if parent is not current:
+            raise ValueError(
+                f"Cannot add {element} to {parent}, since {current} "
+                "is the innermost open group! Abort."
+            )
+
+        self._write(closing or _tostring(element))
+
+    def write_raw(
+        self,
+        parent: Any,
+        markup: str,
+    ):
+        """
+        write already serialized markup, e.g., as captured by capture(),
+        as child of the parent, which must be the currently open group
+        or the drawing itself
+
+        :param parent: parent group or drawing
+        :type parent: Any
+        :param markup: serialized elements
+        :type markup: str
+        :raises ValueError: raised when the parent is not the innermost
+            open group
+        """
+        current = self._open_groups[-1] if self._open_groups else self
+        if parent is not current:
+            raise ValueError(
+                f"Cannot write to {parent}, since {current} "
+                "is the innermost open group! Abort."
+            )
+
+        self._write(markup)
+        if instrumentation.enabled:
+            # number of start tags
+            instrumentation.count(
+                "svg_elements",
+                markup.count("<") - markup.count("</"),
+            )
+
+    def g(self, **extra) -> StreamingGroup:
+        """
+        create a group and write its start tag
+
+        :return: group
+        :rtype: StreamingGroup
+        """
+        grp = StreamingGroup(self, **extra)
+        xml = grp.get_xml()
+        self._write(f"<g{self._attributes(xml.attrib)}>")
+        self._open_groups.append(grp)
+
+        return grp
+
+    def add(
+        self,
+        element: BaseElement,
+    ) -> BaseElement:
+        """
+        write the element as child of the SVG element
+
+        :param element: element
+        :type element: BaseElement
+        :return: the added element
+        :rtype: BaseElement
+        """
+        if getattr(self, "fileobj", None) is None:
+            # default defs added during initialization => ignore
+            return element
+
+        self._write_child(self, element)
+
+        return element
+
+    def close(self):
+        """
+        write the SVG end tag; all groups must have been added
+        """
+        if self._open_groups:
+            raise ValueError(
+                f"There are still open groups {self._open_groups}! Abort."
+            )
+
+        self._write("</svg>")
+        self._closed = True
+
+    def __enter__(self) -> "StreamingDrawing":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the streaming drawing
+
+        :return: string representation of the streaming drawing
+        :rtype: str
+        """
+        return f"<StreamingDrawing(fileobj={self.fileobj})>"
@@ -4,7 +4,8 @@ from .line import Line
 from .box import Box
 from .bar import Bar
 from .cell import Cell
-from .pathwitharrow import PathWithArrow
+from .cellrun import CellRun
+from .edgerouter import EdgeRouter
 from .marker import Marker
 from .linewithmarker import LineWithMarker
 
@@ -16,7 +17,8 @@ __all__ = [
     "Box",
     "Bar",
     "Cell",
-    "PathWithArrow",
+    "CellRun",
+    "EdgeRouter",
     "Marker",
     "LineWithMarker",
 ]
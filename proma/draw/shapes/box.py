@@ -15,6 +15,8 @@ class Box(Dimension):
     padding is considered
     """
 
+    __slots__ = ("fill", "margin", "padding", "class_")
+
     def __init__(
         self,
         x: int,
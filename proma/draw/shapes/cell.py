@@ -12,6 +12,7 @@ from proma.draw.base.consts import (
     TextDominantBaseline,
 )
 from proma.draw.shapes import Box, Label
+from proma.utils.instrumentation import instrumentation
 
 
 class Cell(Box):
@@ -20,6 +21,8 @@ class Cell(Box):
     and contain a text
     """
 
+    __slots__ = ("label",)
+
     def __init__(
         self,
         x: int,
@@ -36,6 +39,7 @@ class Cell(Box):
         padding: Padding = DEFAULT_PADDING,
         class_: str = "defaultcell",
     ):
+        instrumentation.count("cells")
         Box.__init__(
             self,
             x=x,
@@ -59,6 +63,7 @@ class Cell(Box):
             text_dominant_baseline=text_alignment_baseline,
             class_=class_,
         )
+        self.notify(dimension=self)
 
     def on_change_dimension(
         self,
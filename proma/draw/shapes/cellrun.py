@@ -0,0 +1,291 @@
+from functools import lru_cache
+from typing import Optional, Iterator, Sequence, Tuple
+
+from svgwrite import Drawing
+from svgwrite.container import Group
+
+from proma.draw.base import Dimension
+from proma.draw.shapes import Cell
+
+
+# placeholders for the top and the bottom of the row in merged paths
+_Y1 = "\x00"
+_Y2 = "\x01"
+
+
+@lru_cache(maxsize=256)
+def _merged_paths(
+    classes: Tuple[str, ...],
+    class_suffix: str,
+    overrides: Tuple[Tuple[int, str], ...],
+    x: int,
+    cell_width: int,
+    height: int,
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    returns the css class and the path data of the merged paths of a cell
+    run in drawing order; the path data contains placeholders for the top
+    and the bottom of the row, thus the paths are shared by all rows
+    whose runs have the same classes
+
+    :param classes: css classes per cell
+    :type classes: Tuple[str, ...]
+    :param class_suffix: classes that are added to all cells
+    :type class_suffix: str
+    :param overrides: css classes of materialized cells by their index
+        that differ from the run's classes
+    :type overrides: Tuple[Tuple[int, str], ...]
+    :param x: x position of the run
+    :type x: int
+    :param cell_width: width of a cell
+    :type cell_width: int
+    :param height: height of the cells
+    :type height: int
+    :return: css class and path data per path
+    :rtype: Tuple[Tuple[str, str], ...]
+    """
+    cell_classes = [class_ + class_suffix for class_ in classes]
+    for index, class_ in overrides:
+        cell_classes[index] = class_
+
+    # collect x positions of the cells per css class
+    xs_per_class = {}
+    for index, class_ in enumerate(cell_classes):
+        xs_per_class.setdefault(class_, []).append(x + index * cell_width)
+
+    w, h, y1, y2 = cell_width, height, _Y1, _Y2
+    paths = []
+
+    # backgrounds first, thus borders are not covered by neighbours
+    for class_, xs in xs_per_class.items():
+        paths.append(
+            (
+                f"{class_} background merged",
+                "".join(f"M{x},{y1}h{w}v{h}h{-w}z" for x in xs),
+            )
+        )
+
+    for class_, xs in xs_per_class.items():
+        # borders of all cells (same order as Box)
+        for side, d in (
+            ("top", "".join(f"M{x},{y1}H{x + w}" for x in xs)),
+            ("right", "".join(f"M{x + w},{y1}V{y2}" for x in xs)),
+            ("bottom", "".join(f"M{x},{y2}H{x + w}" for x in xs)),
+            ("left", "".join(f"M{x},{y1}V{y2}" for x in xs)),
+        ):
+            paths.append((f"{class_} {side} merged", d))
+
+    return tuple(paths)
+
+
+class CellRun(Dimension):
+    """
+    run of empty cells of same width in a row that only differ by their
+    css class; instead of storing a cell per column, the cells are
+    materialized on demand, e.g., when accessed via the grid
+    """
+
+    __slots__ = ("cell_width", "classes", "class_suffix", "_cells")
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        cell_width: int,
+        height: int,
+        classes: Sequence[str],
+    ):
+        # css classes per cell => can be shared by multiple runs,
+        # thus must not be modified
+        self.classes = classes
+        self.cell_width = cell_width
+
+        # classes that are added to all cells of the run
+        self.class_suffix = ""
+
+        # cells that have been materialized by their index
+        self._cells = {}
+
+        Dimension.__init__(self, x, y, cell_width * len(classes), height)
+
+    def __len__(self) -> int:
+        """
+        returns the number of cells in the run
+
+        :return: number of cells
+        :rtype: int
+        """
+        return len(self.classes)
+
+    def _create_cell(
+        self,
+        index: int,
+    ) -> Cell:
+        """
+        create the cell at the given index
+
+        :param index: index of the cell in the run
+        :type index: int
+        :return: cell
+        :rtype: Cell
+        """
+        cell = Cell(
+            x=self.x + index * self.cell_width,
+            y=self.y,
+            width=self.cell_width,
+            height=self.height,
+            class_=self.classes[index],
+        )
+
+        # added classes only apply to the cell's box (not to its label),
+        # same as if they would have been added to an existing cell
+        cell.class_ += self.class_suffix
+
+        return cell
+
+    def __getitem__(
+        self,
+        index: int,
+    ) -> Cell:
+        """
+        return the cell at the given index; the cell is materialized
+        and kept, thus changes to it are preserved
+
+        :param index: index of the cell in the run
+        :type index: int
+        :return: cell
+        :rtype: Cell
+        """
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            # invalid index
+            raise ValueError(f"Invalid index {index} in {self}! Abort.")
+
+        cell = self._cells.get(index)
+        if cell is None:
+            cell = self._create_cell(index)
+            self._cells[index] = cell
+
+        return cell
+
+    def __iter__(self) -> Iterator[Cell]:
+        """
+        iterate over all cells of the run; cells that are not
+        materialized are only created temporarily
+
+        :yield: cell
+        :rtype: Iterator[Cell]
+        """
+        for index in range(len(self)):
+            cell = self._cells.get(index)
+            yield cell if cell is not None else self._create_cell(index)
+
+    def add_class(
+        self,
+        class_: str,
+    ):
+        """
+        add css class to all cells of the run
+
+        :param class_: css class (incl. leading space)
+        :type class_: str
+        """
+        self.class_suffix += class_
+        for cell in self._cells.values():
+            cell.class_ += class_
+
+    def on_change_dimension(
+        self,
+        dimension: Dimension,
+    ):
+        """
+        on dimension change move the materialized cells
+
+        :param dimension: new dimension
+        :type dimension: Dimension
+        """
+        for index, cell in self._cells.items():
+            cell.set_xy(dimension.x + index * self.cell_width, dimension.y)
+
+    def draw(
+        self,
+        dwg: Drawing,
+        grp: Optional[Group] = None,
+    ) -> Group:
+        """
+        draw cells of the run and return them as group
+
+        :param dwg: drawing used to draw the items
+        :type dwg: Drawing
+        :param grp: group, defaults to None
+        :type grp: Group, optional
+        :return: group with drawn items
+        :rtype: Group
+        """
+        grp = grp or dwg.g()
+
+        for cell in self:
+            grp.add(cell.draw(dwg, None))
+
+        return grp
+
+    def draw_merged(
+        self,
+        dwg: Drawing,
+        grp: Optional[Group] = None,
+    ) -> Group:
+        """
+        draw cells of the run merged per css class, i.e., instead of a
+        rectangle and four lines per cell, one path for all backgrounds
+        and one path per side is drawn for all cells of the same class
+
+        the paths have the additional css class "merged"
+
+        :param dwg: drawing used to draw the items
+        :type dwg: Drawing
+        :param grp: group, defaults to None
+        :type grp: Group, optional
+        :return: group with drawn items
+        :rtype: Group
+        """
+        grp = grp or dwg.g()
+
+        # materialized cells whose css class has been changed
+        overrides = tuple(
+            (index, cell.class_)
+            for index, cell in sorted(self._cells.items())
+            if cell.class_ != self.classes[index] + self.class_suffix
+        )
+
+        # same classes in all rows => paths only differ by their y
+        y1, y2 = str(self.y), str(self.y + self.height)
+        for class_, d in _merged_paths(
+            tuple(self.classes),
+            self.class_suffix,
+            overrides,
+            self.x,
+            self.cell_width,
+            self.height,
+        ):
+            grp.add(
+                dwg.path(
+                    d=d.replace(_Y1, y1).replace(_Y2, y2),
+                    class_=class_,
+                )
+            )
+
+        return grp
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the cell run
+
+        :return: string representation of the cell run
+        :rtype: str
+        """
+        return (
+            f"<CellRun(x1={self.x1}, y1={self.y1}, "
+            f"x2={self.x2}, y2={self.y2}, cells={len(self)})>"
+        )
@@ -0,0 +1,209 @@
+from collections import defaultdict
+from typing import List, Optional, Tuple
+
+from svgwrite import Drawing
+from svgwrite.container import Group
+
+
+def _merge_intervals(
+    intervals: List[Tuple[float, float]],
+) -> List[Tuple[float, float]]:
+    """
+    returns the union of the intervals as sorted, disjoint intervals,
+    i.e., overlapping and touching intervals are merged
+
+    :param intervals: intervals (start, end) with start <= end
+    :type intervals: List[Tuple[float, float]]
+    :return: merged intervals
+    :rtype: List[Tuple[float, float]]
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and (start <= merged[-1][1]):
+            # overlaps the previous interval => extend it
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+            continue
+
+        merged.append((start, end))
+
+    return merged
+
+
+class EdgeRouter:
+    """
+    routes the dependency arrows orthogonally, i.e., as horizontal and
+    vertical segments, and bundles them: overlapping segments on the
+    same line (e.g., the stub and the vertical channel shared by the
+    arrows from the same task, or the approach shared by the arrows to
+    the same task) are merged, thus each segment is drawn only once
+
+    the segments are indexed by their line, i.e., horizontal segments by
+    their y and vertical segments by their x position (per css class),
+    thus bundling only sorts the segments of each line and routing is
+    O(E log E) for E arrows; all segments of a css class are drawn as
+    one path and all arrow heads of a css class as another path with
+    the additional css class "arrowhead"
+    """
+
+    def __init__(
+        self,
+        offset: int = 5,
+        arrow_size: int = 8,
+    ):
+        self.offset = offset
+        self.arrow_size = arrow_size
+
+        # (css class, vertical, position of the line) => segments
+        self.lines = defaultdict(list)
+
+        # css class => tips of the arrow heads
+        self.tips = defaultdict(set)
+
+        self.count = 0
+
+    def __len__(self) -> int:
+        """
+        returns the number of routed arrows
+
+        :return: number of routed arrows
+        :rtype: int
+        """
+        return self.count
+
+    def add(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        detour_y: float,
+        from_start: bool = False,
+        class_: str = "defaultpathwitharrow",
+    ):
+        """
+        route an arrow from the end (or the start) of a bar at (x1, y1)
+        to the start of a bar at (x2, y2), which the arrow enters from the
+        left; if there is no space for a vertical channel between both
+        positions, the arrow detours horizontally at detour_y, i.e., at
+        the border between the rows
+
+        :param x1: x position of the end (or start) of the first bar
+        :type x1: float
+        :param y1: y position of the first bar's center
+        :type y1: float
+        :param x2: x position of the start of the second bar
+        :type x2: float
+        :param y2: y position of the second bar's center
+        :type y2: float
+        :param detour_y: y position of the horizontal detour
+        :type detour_y: float
+        :param from_start: arrow leaves the first bar at its start to the
+            left, defaults to False
+        :type from_start: bool, optional
+        :param class_: css class, defaults to "defaultpathwitharrow"
+        :type class_: str, optional
+        """
+        # vertical channel next to the first bar
+        if from_start:
+            x0, channel = x1 + 2, x1 - self.offset
+        else:
+            x0, channel = x1 - 2, x1 + self.offset
+
+        if channel <= x2 - self.offset:
+            # enough space => simply go down (or up)
+            points = [(x0, y1), (channel, y1), (channel, y2), (x2, y2)]
+
+        else:
+            # go down (or up) to the detour and back
+            points = [
+                (x0, y1),
+                (channel, y1),
+                (channel, detour_y),
+                (x2 - self.offset, detour_y),
+                (x2 - self.offset, y2),
+                (x2, y2),
+            ]
+
+        for (xa, ya), (xb, yb) in zip(points, points[1:]):
+            if xa == xb:
+                if ya != yb:
+                    self.lines[(class_, True, xa)].append(
+                        (min(ya, yb), max(ya, yb))
+                    )
+            else:
+                self.lines[(class_, False, ya)].append(
+                    (min(xa, xb), max(xa, xb))
+                )
+
+        self.tips[class_].add((x2 + 2, y2))
+        self.count += 1
+
+    def paths(self) -> List[Tuple[str, str]]:
+        """
+        returns the css class and the path data of the bundled segments
+        and of the arrow heads per css class in drawing order
+
+        :return: css class and path data per path
+        :rtype: List[Tuple[str, str]]
+        """
+        segments = defaultdict(list)
+        for (class_, vertical, pos), intervals in self.lines.items():
+            for start, end in _merge_intervals(intervals):
+                segments[class_].append(
+                    f"M{pos},{start}V{end}"
+                    if vertical
+                    else f"M{start},{pos}H{end}"
+                )
+
+        s, h = self.arrow_size, self.arrow_size / 2
+        paths = []
+
+        # e.g., critical arrows are drawn on top of the other arrows
+        for class_ in sorted(set(segments) | set(self.tips)):
+            paths.append((class_, "".join(segments[class_])))
+            paths.append(
+                (
+                    f"{class_} arrowhead",
+                    "".join(
+                        f"M{x - s},{y - h}L{x},{y}L{x - s},{y + h}z"
+                        for x, y in sorted(self.tips[class_])
+                    ),
+                )
+            )
+
+        return paths
+
+    def draw(
+        self,
+        dwg: Drawing,
+        grp: Optional[Group] = None,
+    ) -> Group:
+        """
+        draw the bundled arrows and return them as group
+
+        :param dwg: drawing used to draw the items
+        :type dwg: Drawing
+        :param grp: group, defaults to None
+        :type grp: Group, optional
+        :return: group with drawn items
+        :rtype: Group
+        """
+        grp = grp or dwg.g()
+
+        for class_, d in self.paths():
+            if d:
+                grp.add(dwg.path(d=d, class_=class_))
+
+        return grp
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the edge router
+
+        :return: string representation of the edge router
+        :rtype: str
+        """
+        return (
+            f"<EdgeRouter(arrows={self.count}, lines={len(self.lines)})>"
+        )
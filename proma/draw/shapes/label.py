@@ -18,6 +18,8 @@ class Label(Dimension):
     a text in a box
     """
 
+    __slots__ = ("padding", "margin", "text")
+
     def __init__(
         self,
         x: int,
@@ -12,6 +12,8 @@ class Text(Position):
     simple text
     """
 
+    __slots__ = ("text", "text_anchor", "text_dominant_baseline", "class_")
+
     def __init__(
         self,
         x: int,
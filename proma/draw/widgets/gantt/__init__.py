@@ -1,3 +1,5 @@
 from .gantt import Gantt
+from .segment import GanttSegment
+from .viewport import Viewport
 
-__all__ = ["Gantt"]
+__all__ = ["Gantt", "GanttSegment", "Viewport"]
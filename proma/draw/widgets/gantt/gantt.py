@@ -1,11 +1,23 @@
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, Tuple
+
+from svgwrite import Drawing
+from svgwrite.container import Group
+
 from proma.draw.base import Position, Padding
 from proma.draw.base.consts import (
     DEFAULT_CELL_WIDTH,
     TextAnchor,
     TextDominantBaseline,
 )
+from proma.draw.output import StreamingDrawing
 from proma.draw.widgets.grid import GridWithBars, GridRow
+from proma.draw.widgets.gantt.segment import GanttSegment
+from proma.draw.widgets.gantt.viewport import Viewport
+from proma.models.dependency import DependencyType
 from proma.models.project import Project
+from proma.models.workpackage import Workpackage
 from proma.models.types import DateType
 from proma.utils.timetable import Timetable, YEAR_QUARTER_MONTH_WEEK_DAY_FMT
 
@@ -13,6 +25,27 @@ from proma.utils.timetable import Timetable, YEAR_QUARTER_MONTH_WEEK_DAY_FMT
 class Gantt(GridWithBars):
     """
     gantt chart class
+
+    if a viewport is given, only the dates and rows within it are laid
+    out; bars that are partially outside are clipped at its borders,
+    while milestones, events and dependency arrows outside are culled
+
+    the workpackages are taken from the project, unless an iterable of
+    workpackages is given, e.g., as loaded by Project.stream_from(), which
+    is consumed only once while the chart is prepared
+
+    if critical_path is True, the bars of the tasks on the critical path
+    and the dependency arrows between them are highlighted (see
+    DependencyGraph), which requires the tasks to be scheduled
+
+    the dependency arrows of all tasks are routed and bundled by an edge
+    router (see EdgeRouter), where finish-to-start arrows leave the end
+    and start-to-start arrows leave the start of the task depended on
+
+    an incremental chart keeps its rows per workpackage (see GanttSegment)
+    and, when drawn into a streaming drawing, their drawn markup; a chart
+    of a changed project that is created with it as previous chart only
+    lays out and draws the workpackages that have changed or moved
     """
 
     def __init__(
@@ -23,25 +56,97 @@ class Gantt(GridWithBars):
         default_cell_width: int = DEFAULT_CELL_WIDTH,
         description_width: int = 200,
         formats=YEAR_QUARTER_MONTH_WEEK_DAY_FMT,
+        compact: bool = False,
+        viewport: Optional[Viewport] = None,
+        workpackages: Optional[Iterable[Workpackage]] = None,
+        incremental: bool = False,
+        previous: Optional["Gantt"] = None,
+        critical_path: bool = False,
     ):
-        GridWithBars.__init__(self, x=x, y=y)
+        GridWithBars.__init__(self, x=x, y=y, compact=compact)
 
         self.default_cell_width = default_cell_width
         self.description_width = description_width
         self.project = project
+        self.viewport = viewport or Viewport()
+        self.incremental = incremental
+        self.critical_path = critical_path
 
-        # prepare timetabble
+        # header and workpackages of the chart in order of their rows
+        self.segments = []
+
+        # css classes of the empty cells per column (computed once)
+        self._empty_cell_classes = None
+
+        # prepare timetabble (limited to the viewport)
+        start_date, end_date = self.viewport.clamp_dates(
+            project.start_date,
+            project.end_date,
+        )
         self.timetable = Timetable(
-            start_date=project.start_date,
-            end_date=project.end_date,
+            start_date=start_date,
+            end_date=end_date,
             formats=formats,
         )
 
+        # previous chart whose segments can be reused
+        self._previous = None
+        if (
+            incremental
+            and (previous is not None)
+            and self.is_compatible(previous)
+        ):
+            self._previous = previous
+
+            # same timetable => keep its materialized levels
+            self.timetable = previous.timetable
+            self._empty_cell_classes = previous._empty_cell_classes
+
         # add header based on hierarchy (year, quarter, month etc.)
         self.prepare_top_header()
 
         # add project data
-        self.prepare_project_data()
+        self.prepare_project_data(
+            project.workpackages if workpackages is None else workpackages
+        )
+
+    def is_compatible(
+        self,
+        other: "Gantt",
+    ) -> bool:
+        """
+        returns True, if the other chart is an incremental chart with the
+        same layout, i.e., its segments can be reused by this chart
+
+        :param other: other chart
+        :type other: Gantt
+        :return: True, if the other chart's segments can be reused
+        :rtype: bool
+        """
+        return other.incremental and (
+            (
+                other.tuple,
+                other.default_cell_width,
+                other.description_width,
+                other.compact,
+                other.critical_path,
+                other.viewport,
+                other.timetable.start_date,
+                other.timetable.end_date,
+                other.timetable.formats,
+            )
+            == (
+                self.tuple,
+                self.default_cell_width,
+                self.description_width,
+                self.compact,
+                self.critical_path,
+                self.viewport,
+                self.timetable.start_date,
+                self.timetable.end_date,
+                self.timetable.formats,
+            )
+        )
 
     def _cell_format_class(
         self,
@@ -79,20 +184,66 @@ class Gantt(GridWithBars):
         :param r: row
         :type r: Row
         """
-        for tti in self.timetable.items_per_hierarchy[-1].items:
-            r.add_cell(
-                self.default_cell_width,
-                class_=self._cell_format_class(
-                    dt=tti,
-                ),
+        if self._empty_cell_classes is None:
+            # same classes for all rows => create the items only once
+            self._empty_cell_classes = tuple(
+                self._cell_format_class(dt=tti)
+                for tti in self.timetable.lowest_level.items
             )
 
+        # the cells are only materialized on access
+        r.add_cell_run(
+            classes=self._empty_cell_classes,
+            cell_width=self.default_cell_width,
+        )
+
+    def get_bar_pos(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        returns the column and length of a bar from the from date to the
+        to date clipped at the borders of the viewport
+
+        :param from_date: from date
+        :type from_date: datetime
+        :param to_date: to date
+        :type to_date: datetime
+        :return: tuple with column and length or None, if not visible
+        :rtype: Optional[Tuple[int, int]]
+        """
+        if not self.viewport.overlaps(from_date, to_date):
+            # bar is not within the viewport
+            return None
+
+        if (self.viewport.start_date is not None) and (
+            from_date < to_date <= self.viewport.start_date
+        ):
+            # bar ends at the start of the viewport (to date is exclusive)
+            return None
+
+        # use col_offset by 1 since first column has description
+        col, length = self.timetable.get_from_and_length_pos(
+            *self.viewport.clamp_dates(from_date, to_date),
+            col_offset=1,
+        )
+
+        if (self.viewport.end_date is not None) and (
+            to_date > self.viewport.end_date
+        ):
+            # bar continues after the viewport => up to the last column
+            length = len(self.timetable.lowest_level) - col
+
+        return (col, length)
+
     def prepare_top_header(self):
         """
         prepare the top header
         """
+        header = GanttSegment(workpackage=None)
         for timetable_level in self.timetable.items_per_hierarchy:
-            r = GridRow()
+            r = self.new_row()
 
             # add empty column for descriptions in the following rows
             r.add_cell(
@@ -111,16 +262,40 @@ class Gantt(GridWithBars):
                 )
 
             self.add_row(r)
+            header.rows.append(r)
 
-    def prepare_project_data(self):
+        self.segments.append(header)
+
+    def prepare_workpackage(
+        self,
+        wp: Workpackage,
+        first_row: int,
+    ) -> GanttSegment:
         """
-        prepare project's data, i.e., gantt chart data
+        prepare the rows, bars and milestones of the workpackage
+
+        :param wp: workpackage
+        :type wp: Workpackage
+        :param first_row: index of the workpackage's project row
+        :type first_row: int
+        :return: segment of the workpackage
+        :rtype: GanttSegment
         """
-        cellpos = {}
-        i = 0
-        for wp in self.project.workpackages:
-            # -- workpackage description --
-            r = GridRow()
+        segment = GanttSegment(
+            workpackage=wp,
+            first_row=first_row,
+            grid_row=len(self.rows),
+            row_count=len(wp.tasks) + 1,
+        )
+        bar_count = len(self.bars)
+        milestone_count = len(self.milestones)
+
+        # index of the project's row (incl. the rows outside the viewport)
+        i = first_row
+
+        # -- workpackage description --
+        if self.viewport.contains_row(i):
+            r = self.new_row()
             r.add_cell(
                 cell_width=self.description_width,
                 text=wp.name,
@@ -130,78 +305,230 @@ class Gantt(GridWithBars):
             )
             self.add_empty_cells(r)
             self.add_row(r)
-            i += 1
+        i += 1
 
-            # -- tasks --
-            for t in wp.tasks:
-                r = GridRow()
+        # -- tasks --
+        for t in wp.tasks:
+            if not self.viewport.contains_row(i):
+                # task is culled
+                i += 1
+                continue
 
-                # add task description
-                r.add_cell(
-                    cell_width=self.description_width,
-                    text=t.name,
-                    text_anchor=TextAnchor.START,
-                    text_alignment_baseline=TextDominantBaseline.CENTRAL,
-                    padding=Padding(top=2, right=2, bottom=2, left=10),
-                    class_="defaultcell task",
+            r = self.new_row()
+
+            # add task description
+            r.add_cell(
+                cell_width=self.description_width,
+                text=t.name,
+                text_anchor=TextAnchor.START,
+                text_alignment_baseline=TextDominantBaseline.CENTRAL,
+                padding=Padding(top=2, right=2, bottom=2, left=10),
+                class_="defaultcell task",
+            )
+            self.add_empty_cells(r)
+            self.add_row(r)
+
+            # current row
+            row = len(self.rows) - 1
+
+            if t.start_date is None:
+                raise ValueError(
+                    f"The task '{t.name}' has no start date, since the "
+                    "tasks have not been scheduled! Abort."
                 )
-                self.add_empty_cells(r)
-                self.add_row(r)
 
-                # get start position and length
-                # use col_offset by 1 since first column has description
-                col, length = self.timetable.get_from_and_length_pos(
-                    from_date=t.start_date, to_date=t.end_date, col_offset=1
+            # add milestones
+            # => also, if the bar is outside of the viewport
+            for m in t.milestones:
+                if not self.viewport.contains_date(m.date):
+                    # milestone is culled
+                    continue
+
+                pos = Position(
+                    x=row,
+                    y=self.timetable.get_pos(m.date) + 1,
                 )
+                self.add_milestone(pos, m.name)
 
-                # current row
-                row = len(self.timetable.hierarchy) + i
+            # get start position and length
+            bar_pos = self.get_bar_pos(t.start_date, t.end_date)
+            if bar_pos is None:
+                # bar is outside of the viewport
+                i += 1
+                continue
+            col, length = bar_pos
+
+            # position in grid
+            # => please note that row=x and col=y due to nested
+            #    list access order
+            pos = Position(x=row, y=col)
+
+            # task's positions for dependency arrows
+            start_pos = None
+            if self.viewport.contains_date(t.start_date):
+                start_pos = pos
+
+            # => not for tasks that end in the last column of the chart
+            end_pos = None
+            if self.viewport.contains_date(t.end_date) and (
+                col + length + 1 <= len(self.timetable.lowest_level)
+            ):
+                end_pos = Position(x=row, y=col + length + 1)
+
+            # highlight the tasks without slack
+            critical = self.critical_path and t.is_critical
+
+            # add bar
+            # TODO: add colors per package? to inheritance
+            self.add_bar(
+                position=pos,
+                length=length,
+                fill="lightblue",
+                class_="defaultbar critical" if critical else "defaultbar",
+            )
 
-                # position in grid
-                # => please note that row=x and col=y due to nested
-                #    list access order
-                pos = Position(x=row, y=col)
+            # dependency arrows are only added, if both ends are visible
+            segment.links.append((t.name, start_pos, end_pos, t.depends_on))
 
-                # store task's position for dependency arrows
-                cellpos[t.name] = Position(x=row, y=col + length + 1)
+            i += 1
 
-                # add bar
-                # TODO: add colors per package? to inheritance
-                self.add_bar(
-                    position=pos,
-                    length=length,
-                    fill="lightblue",
-                )
+        segment.rows = self.rows[segment.grid_row :]
+        segment.bars = self.bars[bar_count:]
+        segment.milestones = self.milestones[milestone_count:]
 
-                # add milestones
-                for m in t.milestones:
-                    pos = Position(
-                        x=row,
-                        y=self.timetable.get_pos(m.date) + 1,
-                    )
-                    self.add_milestone(pos, m.name)
+        if self.viewport.contains_row(i - 1):
+            # add additional class for last row
+            self.rows[-1].add_class(" lastrow")
+
+        # add special attributes for first cells and last cell in row
+        for row in segment.rows:
+            row[1].class_ += " firstcol"
+            row[-1].class_ += " lastcol"
+
+        return segment
+
+    def _reuse_segment(
+        self,
+        index: int,
+        wp: Workpackage,
+        first_row: int,
+    ) -> Optional[GanttSegment]:
+        """
+        returns the segment of the previous chart for the workpackage,
+        if the workpackage and its position are unchanged
+
+        :param index: index of the workpackage
+        :type index: int
+        :param wp: workpackage
+        :type wp: Workpackage
+        :param first_row: index of the workpackage's project row
+        :type first_row: int
+        :return: reused segment or None, if it must be prepared
+        :rtype: Optional[GanttSegment]
+        """
+        if self._previous is None:
+            return None
+
+        # first segment of the previous chart is the header
+        segments = self._previous.segments
+        if index + 1 >= len(segments):
+            return None
+
+        segment = segments[index + 1]
+        if (
+            (segment.first_row != first_row)
+            or (segment.grid_row != len(self.rows))
+            or (segment.workpackage != wp)
+        ):
+            # workpackage has changed or moved
+            return None
+
+        # rows are already placed at the same position
+        self.rows.extend(segment.rows)
+        self._height += segment.height
+        self.bars.extend(segment.bars)
+        self.milestones.extend(segment.milestones)
+
+        return segment
+
+    def prepare_project_data(
+        self,
+        workpackages: Iterable[Workpackage],
+    ):
+        """
+        prepare project's data, i.e., gantt chart data
 
-                # add dependency arrows
-                depend_pos = cellpos.get(t.depends_on)
-                if depend_pos:
+        :param workpackages: workpackages of the project
+        :type workpackages: Iterable[Workpackage]
+        """
+        # index of the project's row (incl. the rows outside the viewport)
+        i = 0
+        for index, wp in enumerate(workpackages):
+            segment = self._reuse_segment(index, wp, i)
+            if segment is None:
+                segment = self.prepare_workpackage(wp, i)
+
+            self.segments.append(segment)
+            i += segment.row_count
+
+        # add special attributes for first cells and last cell in row
+        # => for the header only, if there is any workpackage
+        header = self.segments[0]
+        if i > 0:
+            for row in header.rows:
+                row[1].class_ += " firstcol"
+                row[-1].class_ += " lastcol"
+
+        if (self._previous is not None) and (
+            (len(self._previous.segments) > 1) == (i > 0)
+        ):
+            # same header => keep its drawn markup
+            header.fragments = self._previous.segments[0].fragments
+
+        # store tasks' positions for dependency arrows first, thus tasks
+        # can also depend on tasks of the following rows
+        cellpos = {}
+        for segment in self.segments:
+            for name, start_pos, end_pos, _ in segment.links:
+                cellpos[name] = (start_pos, end_pos)
+
+        # add dependency arrows
+        for segment in self.segments:
+            for _, pos, _, depends_on in segment.links:
+                if pos is None:
+                    continue
+
+                for d in depends_on:
+                    from_start = d.type is DependencyType.START_TO_START
+                    depend_pos = cellpos.get(d.task, (None, None))[
+                        0 if from_start else 1
+                    ]
+                    if depend_pos is None:
+                        continue
+
+                    # highlight the dependencies without slack between
+                    # tasks on the critical path
                     self.add_dependency(
                         start_position=depend_pos,
                         end_position=pos,
+                        class_=(
+                            "defaultpathwitharrow critical"
+                            if self.critical_path and d.is_critical
+                            else "defaultpathwitharrow"
+                        ),
+                        from_start=from_start,
                     )
 
-                i += 1
-
-            # add additional class for last row
-            for cell in self.rows[-1].cells:
-                cell.class_ += " lastrow"
-
-            # add special attributes for first cells and last cell in row
-            for row in self.rows:
-                row.cells[1].class_ += " firstcol"
-                row.cells[-1].class_ += " lastcol"
-
         # add vertical lines to the grid
+        # => only across project rows, i.e., not if all rows are culled
+        has_project_rows = len(self.rows) > len(self.timetable.hierarchy)
         for event in self.project.events:
+            if (not has_project_rows) or not self.viewport.contains_date(
+                event.date
+            ):
+                # event is culled
+                continue
+
             pos = Position(
                 y=self.timetable.get_pos(event.date) + 1,
                 x=len(self.timetable.hierarchy),
@@ -211,3 +538,107 @@ class Gantt(GridWithBars):
                 hierarchy_count=len(self.timetable.hierarchy),
                 text=event.name,
             )
+
+        # previous chart is not needed anymore
+        self._previous = None
+
+    @contextmanager
+    def _draw_fragment(
+        self,
+        dwg: Drawing,
+        grp: Group,
+        segment: GanttSegment,
+        layer: str,
+    ) -> Iterator[bool]:
+        """
+        context manager for drawing a layer of the segment, i.e., its
+        "rows", "bars" or "milestones"; for incremental charts that are
+        drawn into a streaming drawing, the markup is captured, thus it
+        is written as it is again by charts reusing the segment
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group of the layer
+        :type grp: Group
+        :param segment: segment
+        :type segment: GanttSegment
+        :param layer: layer
+        :type layer: str
+        :yield: True, if the layer must be drawn
+        :rtype: Iterator[bool]
+        """
+        if (self.incremental is False) or not isinstance(
+            dwg, StreamingDrawing
+        ):
+            yield True
+            return
+
+        fragment = segment.fragments.get(layer)
+        if fragment is not None:
+            # already drawn
+            dwg.write_raw(grp, fragment)
+            yield False
+            return
+
+        with dwg.capture() as buffer:
+            yield True
+        segment.fragments[layer] = buffer.getvalue()
+
+    def draw_rows(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the rows of the gantt chart per segment into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        for segment in self.segments:
+            with self._draw_fragment(dwg, grp, segment, "rows") as draw:
+                if draw is True:
+                    for row in segment.rows:
+                        grp.add(row.draw(dwg, None, compact=self.compact))
+
+    def draw_bars(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the bars per segment into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        for segment in self.segments:
+            with self._draw_fragment(dwg, grp, segment, "bars") as draw:
+                if draw is True:
+                    for bar in segment.bars:
+                        bar.draw(dwg, grp)
+
+    def draw_milestones(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the milestones per segment into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        for segment in self.segments:
+            with self._draw_fragment(
+                dwg, grp, segment, "milestones"
+            ) as draw:
+                if draw is True:
+                    for milestone in segment.milestones:
+                        milestone.draw(dwg, grp)
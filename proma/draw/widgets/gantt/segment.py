@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from proma.models.workpackage import Workpackage
+
+
+@dataclass(eq=False)
+class GanttSegment:
+    """
+    rows of a gantt chart that belong to the header or to a single
+    workpackage together with their bars and milestones
+
+    a segment only depends on its workpackage and its position, thus it
+    can be reused as it is by the chart of a changed project, as long as
+    its workpackage and the rows above are unchanged
+    """
+
+    # workpackage of the segment (None for the header)
+    workpackage: Optional[Workpackage]
+
+    # index of the first project row (incl. the rows outside the viewport)
+    first_row: int = 0
+
+    # index of the first row in the grid
+    grid_row: int = 0
+
+    # number of project rows (incl. the rows outside the viewport)
+    row_count: int = 0
+
+    rows: list = field(default_factory=list)
+    bars: list = field(default_factory=list)
+    milestones: list = field(default_factory=list)
+
+    # (task name, start position, end position, dependencies) per task
+    # for the dependency arrows, which are added for all segments
+    links: list = field(default_factory=list)
+
+    # drawn markup per layer, i.e., "rows", "bars" and "milestones"
+    fragments: dict = field(default_factory=dict)
+
+    @property
+    def height(self) -> int:
+        """
+        height of the segment's rows
+
+        :return: height
+        :rtype: int
+        """
+        return sum(row.height for row in self.rows)
@@ -0,0 +1,204 @@
+import datetime
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+
+class ViewportError(ValueError):
+    """
+    raised when a date range does not overlap the viewport
+    """
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """
+    window of a gantt chart given by a date range and a range of the
+    project's rows (workpackages and tasks, without the header rows)
+
+    everything outside of the window is culled before drawing; a bound
+    of None means that the window is not limited in that direction
+    """
+
+    start_date: Optional[datetime.datetime] = None
+    end_date: Optional[datetime.datetime] = None
+    first_row: int = 0
+    row_count: Optional[int] = None
+
+    def __post_init__(self):
+        if (
+            (self.start_date is not None)
+            and (self.end_date is not None)
+            and (self.start_date > self.end_date)
+        ):
+            # invalid date range
+            raise ValueError(
+                f"The start date '{self.start_date}' is after the end "
+                f"date '{self.end_date}'! Abort."
+            )
+
+        if (self.first_row < 0) or (
+            (self.row_count is not None) and (self.row_count < 1)
+        ):
+            # invalid row range
+            raise ValueError(
+                f"Invalid row range {self.first_row}+{self.row_count}! "
+                "Abort."
+            )
+
+    def clamp_dates(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ) -> Tuple[datetime.datetime, datetime.datetime]:
+        """
+        returns the given date range limited to the viewport
+
+        :param start_date: start date
+        :type start_date: datetime.datetime
+        :param end_date: end date
+        :type end_date: datetime.datetime
+        :raises ViewportError: raised when the range is outside the
+            viewport
+        :return: tuple with limited start and end date
+        :rtype: Tuple[datetime.datetime, datetime.datetime]
+        """
+        limited_start_date, limited_end_date = start_date, end_date
+        if self.start_date is not None:
+            limited_start_date = max(start_date, self.start_date)
+
+        if self.end_date is not None:
+            limited_end_date = min(end_date, self.end_date)
+
+        if limited_start_date > limited_end_date:
+            # no overlap with the viewport
+            window = " to ".join(
+                "..." if dt is None else str(dt.date())
+                for dt in (self.start_date, self.end_date)
+            )
+            raise ViewportError(
+                f"The date range {start_date.date()} to {end_date.date()} "
+                f"is not within the viewport {window}! Abort."
+            )
+
+        return limited_start_date, limited_end_date
+
+    def contains_date(
+        self,
+        dt: datetime.datetime,
+    ) -> bool:
+        """
+        returns True, if the date is within the viewport
+
+        :param dt: date
+        :type dt: datetime.datetime
+        :return: True, if the date is within the viewport
+        :rtype: bool
+        """
+        return self.overlaps(dt, dt)
+
+    def overlaps(
+        self,
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+    ) -> bool:
+        """
+        returns True, if the date range overlaps with the viewport
+
+        :param start_date: start date
+        :type start_date: datetime.datetime
+        :param end_date: end date
+        :type end_date: datetime.datetime
+        :return: True, if the date range overlaps with the viewport
+        :rtype: bool
+        """
+        if (self.start_date is not None) and (end_date < self.start_date):
+            # range ends before the viewport
+            return False
+
+        if (self.end_date is not None) and (start_date > self.end_date):
+            # range starts after the viewport
+            return False
+
+        return True
+
+    def contains_row(
+        self,
+        row: int,
+    ) -> bool:
+        """
+        returns True, if the project's row is within the viewport
+
+        :param row: index of the row (without header rows)
+        :type row: int
+        :return: True, if the row is within the viewport
+        :rtype: bool
+        """
+        if self.row_count is None:
+            return row >= self.first_row
+
+        return self.first_row <= row < self.first_row + self.row_count
+
+    @staticmethod
+    def tiles(
+        start_date: datetime.datetime,
+        end_date: datetime.datetime,
+        row_count: int,
+        tile_days: Optional[int] = None,
+        tile_rows: Optional[int] = None,
+    ) -> Iterator[Tuple[int, int, "Viewport"]]:
+        """
+        split the date range and rows into tiles, i.e., viewports that
+        can be rendered independently; a tile size of None means
+        that the chart is not split in that direction
+
+        :param start_date: start date of the chart
+        :type start_date: datetime.datetime
+        :param end_date: end date of the chart
+        :type end_date: datetime.datetime
+        :param row_count: number of the project's rows
+        :type row_count: int
+        :param tile_days: days per tile, defaults to None
+        :type tile_days: Optional[int], optional
+        :param tile_rows: rows per tile, defaults to None
+        :type tile_rows: Optional[int], optional
+        :yield: tuple of tile's row index, column index and viewport
+        :rtype: Iterator[Tuple[int, int, Viewport]]
+        """
+        if (tile_days is not None and tile_days < 1) or (
+            tile_rows is not None and tile_rows < 1
+        ):
+            # invalid tile size
+            raise ValueError(
+                f"Invalid tile size {tile_days} days x {tile_rows} rows! "
+                "Abort."
+            )
+
+        # split rows (at least one tile, even without rows)
+        if tile_rows is None:
+            row_ranges = [(0, None)]
+        else:
+            row_ranges = [
+                (first_row, tile_rows)
+                for first_row in range(0, max(row_count, 1), tile_rows)
+            ]
+
+        # split date range (end date of a tile is inclusive)
+        if tile_days is None:
+            date_ranges = [(None, None)]
+        else:
+            date_ranges = []
+            dt = start_date
+            while dt <= end_date:
+                date_ranges.append(
+                    (dt, dt + datetime.timedelta(days=tile_days - 1))
+                )
+                dt += datetime.timedelta(days=tile_days)
+
+        for row_index, (first_row, rows) in enumerate(row_ranges):
+            for col_index, (tile_start, tile_end) in enumerate(date_ranges):
+                yield row_index, col_index, Viewport(
+                    start_date=tile_start,
+                    end_date=tile_end,
+                    first_row=first_row,
+                    row_count=rows,
+                )
@@ -3,7 +3,8 @@ from typing import Optional
 from svgwrite import Drawing
 from svgwrite.container import Group
 
-from proma.draw.base import Position
+from proma.draw.base import Position, batch_notifications
+from proma.draw.base.consts import DEFAULT_CELL_HEIGHT
 from proma.draw.shapes import Cell
 from proma.draw.widgets.grid.gridrow import GridRow
 
@@ -11,25 +12,56 @@ from proma.draw.widgets.grid.gridrow import GridRow
 class Grid(Position):
     """
     a fixed grid that is based on cells
+
+    rows are placed incrementally when added, i.e., each row is
+    only positioned once; call layout() to reposition all rows
+    after changing their heights
+
+    in compact mode, runs of empty cells are drawn as merged paths
+    per css class instead of one rectangle and four lines per cell
     """
 
     def __init__(
         self,
         x: int,
         y: int,
+        compact: bool = False,
     ):
+        self.rows = []
+        self.compact = compact
+
+        # accumulated height of all rows, i.e., y offset of the next row
+        self._height = 0
+
         Position.__init__(self, x=x, y=y)
 
-        self.rows = []
+    def set_xy(
+        self,
+        x: int,
+        y: int,
+    ):
+        """
+        set new position and update corresponding rows
+
+        :param x: x
+        :type x: int
+        :param y: y
+        :type y: int
+        """
+        Position.set_xy(self, x=x, y=y)
+        self.layout()
 
-    def _update_positions(self):
+    def layout(self):
         """
-        update the grid's rows
+        update the positions of the grid's rows in a single pass
         """
         height = 0
-        for row in self.rows:
-            row.set_xy(self.x, self.y + height)
-            height += row.height
+        with batch_notifications():
+            for row in self.rows:
+                row.set_xy(self.x, self.y + height)
+                height += row.height
+
+        self._height = height
 
     def _check_row(self, row: int, col: int) -> None:
         """
@@ -54,6 +86,25 @@ class Grid(Position):
                 f"The col '{col}' is not existing in {self.rows[row]}! Abort."
             )
 
+    def new_row(
+        self,
+        row_height: int = DEFAULT_CELL_HEIGHT,
+    ) -> GridRow:
+        """
+        create a new row that is already placed below the last row,
+        thus its cells do not need to be moved when the row is added
+
+        :param row_height: height of the row, defaults to DEFAULT_CELL_HEIGHT
+        :type row_height: int, optional
+        :return: new (not yet added) grid row
+        :rtype: GridRow
+        """
+        return GridRow(
+            x=self.x,
+            y=self.y + self._height,
+            row_height=row_height,
+        )
+
     def add_row(self, row: GridRow):
         """
         add a row to the grid's rows
@@ -61,8 +112,12 @@ class Grid(Position):
         :param row: grid row
         :type row: GridRow
         """
+        if row.tuple != (self.x, self.y + self._height):
+            # place the row directly below the last row
+            row.set_xy(self.x, self.y + self._height)
+
         self.rows.append(row)
-        self._update_positions()
+        self._height += row.height
 
     def set_text(
         self,
@@ -142,7 +197,22 @@ class Grid(Position):
         grp = grp or dwg.g()
 
         # draw cells
-        for row in self.rows:
-            grp.add(row.draw(dwg, None))
+        self.draw_rows(dwg, grp)
 
         return grp
+
+    def draw_rows(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the rows of the grid into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        for row in self.rows:
+            grp.add(row.draw(dwg, None, compact=self.compact))
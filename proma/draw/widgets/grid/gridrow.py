@@ -1,9 +1,10 @@
-from typing import Optional, Iterator
+import bisect
+from typing import Optional, Iterator, Sequence
 
 from svgwrite import Drawing
 from svgwrite.container import Group
 
-from proma.draw.base import Position, Margin, Padding
+from proma.draw.base import Position, Margin, Padding, batch_notifications
 from proma.draw.base.consts import (
     DEFAULT_MARGIN,
     DEFAULT_PADDING,
@@ -12,12 +13,18 @@ from proma.draw.base.consts import (
     TextAnchor,
     TextDominantBaseline,
 )
-from proma.draw.shapes import Cell
+from proma.draw.shapes import Cell, CellRun
 
 
 class GridRow(Position):
     """
     row in a grid
+
+    cells are placed incrementally when added, i.e., in O(1) per cell;
+    call layout() to reposition all cells after changing their widths
+
+    besides single cells, a row can contain runs of empty cells
+    (see CellRun) whose cells are only materialized on access
     """
 
     def __init__(
@@ -27,7 +34,14 @@ class GridRow(Position):
         row_height: int = DEFAULT_CELL_HEIGHT,
     ):
         self.row_height = row_height
+
+        # cells or cell runs of the row and the column of each first cell
         self.cells = []
+        self._first_cols = []
+        self._col_count = 0
+
+        # accumulated width of all cells, i.e., x offset of the next cell
+        self._width = 0
 
         Position.__init__(self, x=x, y=y)
 
@@ -61,34 +75,49 @@ class GridRow(Position):
         :return: number of columns
         :rtype: int
         """
-        return len(self.cells)
+        return self._col_count
 
     def __getitem__(
         self,
         col: int,
     ) -> Cell:
         """
-        return cell by given column
+        return cell by given column; negative columns are
+        counted from the end of the row
 
         :param col: column
         :type col: int
         :return: cell in row
         :rtype: Cell
         """
-        if col >= len(self.cells):
+        if col < 0:
+            col += self._col_count
+
+        if not 0 <= col < self._col_count:
             # invalid column
             raise ValueError(f"Invalid column {col} in {self}! Abort.")
 
-        return self.cells[col]
+        # find cell or cell run that contains the column
+        i = bisect.bisect_right(self._first_cols, col) - 1
+        cell = self.cells[i]
+        if isinstance(cell, CellRun):
+            return cell[col - self._first_cols[i]]
 
-    def __next__(self) -> Iterator[Cell]:
+        return cell
+
+    def __iter__(self) -> Iterator[Cell]:
         """
-        return next cell
+        iterate over all cells of the row incl. the cells of cell runs
 
         :yield: cell
         :rtype: Iterator[Cell]
         """
-        yield from self.cells
+        for cell in self.cells:
+            if isinstance(cell, CellRun):
+                yield from cell
+
+            else:
+                yield cell
 
     def set_xy(
         self,
@@ -104,16 +133,19 @@ class GridRow(Position):
         :type y: int
         """
         Position.set_xy(self, x=x, y=y)
-        self._update_positions()
+        self.layout()
 
-    def _update_positions(self):
+    def layout(self):
         """
-        update the positions of the children cells
+        update the positions of the children cells in a single pass
         """
         width = 0
-        for cell in self.cells:
-            cell.set_xy(self.x + width, self.y)
-            width += cell.width
+        with batch_notifications():
+            for cell in self.cells:
+                cell.set_xy(self.x + width, self.y)
+                width += cell.width
+
+        self._width = width
 
     def add_cell(
         self,
@@ -148,9 +180,10 @@ class GridRow(Position):
         :return: created cell
         :rtype: Cell
         """
+        # place the cell directly behind the last cell
         cell = Cell(
-            x=0,
-            y=0,
+            x=self.x + self._width,
+            y=self.y,
             width=cell_width,
             height=self.row_height,
             text=text,
@@ -160,12 +193,71 @@ class GridRow(Position):
             padding=padding,
             class_=class_,
         )
+        self._append(cell, 1)
+
+        return cell
+
+    def add_cell_run(
+        self,
+        classes: Sequence[str],
+        cell_width: int = DEFAULT_CELL_WIDTH,
+    ) -> CellRun:
+        """
+        add a run of empty cells to the row, i.e., one cell per given
+        css class; the cells are only materialized on access
+
+        :param classes: css class per cell (may be shared between rows)
+        :type classes: Sequence[str]
+        :param cell_width: width of the cells, defaults to DEFAULT_CELL_WIDTH
+        :type cell_width: int, optional
+        :return: created cell run
+        :rtype: CellRun
+        """
+        cell_run = CellRun(
+            x=self.x + self._width,
+            y=self.y,
+            cell_width=cell_width,
+            height=self.row_height,
+            classes=classes,
+        )
+        self._append(cell_run, len(cell_run))
+
+        return cell_run
+
+    def _append(
+        self,
+        cell: Cell,
+        col_count: int,
+    ):
+        """
+        append a cell or cell run
+
+        :param cell: cell or cell run
+        :type cell: Cell
+        :param col_count: number of columns of the cell
+        :type col_count: int
+        """
         self.cells.append(cell)
+        self._first_cols.append(self._col_count)
+        self._col_count += col_count
+        self._width += cell.width
 
-        # update cell positions
-        self._update_positions()
+    def add_class(
+        self,
+        class_: str,
+    ):
+        """
+        add css class to all cells of the row
 
-        return cell
+        :param class_: css class (incl. leading space)
+        :type class_: str
+        """
+        for cell in self.cells:
+            if isinstance(cell, CellRun):
+                cell.add_class(class_)
+
+            else:
+                cell.class_ += class_
 
     def add_cols(
         self,
@@ -193,6 +285,7 @@ class GridRow(Position):
         self,
         dwg: Drawing,
         grp: Optional[Group] = None,
+        compact: bool = False,
     ) -> Group:
         """
         draw row and return it as group
@@ -201,6 +294,9 @@ class GridRow(Position):
         :type dwg: Drawing
         :param grp: group, defaults to None
         :type grp: Group, optional
+        :param compact: draw cell runs merged per css class,
+                        defaults to False
+        :type compact: bool, optional
         :return: group
         :rtype: Group
         """
@@ -209,12 +305,19 @@ class GridRow(Position):
 
         # draw cells
         for cell in self.cells:
-            grp.add(cell.draw(dwg, None))
+            if not isinstance(cell, CellRun):
+                grp.add(cell.draw(dwg, None))
+
+            elif compact is True:
+                cell.draw_merged(dwg, grp)
+
+            else:
+                cell.draw(dwg, grp)
 
         return grp
 
     def __repr__(self):
         return (
             f"<GridRow(x={self.x}, y={self.y}, "
-            f"row_height={self.row_height}, cells={len(self.cells)})>"
+            f"row_height={self.row_height}, cells={len(self)})>"
         )
@@ -4,7 +4,7 @@ from svgwrite import Drawing
 from svgwrite.container import Group
 
 from proma.draw.base import Position, Margin
-from proma.draw.shapes import Bar, PathWithArrow, Marker, LineWithMarker
+from proma.draw.shapes import Bar, EdgeRouter, Marker, LineWithMarker
 from proma.draw.widgets.grid import Grid
 
 
@@ -17,11 +17,12 @@ class GridWithBars(Grid):
         self,
         x: int,
         y: int,
+        compact: bool = False,
     ):
-        Grid.__init__(self, x=x, y=y)
+        Grid.__init__(self, x=x, y=y, compact=compact)
 
         self.bars = []
-        self.dependencies = []
+        self.dependencies = EdgeRouter()
         self.milestones = []
         self.events = []
 
@@ -30,6 +31,7 @@ class GridWithBars(Grid):
         position: Position,
         length: int,
         fill: str = "black",
+        class_: str = "defaultbar",
     ):
         """
         add a bar to the grid
@@ -40,6 +42,8 @@ class GridWithBars(Grid):
         :type length: int
         :param fill: fill color, defaults to "black"
         :type fill: str, optional
+        :param class_: css class, defaults to "defaultbar"
+        :type class_: str, optional
         """
         start_cell = self.get_cell(*position.tuple)
         end_cell = self.get_cell(position.x, position.y + length)
@@ -51,6 +55,7 @@ class GridWithBars(Grid):
             height=start_cell.height,
             fill=fill,
             margin=Margin(3, 2, 3, 2),
+            class_=class_,
         )
         self.bars.append(bar)
 
@@ -58,23 +63,40 @@ class GridWithBars(Grid):
         self,
         start_position: Position,
         end_position: Position,
+        class_: str = "defaultpathwitharrow",
+        from_start: bool = False,
     ):
         """
         add dependency arrow between start position and end position
-        within the grid
+        within the grid; the arrows are routed and bundled by the edge
+        router of the grid
 
         :param start_position: start position
         :type start_position: Position
         :param end_position: end position
         :type end_position: Position
+        :param class_: css class, defaults to "defaultpathwitharrow"
+        :type class_: str, optional
+        :param from_start: arrow leaves the bar at the start position to
+            the left (e.g., for start-to-start dependencies), defaults to
+            False
+        :type from_start: bool, optional
         """
         start_cell = self.get_cell(*start_position.tuple)
         end_cell = self.get_cell(*end_position.tuple)
 
-        path = PathWithArrow(
-            start_cell.pos.x, start_cell.cy, end_cell.pos.x, end_cell.cy
+        self.dependencies.add(
+            start_cell.pos.x,
+            start_cell.cy,
+            end_cell.pos.x,
+            end_cell.cy,
+            # detour at the border of the start cell's row
+            detour_y=(
+                start_cell.y2 if end_cell.cy > start_cell.cy else start_cell.y1
+            ),
+            from_start=from_start,
+            class_=class_,
         )
-        self.dependencies.append(path)
 
     def add_milestone(
         self,
@@ -151,26 +173,85 @@ class GridWithBars(Grid):
 
         # draw vertical lines
         events_group = dwg.g()
-        for event in self.events:
-            event.draw(dwg, events_group)
+        self.draw_events(dwg, events_group)
         grp.add(events_group)
 
         # draw bars
         bars_grp = dwg.g()
-        for bar in self.bars:
-            bar.draw(dwg, bars_grp)
+        self.draw_bars(dwg, bars_grp)
         grp.add(bars_grp)
 
         # draw milestones
         milestones_grp = dwg.g()
-        for milestone in self.milestones:
-            milestone.draw(dwg, milestones_grp)
+        self.draw_milestones(dwg, milestones_grp)
         grp.add(milestones_grp)
 
         # draw dependency arrows
         dependencies_grp = dwg.g()
-        for dep in self.dependencies:
-            dep.draw(dwg, dependencies_grp)
+        self.draw_dependencies(dwg, dependencies_grp)
         grp.add(dependencies_grp)
 
         return grp
+
+    def draw_events(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the vertical lines of the events into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        for event in self.events:
+            event.draw(dwg, grp)
+
+    def draw_bars(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the bars into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        for bar in self.bars:
+            bar.draw(dwg, grp)
+
+    def draw_milestones(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the milestones into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        for milestone in self.milestones:
+            milestone.draw(dwg, grp)
+
+    def draw_dependencies(
+        self,
+        dwg: Drawing,
+        grp: Group,
+    ):
+        """
+        draw the dependency arrows into the group
+
+        :param dwg: drawing
+        :type dwg: Drawing
+        :param grp: group
+        :type grp: Group
+        """
+        self.dependencies.draw(dwg, grp)
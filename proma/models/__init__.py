@@ -1,20 +1,41 @@
-from .milestone import Milestone
-from .task import Task
-from .workpackage import Workpackage
-from .event import Event
-from .project import Project
-from .timetableitem import TimetableItem
-from .timetablelevel import TimetableLevel
-from .schema import proma_schema
-
-
-__all__ = [
-    "Milestone",
-    "Task",
-    "Workpackage",
-    "Event",
-    "Project",
-    "TimetableItem",
-    "TimetableLevel",
-    "proma_schema",
-]
+import importlib
+
+
+# submodule per exported name; the submodules are only imported on first
+# access (PEP 562), thus e.g. yaml and dateutil are not loaded by modules
+# that only need the light models
+_exports = {
+    "Milestone": ".milestone",
+    "Task": ".task",
+    "Dependency": ".dependency",
+    "DependencyType": ".dependency",
+    "Workpackage": ".workpackage",
+    "Event": ".event",
+    "Project": ".project",
+    "DependencyGraph": ".dependencygraph",
+    "TaskSchedule": ".dependencygraph",
+    "TimetableItem": ".timetableitem",
+    "TimetableLevel": ".timetablelevel",
+    "proma_schema": ".schema",
+    "Validator": ".validator",
+    "ValidationError": ".validator",
+    "load_snapshot": ".snapshot",
+    "save_snapshot": ".snapshot",
+}
+
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_exports[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,124 @@
+import datetime
+from dataclasses import dataclass
+from enum import Enum
+from typing import Union
+
+from proma.utils.durationparser import WorkingDays, parse_duration
+
+
+class DependencyType(Enum):
+    """
+    dependency type
+    """
+
+    # task starts after the other task has finished
+    FINISH_TO_START = "FS"
+
+    # task starts after the other task has started
+    START_TO_START = "SS"
+
+
+@dataclass
+class Dependency:
+    """
+    dependency of a task on another task with an optional lag, i.e.,
+    a delay between the finish (or start) of the other task and the
+    start of the task
+    """
+
+    task: str
+    type: DependencyType = DependencyType.FINISH_TO_START
+    lag: datetime.timedelta = datetime.timedelta(0)
+
+    # no slack between both tasks on the critical path (set by the
+    # DependencyGraph)
+    is_critical: bool = False
+
+    @staticmethod
+    def from_value(value: Union[str, dict]) -> "Dependency":
+        """
+        create dependency from a task name or a dict with the keys
+        "task", "type" (FS or SS) and "lag" (duration)
+
+        :raises ValueError: raised when value is not a valid dependency
+        """
+        if isinstance(value, Dependency):
+            # already created
+            return value
+
+        if isinstance(value, str):
+            return Dependency(task=value)
+
+        if not isinstance(value, dict):
+            raise ValueError(f"'{value}' is not a valid dependency.")
+
+        unknown = set(value) - {"task", "type", "lag"}
+        if unknown:
+            raise ValueError(
+                f"unknown keys {sorted(unknown)} in dependency '{value}'."
+            )
+
+        task = value.get("task")
+        if not isinstance(task, str):
+            raise ValueError(f"dependency '{value}' has no task name.")
+
+        try:
+            type_ = DependencyType(str(value.get("type", "FS")).upper())
+        except ValueError:
+            raise ValueError(
+                f"'{value['type']}' is not a valid dependency type "
+                f"({', '.join(t.value for t in DependencyType)})."
+            )
+
+        lag = value.get("lag", datetime.timedelta(0))
+        if not isinstance(lag, datetime.timedelta):
+            lag = parse_duration(str(lag))
+
+        return Dependency(task=task, type=type_, lag=lag)
+
+    def __post_init__(self):
+        if self.lag < datetime.timedelta(0):
+            raise ValueError(
+                f"lag of the dependency on '{self.task}' is negative."
+            )
+
+    def earliest_start(
+        self,
+        start: datetime.datetime,
+        finish: datetime.datetime,
+    ) -> datetime.datetime:
+        """
+        returns the earliest start of the dependent task
+
+        :param start: start of the task depended on
+        :type start: datetime.datetime
+        :param finish: finish of the task depended on
+        :type finish: datetime.datetime
+        :return: earliest start of the dependent task
+        :rtype: datetime.datetime
+        """
+        dt = start if self.type is DependencyType.START_TO_START else finish
+        if isinstance(self.lag, WorkingDays):
+            # skip weekends
+            return self.lag.add_to(dt)
+
+        return dt + self.lag
+
+    def latest_reference(
+        self,
+        start: datetime.datetime,
+    ) -> datetime.datetime:
+        """
+        returns the latest start (for SS) or finish (for FS) of the task
+        depended on, i.e., the inverse of earliest_start()
+
+        :param start: latest start of the dependent task
+        :type start: datetime.datetime
+        :return: latest start or finish of the task depended on
+        :rtype: datetime.datetime
+        """
+        if isinstance(self.lag, WorkingDays):
+            # skip weekends
+            return self.lag.subtract_from(start)
+
+        return start - self.lag
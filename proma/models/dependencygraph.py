@@ -0,0 +1,326 @@
+import datetime
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from proma.utils.durationparser import WorkingDays
+
+from .dependency import Dependency, DependencyType
+from .task import Task
+from .workpackage import Workpackage
+
+
+def finish_of(
+    start: datetime.datetime,
+    duration: datetime.timedelta,
+) -> datetime.datetime:
+    """
+    returns the finish of a task with the given start and duration
+    """
+    if isinstance(duration, WorkingDays):
+        # skip weekends
+        return duration.add_to(start)
+
+    return start + duration
+
+
+def start_of(
+    finish: datetime.datetime,
+    duration: datetime.timedelta,
+) -> datetime.datetime:
+    """
+    returns the start of a task with the given finish and duration
+    """
+    if isinstance(duration, WorkingDays):
+        # skip weekends
+        return duration.subtract_from(finish)
+
+    return finish - duration
+
+
+@dataclass
+class TaskSchedule:
+    """
+    earliest and latest start and finish of a task
+    """
+
+    task: Task
+    earliest_start: datetime.datetime
+    earliest_finish: datetime.datetime
+    latest_start: datetime.datetime
+    latest_finish: datetime.datetime
+
+    @property
+    def slack(self) -> datetime.timedelta:
+        """
+        time the task can be delayed without delaying the project
+        """
+        return self.latest_start - self.earliest_start
+
+    @property
+    def is_critical(self) -> bool:
+        """
+        True, if the task cannot be delayed without delaying the project
+        """
+        return self.slack <= datetime.timedelta(0)
+
+
+class DependencyGraph:
+    """
+    graph of the dependencies between the tasks of all workpackages
+
+    the graph is built once, i.e., tasks are indexed by name, the
+    dependencies (finish-to-start or start-to-start, each with a lag)
+    are resolved regardless of the order of the tasks and sorted
+    topologically, while cycles and unknown dependencies are rejected;
+    afterwards, the schedule (earliest/latest start, slack and critical
+    path) is computed with a forward and a backward pass in O(V+E)
+    """
+
+    def __init__(
+        self,
+        workpackages: Iterable[Workpackage],
+    ):
+        self.tasks = [t for wp in workpackages for t in wp.tasks]
+
+        # index of each task by name (None, if the name is not unique)
+        self.index = {}
+        for i, t in enumerate(self.tasks):
+            self.index[t.name] = None if t.name in self.index else i
+
+        # (index, dependency) of the predecessors and successors of each
+        # task
+        self.predecessors = [[] for _ in self.tasks]
+        self.successors = [[] for _ in self.tasks]
+        for i, t in enumerate(self.tasks):
+            for d in t.depends_on:
+                j = self._lookup(t, d.task)
+                self.predecessors[i].append((j, d))
+                self.successors[j].append((i, d))
+
+        # indices of the tasks, where each task follows its predecessors
+        self.order = self._topological_order()
+
+        # schedule per task (see schedule())
+        self.schedules: List[TaskSchedule] = []
+
+    def _lookup(
+        self,
+        task: Task,
+        name: str,
+    ) -> int:
+        """
+        returns the index of the task the given task depends on
+
+        :raises ValueError: raised when the name is unknown or not unique
+        """
+        if name not in self.index:
+            raise ValueError(
+                f"Task '{task.name}' depends on the unknown task '{name}'! "
+                "Abort."
+            )
+
+        j = self.index[name]
+        if j is None:
+            raise ValueError(
+                f"Task '{task.name}' depends on '{name}', which is not a "
+                "unique task name! Abort."
+            )
+
+        return j
+
+    def _topological_order(self) -> List[int]:
+        """
+        returns the indices of the tasks in topological order (Kahn)
+
+        :raises ValueError: raised when the dependencies contain a cycle
+        """
+        indegree = [len(p) for p in self.predecessors]
+        queue = deque(i for i, d in enumerate(indegree) if d == 0)
+
+        order = []
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for j, _ in self.successors[i]:
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    queue.append(j)
+
+        if len(order) < len(self.tasks):
+            cycle = self._find_cycle(indegree)
+            raise ValueError(
+                "Cyclic dependencies between the tasks "
+                f"{' -> '.join(repr(self.tasks[i].name) for i in cycle)}! "
+                "Abort."
+            )
+
+        return order
+
+    def _find_cycle(
+        self,
+        indegree: List[int],
+    ) -> List[int]:
+        """
+        returns the indices of the tasks of a cycle, i.e., of the tasks
+        that remained after the topological sort
+        """
+        # each remaining task has a remaining predecessor => walk back
+        i = next(i for i, d in enumerate(indegree) if d > 0)
+        seen = {}
+        path = []
+        while i not in seen:
+            seen[i] = len(path)
+            path.append(i)
+            i = next(j for j, _ in self.predecessors[i] if indegree[j] > 0)
+
+        # in order of the dependencies, i.e., back to the first task
+        cycle = path[seen[i] :][::-1]
+
+        return cycle + cycle[:1]
+
+    def schedule(
+        self,
+        start_date: datetime.datetime,
+    ) -> List[TaskSchedule]:
+        """
+        compute the schedule of all tasks; tasks with a start date start
+        at it, while tasks without start date are scheduled as soon as
+        all their dependencies allow it, i.e., after the finish (FS) or
+        start (SS) of their predecessors plus the lag (or at the start
+        date of the project), and get their earliest start as start date
+
+        the latest finish of the tasks without successors is the
+        earliest finish of the whole project, thus tasks on the critical
+        path have no slack; dependencies between tasks on the critical
+        path without slack in between are marked as critical as well
+
+        :param start_date: start date of the project
+        :type start_date: datetime.datetime
+        :return: schedule per task in order of the tasks
+        :rtype: List[TaskSchedule]
+        """
+        count = len(self.tasks)
+        earliest_start = [None] * count
+        earliest_finish = [None] * count
+
+        # forward pass
+        for i in self.order:
+            t = self.tasks[i]
+            start = t.start_date
+            if start is None:
+                # start as soon as all dependencies allow it
+                start = max(
+                    (
+                        d.earliest_start(earliest_start[j], earliest_finish[j])
+                        for j, d in self.predecessors[i]
+                    ),
+                    default=start_date,
+                )
+
+            # working days start at the next working day
+            earliest_finish[i] = finish_of(start, t.duration)
+            earliest_start[i] = start_of(earliest_finish[i], t.duration)
+
+            if t.start_date is None:
+                t.start_date = earliest_start[i]
+
+            t.dependencies = [self.tasks[j] for j, _ in self.predecessors[i]]
+
+        # backward pass
+        finish = max(earliest_finish, default=start_date)
+        latest_start = [None] * count
+        latest_finish = [None] * count
+        for i in reversed(self.order):
+            t = self.tasks[i]
+
+            # never after the finish of the project, e.g., for tasks that
+            # only have start-to-start successors
+            latest_finish[i] = min(
+                [finish]
+                + [
+                    self._latest_finish(t, d, latest_start[j])
+                    for j, d in self.successors[i]
+                ]
+            )
+            latest_start[i] = start_of(latest_finish[i], t.duration)
+
+        self.schedules = [
+            TaskSchedule(
+                task=t,
+                earliest_start=earliest_start[i],
+                earliest_finish=earliest_finish[i],
+                latest_start=latest_start[i],
+                latest_finish=latest_finish[i],
+            )
+            for i, t in enumerate(self.tasks)
+        ]
+
+        for s in self.schedules:
+            s.task.is_critical = s.is_critical
+
+        # dependencies that determine the start of a critical task
+        for i, t in enumerate(self.tasks):
+            for j, d in self.predecessors[i]:
+                d.is_critical = (
+                    t.is_critical
+                    and self.tasks[j].is_critical
+                    and d.earliest_start(earliest_start[j], earliest_finish[j])
+                    == earliest_start[i]
+                )
+
+        return self.schedules
+
+    @staticmethod
+    def _latest_finish(
+        task: Task,
+        dependency: Dependency,
+        start: datetime.datetime,
+    ) -> datetime.datetime:
+        """
+        returns the latest finish of the task depended on, thus the
+        dependent task can start at the given latest start
+        """
+        latest = dependency.latest_reference(start)
+        if dependency.type is DependencyType.START_TO_START:
+            # latest start => latest finish
+            return finish_of(latest, task.duration)
+
+        return latest
+
+    @property
+    def critical_path(self) -> List[Task]:
+        """
+        tasks without slack in topological order (see schedule())
+        """
+        return [
+            self.tasks[i] for i in self.order if self.schedules[i].is_critical
+        ]
+
+    def schedule_of(
+        self,
+        task: Task,
+    ) -> Optional[TaskSchedule]:
+        """
+        returns the schedule of the task (see schedule())
+        """
+        i = self.index.get(task.name)
+        if (i is None) or (self.tasks[i] is not task):
+            # name is not unique => search the task
+            i = next(
+                (i for i, t in enumerate(self.tasks) if t is task),
+                None,
+            )
+
+        if (i is None) or not self.schedules:
+            return None
+
+        return self.schedules[i]
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the dependency graph
+        """
+        edges = sum(len(s) for s in self.successors)
+
+        return f"<DependencyGraph(tasks={len(self.tasks)}, edges={edges})>"
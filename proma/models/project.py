@@ -1,13 +1,33 @@
+import io
+import os
+import copy
+import glob
 import datetime
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, TextIO, Tuple
 
 import yaml
-import cerberus
-from dateutil.parser import parse as dateutil_parse
-from pytimeparse import parse as pytimeparse_parse
 
-from .schema import proma_schema
-from . import Workpackage, Task, Milestone, Event
+from proma.utils.instrumentation import instrumentation
+
+from .schema import create_schema
+from .validator import ValidationError, Validator
+from .snapshot import load_snapshot, save_snapshot
+from .workpackagefile import workpackage_files
+from .dependencygraph import DependencyGraph
+from .workpackage import Workpackage
+from .event import Event
+
+try:
+    # use libyaml based loader, if available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# maximum number of threads that load included workpackage files
+INCLUDE_WORKERS = 8
 
 
 @dataclass
@@ -22,15 +42,68 @@ class Project:
     end_time: datetime.datetime
     workpackages: list = field(default_factory=list)
 
+    # workpackage files included by the project file
+    included_files: list = field(default_factory=list, compare=False)
+    included_versions: list = field(default_factory=list, compare=False)
+
+    # dependencies and schedule of the tasks (see schedule_tasks())
+    dependency_graph: Optional[DependencyGraph] = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+
     @staticmethod
-    def create_from(filename):
+    def create_from(
+        filename,
+        snapshot: bool = False,
+        strict_dates: bool = False,
+    ):
         """
         load a project from file and return it
+
+        if snapshot is True, the project is loaded from the snapshot
+        next to the file, if the file has not changed, otherwise the
+        loaded project is saved as new snapshot
         """
-        project = Project(None, None, None, None)
-        project.load(filename)
+        with instrumentation.stage("load"):
+            if snapshot is True:
+                project = load_snapshot(filename, strict_dates=strict_dates)
+                if isinstance(project, Project) and (
+                    project.included_versions
+                    == file_versions(project.included_files)
+                ):
+                    return project
+
+            project = Project(None, None, None, None)
+            project.load(filename, strict_dates=strict_dates)
 
-        return project
+            if snapshot is True:
+                # snapshot is only valid for the same included files
+                project.included_versions = file_versions(
+                    project.included_files
+                )
+                save_snapshot(filename, project, strict_dates=strict_dates)
+
+            return project
+
+    @staticmethod
+    def create_from_string(
+        text: str,
+        strict_dates: bool = False,
+    ):
+        """
+        load a project from the content of a project file and return it;
+        since there is no file, workpackage files cannot be included
+        """
+        with instrumentation.stage("load"):
+            project = Project(None, None, None, None)
+            project.workpackages = list(
+                project._iter_load(io.StringIO(text), None, strict_dates)
+            )
+            project.schedule_tasks()
+
+            return project
 
     @property
     def duration(self):
@@ -52,62 +125,282 @@ class Project:
         """
         self.workpackages.append(wp)
 
-    def load(self, filename: str):
+    @staticmethod
+    def stream_from(
+        filename,
+        strict_dates: bool = False,
+    ) -> Tuple["Project", Iterator[Workpackage]]:
+        """
+        load the project's header from file and return the project
+        together with an iterator that loads its workpackages lazily;
+        the workpackages are not added to the project and their tasks
+        are not scheduled, i.e., all tasks need a start date
+        """
+        with instrumentation.stage("load"):
+            project = Project(None, None, None, None)
+            workpackages = project.iter_load(
+                filename,
+                strict_dates=strict_dates,
+            )
+
+        # loading of the workpackages is measured while iterating
+        return project, instrumentation.iterate("load", workpackages)
+
+    def load(self, filename: str, strict_dates: bool = False):
         """
         read yaml project file
+
+        dates are parsed as ISO 8601 or in one of the explicit formats,
+        other dates are guessed, unless strict_dates is True
         """
-        with open(filename, "r") as f:
-            project = yaml.safe_load(f)
+        self.workpackages = list(
+            self.iter_load(filename, strict_dates=strict_dates)
+        )
+        self.schedule_tasks()
+
+    def schedule_tasks(self):
+        """
+        build the dependency graph of the loaded tasks and compute their
+        schedule, i.e., tasks without start date are scheduled after
+        their dependencies and the tasks on the critical path are marked
+        """
+        with instrumentation.stage("schedule"):
+            self.dependency_graph = DependencyGraph(self.workpackages)
+            self.dependency_graph.schedule(self.start_date)
+
+    def iter_load(
+        self,
+        filename: str,
+        strict_dates: bool = False,
+    ) -> Iterator[Workpackage]:
+        """
+        read the header of the yaml project file, i.e., its first
+        document, and return an iterator over the workpackages
+
+        the workpackages of the first document are followed by the
+        workpackages of the included workpackage files and the
+        workpackages of the following documents (one workpackage per
+        document), which are parsed and validated only when the
+        iterator reaches them, thus huge files are never completely
+        in memory
+
+        included workpackage files are loaded in parallel threads and
+        cached per file, thus only changed files are parsed again
+
+        dates are parsed as ISO 8601 or in one of the explicit formats,
+        other dates are guessed, unless strict_dates is True
+        """
+        return self._iter_load(open(filename, "r"), filename, strict_dates)
+
+    def _iter_load(
+        self,
+        f: TextIO,
+        filename: Optional[str],
+        strict_dates: bool,
+    ) -> Iterator[Workpackage]:
+        """
+        read the header of the opened project file and return an iterator
+        over the workpackages (see iter_load), which closes the file;
+        without filename, workpackage files cannot be included
+        """
+        schema = create_schema(strict_dates)
+
+        try:
+            documents = yaml.load_all(f, Loader=SafeLoader)
+
+            # validate and parse dates and durations in one pass
+            with instrumentation.stage("parse"):
+                header = next(documents, None)
+
+            v = Validator(schema)
+            with instrumentation.stage("validate"):
+                valid = v.validate(header)
+
+            if valid is False:
+                raise ValidationError(v.errors)
+
+            project = v.document
 
-            v = cerberus.Validator(proma_schema)
-            if v.validate(project) is False:
-                raise Exception(v.errors)
+        except BaseException:
+            f.close()
+            raise
 
         # set internal variables based on doc
         self.name = project["name"]
         self.responsible = project["responsible"]
-        self.start_date = dateutil_parse(
-            project["start_date"],
-            dayfirst=True,
-        )
-        self.end_date = dateutil_parse(project["end_date"])
+        self.start_date = project["start_date"]
+        self.end_date = project["end_date"]
 
         self.events = []
         for ev in project.get("events", []):
             event = Event(
                 name=ev["name"],
-                date=dateutil_parse(ev["date"]),
+                date=ev["date"],
             )
             self.events.append(event)
 
-        self.workpackages = []
-        for wp in project.get("workpackages", []):
-            # add workpackage
-            workpackage = Workpackage(
-                name=wp["name"],
-                responsible=wp.get("responsible", "unknown"),
+        if (filename is None) and project.get("include"):
+            f.close()
+            raise ValueError(
+                "Workpackage files can only be included by project files! "
+                "Abort."
             )
-            self.workpackages.append(workpackage)
-
-            # add tasks to workpackage
-            for t in wp.get("tasks", []):
-                task = Task(
-                    name=t["name"],
-                    responsible=t.get("responsible", "tbd"),
-                    start_date=dateutil_parse(t["start_date"]),
-                    duration=datetime.timedelta(
-                        seconds=pytimeparse_parse(t["duration"])
-                    ),
-                    depends_on=t.get("depends_on", None),
-                    is_done=t.get("is_done", False),
-                )
-                workpackage.add_task(task)
-
-                # add milestones to workpackage
-                for ms in t.get("milestones", []):
-                    milestone = Milestone(
-                        ms["name"],
-                        ms.get("responsible", "tbd"),
-                        dateutil_parse(ms["date"]),
+
+        # included workpackage files (relative to the project file)
+        self.included_files = (
+            resolve_includes(filename, project.get("include", []))
+            if filename is not None
+            else []
+        )
+
+        return self._iter_workpackages(
+            f,
+            documents,
+            project.get("workpackages", []),
+            schema["workpackages"]["schema"]["schema"],
+            strict_dates,
+        )
+
+    def _iter_workpackages(
+        self,
+        f: TextIO,
+        documents: Iterator[dict],
+        workpackages: list,
+        schema: dict,
+        strict_dates: bool,
+    ) -> Iterator[Workpackage]:
+        """
+        yield the already validated workpackages of the header, the
+        workpackages of the included files and then the validated
+        workpackages of the following documents
+        """
+        try:
+            for wp in workpackages:
+                yield Workpackage.from_dict(wp)
+
+            if self.included_files:
+                yield from self._iter_included_workpackages(strict_dates)
+
+            documents = instrumentation.iterate("parse", documents)
+            for i, doc in enumerate(documents, start=len(workpackages)):
+                # validate each workpackage on its own
+                v = Validator(schema)
+                with instrumentation.stage("validate"):
+                    valid = v.validate(doc)
+
+                if valid is False:
+                    raise ValidationError(
+                        {
+                            f"workpackages.{i}.{key}": value
+                            for key, value in v.errors.items()
+                        }
                     )
-                    task.add_milestone(milestone)
+
+                yield Workpackage.from_dict(v.document)
+
+        finally:
+            f.close()
+
+    def _iter_included_workpackages(
+        self,
+        strict_dates: bool,
+    ) -> Iterator[Workpackage]:
+        """
+        yield the workpackages of the included files in order, while
+        the files are loaded in parallel threads
+
+        the cached workpackages are shared, thus copies are yielded,
+        which can be modified, e.g., when the tasks are scheduled
+        """
+        workers = min(INCLUDE_WORKERS, len(self.included_files))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(workpackage_files.load, fn, strict_dates)
+                for fn in self.included_files
+            ]
+            for future in futures:
+                yield from copy.deepcopy(future.result())
+
+        finally:
+            # do not load the remaining files, if aborted
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def input_files(filename: str) -> List[str]:
+        """
+        returns the project file and the included workpackage files,
+        i.e., all files the project is loaded from
+        """
+        with open(filename, "rb") as f:
+            if b"include" not in f.read():
+                # fast path => no need to parse the file
+                return [filename]
+
+        with open(filename, "r") as f:
+            header = next(yaml.load_all(f, Loader=SafeLoader), None)
+
+        includes = header.get("include") if isinstance(header, dict) else None
+        if not isinstance(includes, list):
+            return [filename]
+
+        return [filename, *resolve_includes(filename, includes)]
+
+
+def file_versions(filenames: List[str]) -> List[Tuple[int, int]]:
+    """
+    returns modification time and size of the files (None, if missing)
+
+    :param filenames: filenames
+    :type filenames: List[str]
+    :return: modification time and size per file
+    :rtype: List[Tuple[int, int]]
+    """
+    versions = []
+    for filename in filenames:
+        try:
+            stat = os.stat(filename)
+            versions.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            versions.append(None)
+
+    return versions
+
+
+def resolve_includes(
+    filename: str,
+    includes: List[str],
+) -> List[str]:
+    """
+    returns the included files, where the includes are filenames or glob
+    patterns relative to the directory of the project file
+
+    :param filename: filename of the project
+    :type filename: str
+    :param includes: included filenames or glob patterns
+    :type includes: List[str]
+    :raises ValueError: raised when an include does not match any file
+    :return: included files in order without duplicates
+    :rtype: List[str]
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+
+    files = []
+    for include in includes:
+        pattern = os.path.join(directory, os.path.expanduser(include))
+        if any(c in include for c in "*?["):
+            matches = sorted(glob.glob(pattern))
+        elif os.path.isfile(pattern):
+            matches = [pattern]
+        else:
+            matches = []
+
+        if not matches:
+            raise ValueError(
+                f"The include '{include}' of '{filename}' is not existing! "
+                "Abort."
+            )
+
+        files.extend(m for m in matches if m not in files)
+
+    return files
@@ -1,92 +1,120 @@
-from dateutil.parser import parse as dateutil_parse
-from pytimeparse import parse as pytimeparse_parse
+import datetime
+from functools import lru_cache
+from typing import List
 
+from proma.utils.dateparser import DateParser
+from proma.utils.durationparser import parse_duration
 
-def is_duration(
-    field,
-    value,
-    error,
-):
+from .dependency import Dependency
+
+
+def to_duration(value) -> datetime.timedelta:
+    """
+    coerce duration string to timedelta
+
+    :raises ValueError: raised when value is not a valid duration
+    """
+    if isinstance(value, datetime.timedelta):
+        # already coerced
+        return value
+
+    if not isinstance(value, str):
+        raise ValueError(f"'{value}' is not a valid duration.")
+
+    return parse_duration(value)
+
+
+def to_dependencies(value) -> List[Dependency]:
     """
-    check if valid duration
+    coerce a task name, a dependency dict or a list of them to a list of
+    dependencies
+
+    :raises ValueError: raised when value is not a valid dependency
     """
-    try:
-        if pytimeparse_parse(value) is None:
-            raise TypeError()
+    if not isinstance(value, list):
+        value = [value]
 
-    except TypeError:
-        error(field, f"'{value}' is not a valid duration.")
+    return [Dependency.from_value(v) for v in value]
 
 
-def is_date(
-    field,
-    value,
-    error,
-):
+# cerberus schema to validate and normalize project yaml file, i.e.,
+# dates and durations are coerced to datetime and timedelta
+# => see proma.models.validator for the supported rules
+@lru_cache(maxsize=None)
+def create_schema(strict_dates: bool = False) -> dict:
     """
-    check if valid date
+    returns the schema to validate and normalize project yaml files
+
+    :param strict_dates: only accept ISO 8601 and explicit date formats,
+        defaults to False
+    :type strict_dates: bool, optional
+    :return: cerberus schema
+    :rtype: dict
     """
-    try:
-        dateutil_parse(value)
-
-    except Exception:
-        error(field, f"'{value}' is not a valid date.")
-
-
-# cerberus schema to validate project yaml file
-proma_schema = {
-    "name": {"type": "string", "required": True},
-    "responsible": {"type": "string", "required": True},
-    "start_date": {"type": "string", "required": True, "check_with": is_date},
-    "end_date": {"type": "string", "required": True, "check_with": is_date},
-    "events": {
-        "type": "list",
-        "schema": {
-            "type": "dict",
+    to_date = DateParser(strict=strict_dates)
+
+    return {
+        "name": {"type": "string", "required": True},
+        "responsible": {"type": "string", "required": True},
+        "start_date": {
+            "type": "datetime",
+            "required": True,
+            "coerce": to_date,
+        },
+        "end_date": {"type": "datetime", "required": True, "coerce": to_date},
+        "include": {
+            "type": "list",
+            "schema": {"type": "string"},
+        },
+        "events": {
+            "type": "list",
             "schema": {
-                "name": {"type": "string", "required": True},
-                "date": {
-                    "type": "string",
-                    "check_with": is_date,
+                "type": "dict",
+                "schema": {
+                    "name": {"type": "string", "required": True},
+                    "date": {
+                        "type": "datetime",
+                        "coerce": to_date,
+                    },
                 },
             },
         },
-    },
-    "workpackages": {
-        "type": "list",
-        "schema": {
-            "type": "dict",
+        "workpackages": {
+            "type": "list",
             "schema": {
-                "name": {"type": "string", "required": True},
-                "responsible": {"type": "string", "required": True},
-                "tasks": {
-                    "type": "list",
-                    "required": True,
-                    "schema": {
-                        "type": "dict",
+                "type": "dict",
+                "schema": {
+                    "name": {"type": "string", "required": True},
+                    "responsible": {"type": "string", "required": True},
+                    "tasks": {
+                        "type": "list",
+                        "required": True,
                         "schema": {
-                            "name": {"type": "string"},
-                            "start_date": {
-                                "type": "string",
-                                "check_with": is_date,
-                            },
-                            "duration": {
-                                "type": "string",
-                                "check_with": is_duration,
-                            },
-                            "depends_on": {
-                                "type": "string",
-                            },
-                            "milestones": {
-                                "type": "list",
-                                "schema": {
-                                    "type": "dict",
+                            "type": "dict",
+                            "schema": {
+                                "name": {"type": "string"},
+                                "start_date": {
+                                    "type": "datetime",
+                                    "coerce": to_date,
+                                },
+                                "duration": {
+                                    "coerce": to_duration,
+                                },
+                                "depends_on": {
+                                    "type": "list",
+                                    "coerce": to_dependencies,
+                                },
+                                "milestones": {
+                                    "type": "list",
                                     "schema": {
-                                        "name": {"type": "string"},
-                                        "responsible": {"type": "string"},
-                                        "date": {
-                                            "type": "string",
-                                            "check_with": is_date,
+                                        "type": "dict",
+                                        "schema": {
+                                            "name": {"type": "string"},
+                                            "responsible": {"type": "string"},
+                                            "date": {
+                                                "type": "datetime",
+                                                "coerce": to_date,
+                                            },
                                         },
                                     },
                                 },
@@ -96,5 +124,8 @@ proma_schema = {
                 },
             },
         },
-    },
-}
+    }
+
+
+# default schema
+proma_schema = create_schema()
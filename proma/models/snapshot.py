@@ -0,0 +1,131 @@
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+# prepare logger
+log = logging.getLogger(__file__)
+
+# version of the snapshot format => increase when the models change
+SNAPSHOT_VERSION = 4
+
+
+def snapshot_filename(filename: str) -> Path:
+    """
+    returns the filename of the snapshot next to the project file,
+    e.g., ".example.yml.snapshot" for "example.yml"
+
+    :param filename: filename of the project
+    :type filename: str
+    :return: filename of the snapshot
+    :rtype: Path
+    """
+    path = Path(filename)
+
+    return path.with_name(f".{path.name}.snapshot")
+
+
+def _file_digest(filename: str) -> str:
+    """
+    returns the hash of the file's content
+
+    :param filename: filename
+    :type filename: str
+    :return: hex digest of the file's content
+    :rtype: str
+    """
+    return hashlib.sha256(Path(filename).read_bytes()).hexdigest()
+
+
+def load_snapshot(
+    filename: str,
+    **options,
+) -> Optional[Any]:
+    """
+    returns the object of the snapshot of the project file, if the
+    snapshot is still valid; the snapshot is valid when the project file
+    has the same modification time and size or, otherwise, the same hash
+    and it has been saved with the same loading options
+
+    please note that snapshots are pickles, thus only snapshots that have
+    been written by save_snapshot() must be used
+
+    :param filename: filename of the project
+    :type filename: str
+    :param options: options used to load the project file
+    :type options: dict
+    :return: snapshot's object or None, if there is no valid snapshot
+    :rtype: Optional[Any]
+    """
+    try:
+        stat = os.stat(filename)
+        with open(snapshot_filename(filename), "rb") as f:
+            # header first => project is only unpickled, if valid
+            header = pickle.load(f)
+            if (header.get("version") != SNAPSHOT_VERSION) or (
+                header.get("options") != options
+            ):
+                log.debug(f"snapshot of '{filename}' has other options")
+                return None
+
+            if (header["mtime_ns"], header["size"]) != (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ) and (header["sha256"] != _file_digest(filename)):
+                log.debug(f"snapshot of '{filename}' is outdated")
+                return None
+
+            return pickle.load(f)
+
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError) as e:
+        log.debug(f"no valid snapshot of '{filename}': {e}")
+        return None
+
+
+def save_snapshot(
+    filename: str,
+    obj: Any,
+    **options,
+):
+    """
+    save the object as snapshot of the project file; if the snapshot
+    cannot be written, e.g., due to a read-only directory, only a warning
+    is logged
+
+    :param filename: filename of the project
+    :type filename: str
+    :param obj: object, i.e., the project loaded from the file
+    :type obj: Any
+    :param options: options used to load the project file
+    :type options: dict
+    """
+    stat = os.stat(filename)
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "options": options,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": _file_digest(filename),
+    }
+
+    # write atomically, thus concurrent readers never see partial files
+    path = snapshot_filename(filename)
+    try:
+        fd, tmp_filename = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError as e:
+        log.warning(f"cannot write snapshot of '{filename}': {e}")
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filename, path)
+
+    except BaseException:
+        os.unlink(tmp_filename)
+        raise
@@ -1,7 +1,10 @@
 import datetime
 from dataclasses import dataclass, field
+from typing import List, Optional
 
+from .dependency import Dependency
 from .milestone import Milestone
+from proma.utils.durationparser import WorkingDays
 
 
 @dataclass
@@ -12,15 +15,29 @@ class Task:
 
     name: str
     responsible: str
-    start_date: datetime.datetime
+    # None => scheduled after its dependencies (see DependencyGraph)
+    start_date: Optional[datetime.datetime]
     duration: datetime.timedelta
-    depends_on: str
+    depends_on: List[Dependency]
     is_done: bool
-    dependencies: list = field(default_factory=list)
+
+    # tasks this task depends on (resolved by the DependencyGraph)
+    dependencies: list = field(
+        default_factory=list,
+        compare=False,
+        repr=False,
+    )
     milestones: list = field(default_factory=list)
 
+    # no slack, i.e., on the critical path (set by the DependencyGraph)
+    is_critical: bool = False
+
     @property
     def end_date(self):
+        if isinstance(self.duration, WorkingDays):
+            # skip weekends
+            return self.duration.add_to(self.start_date)
+
         return self.start_date + self.duration
 
     def add_dependency(self, dependency: "Task"):
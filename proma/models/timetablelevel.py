@@ -1,5 +1,7 @@
-import itertools
-from dataclasses import dataclass
+import datetime
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional
 
 from .types import DateType
 from .timetableitem import TimetableItem
@@ -9,10 +11,131 @@ from .timetableitem import TimetableItem
 class TimetableLevel:
     """
     level in timetable hierarchy
+
+    the items are stored column-wise as ordinal day numbers;
+    timetable items are only created on demand, e.g., for labels
+
+    the levels are date-granular (see DateType), i.e., the time of day
+    is dropped
     """
 
     dt_type: DateType
-    items: list[TimetableItem]
+    ordinals: array
+    format: Optional[str] = None
+    _keys: Optional[array] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if not isinstance(self.dt_type, DateType):
+            # e.g., a plain string instead of the date type
+            raise ValueError(
+                f"The level '{self.dt_type}' is not a DateType! Abort."
+            )
+
+    def __len__(self) -> int:
+        """
+        returns the number of items in the level
+
+        :return: number of items
+        :rtype: int
+        """
+        return len(self.ordinals)
+
+    def __getitem__(
+        self,
+        index: int,
+    ) -> TimetableItem:
+        """
+        returns the timetable item at the given index
+
+        :param index: index of the item
+        :type index: int
+        :return: timetable item
+        :rtype: TimetableItem
+        """
+        return TimetableItem(
+            dt_type=self.dt_type,
+            dt=datetime.datetime.fromordinal(self.ordinals[index]),
+            format=self.format,
+        )
+
+    @property
+    def items(self) -> list[TimetableItem]:
+        """
+        returns all timetable items of the level
+
+        :return: list of timetable items
+        :rtype: list[TimetableItem]
+        """
+        return [self[i] for i in range(len(self))]
+
+    @property
+    def keys(self) -> array:
+        """
+        returns the calendar keys of all items, i.e., items in the
+        same year, quarter, month, week or day share the same key
+
+        :return: calendar keys
+        :rtype: array
+        """
+        if self._keys is None:
+            if self.dt_type == DateType.DAY:
+                # ordinal day number is already the key of the day
+                self._keys = self.ordinals
+
+            else:
+                self._keys = array(
+                    "l",
+                    map(
+                        self.dt_type.key,
+                        map(datetime.date.fromordinal, self.ordinals),
+                    ),
+                )
+
+        return self._keys
+
+    def is_weekend(
+        self,
+        index: int,
+    ) -> bool:
+        """
+        returns True, if the item at the given index is on weekend
+
+        :param index: index of the item
+        :type index: int
+        :return: True, if the item is a day on weekend
+        :rtype: bool
+        """
+        # ordinal 1 (0001-01-01) is a Monday
+        return (self.ordinals[index] - 1) % 7 in (5, 6)
+
+    @property
+    def spans(self) -> list[tuple[int, int]]:
+        """
+        returns the runs of items that share the same calendar key
+        as tuples of start index and count
+
+        :return: list of (start, count)-tuples
+        :rtype: list[tuple[int, int]]
+        """
+        if len(self) == 0:
+            return []
+
+        if self.format is None:
+            # without format all items share the same (empty) label
+            return [(0, len(self))]
+
+        spans = []
+        keys = self.keys
+        start = 0
+        for i in range(1, len(keys)):
+            if keys[i] != keys[i - 1]:
+                spans.append((start, i - start))
+                start = i
+        spans.append((start, len(keys) - start))
+
+        return spans
 
     @property
     def grouped_items(self) -> list[TimetableItem, int]:
@@ -24,21 +147,4 @@ class TimetableLevel:
         :return: list of grouped items
         :rtype: list[TimetableItem, int]
         """
-        grouped_items = []
-        for _, items in itertools.groupby(
-            self.items,
-            key=lambda item: str(item),
-        ):
-            # convert iterator to list, otherwise length cannot be obtained
-            li = list(items)
-
-            # create tuple of first item as representative
-            # and the length of the list
-            grouped_items.append(
-                (
-                    li[0],
-                    len(li),
-                )
-            )
-
-        return grouped_items
+        return [(self[start], count) for start, count in self.spans]
@@ -1,3 +1,4 @@
+import datetime
 from enum import Enum
 
 
@@ -11,3 +12,56 @@ class DateType(Enum):
     MONTH = "month"
     WEEK = "week"
     DAY = "day"
+
+    def key(self, dt: datetime.date) -> int:
+        """
+        returns an integer key that identifies the calendar period
+        (year, quarter, month, ISO week or day) of the given date
+        on this level; dates within the same period share the key,
+        i.e., the time of day is dropped
+
+        :param dt: date or datetime
+        :type dt: datetime.date
+        :return: calendar key of the period containing the date
+        :rtype: int
+        """
+        if self is DateType.YEAR:
+            return dt.year
+
+        if self is DateType.QUARTER:
+            return dt.year * 4 + (dt.month - 1) // 3
+
+        if self is DateType.MONTH:
+            return dt.year * 12 + dt.month - 1
+
+        if self is DateType.WEEK:
+            # ISO year and week, since week labels are ISO weeks (%V)
+            iso_year, iso_week, _ = dt.isocalendar()
+            return iso_year * 53 + iso_week
+
+        return dt.toordinal()
+
+    def start(self, dt: datetime.datetime) -> datetime.datetime:
+        """
+        returns the start of the calendar period (year, quarter, month,
+        ISO week or day) of the given date on this level
+
+        :param dt: date or datetime
+        :type dt: datetime.datetime
+        :return: first day of the period containing the date
+        :rtype: datetime.datetime
+        """
+        if self is DateType.YEAR:
+            return dt.replace(month=1, day=1)
+
+        if self is DateType.QUARTER:
+            return dt.replace(month=(dt.month - 1) // 3 * 3 + 1, day=1)
+
+        if self is DateType.MONTH:
+            return dt.replace(day=1)
+
+        if self is DateType.WEEK:
+            # ISO weeks start on Monday
+            return dt - datetime.timedelta(days=dt.weekday())
+
+        return dt
@@ -0,0 +1,193 @@
+import datetime
+from typing import Any, Callable
+
+
+class ValidationError(ValueError):
+    """
+    raised when a document is invalid; the errors are given per field
+    (see Validator.errors)
+    """
+
+    def __init__(
+        self,
+        errors: dict,
+    ):
+        ValueError.__init__(self, errors)
+        self.errors = errors
+
+
+class Validator:
+    """
+    validator that validates and normalizes a document in a single pass
+
+    supports the subset of the cerberus rules used by the proma schema,
+    i.e., "type", "required", "coerce", "check_with" and "schema" (of
+    lists and dicts), with the same semantics as cerberus: values are
+    coerced before their type is checked and unknown fields are errors
+
+    errors are collected per field, where the field is given as path,
+    e.g., "workpackages.0.tasks.1.duration"
+    """
+
+    # supported types of the "type" rule
+    TYPES = {
+        "string": str,
+        "list": list,
+        "dict": dict,
+        "datetime": datetime.datetime,
+    }
+
+    def __init__(
+        self,
+        schema: dict,
+    ):
+        self.schema = schema
+        self.errors = {}
+        self.document = None
+
+    def _error(
+        self,
+        field: str,
+        message: str,
+    ):
+        """
+        add error message for the given field
+
+        :param field: field path
+        :type field: str
+        :param message: error message
+        :type message: str
+        """
+        self.errors.setdefault(field, []).append(message)
+
+    def _check_with(
+        self,
+        field: str,
+    ) -> Callable[[str, str], None]:
+        """
+        returns the error callback for check_with rules, which
+        reports errors for the field
+
+        :param field: field path
+        :type field: str
+        :return: error callback
+        :rtype: Callable[[str, str], None]
+        """
+
+        def error(_, message: str):
+            self._error(field, message)
+
+        return error
+
+    def _validate_dict(
+        self,
+        path: str,
+        schema: dict,
+        document: dict,
+    ) -> dict:
+        """
+        validate and normalize the fields of the dict
+
+        :param path: path of the dict (incl. trailing dot)
+        :type path: str
+        :param schema: schema of the fields
+        :type schema: dict
+        :param document: dict
+        :type document: dict
+        :return: normalized dict
+        :rtype: dict
+        """
+        normalized = {}
+        for key, value in document.items():
+            rules = schema.get(key)
+            if rules is None:
+                self._error(f"{path}{key}", "unknown field")
+                continue
+
+            normalized[key] = self._validate_value(
+                f"{path}{key}",
+                rules,
+                value,
+            )
+
+        for key, rules in schema.items():
+            if rules.get("required", False) and (key not in document):
+                self._error(f"{path}{key}", "required field")
+
+        return normalized
+
+    def _validate_value(
+        self,
+        field: str,
+        rules: dict,
+        value: Any,
+    ) -> Any:
+        """
+        validate and normalize the value of the field
+
+        :param field: field path
+        :type field: str
+        :param rules: rules of the field
+        :type rules: dict
+        :param value: value
+        :type value: Any
+        :return: normalized value
+        :rtype: Any
+        """
+        coerce = rules.get("coerce")
+        if coerce is not None:
+            try:
+                value = coerce(value)
+
+            except (TypeError, ValueError) as e:
+                self._error(field, str(e))
+                return value
+
+        type_ = rules.get("type")
+        if (type_ is not None) and not isinstance(value, self.TYPES[type_]):
+            self._error(field, f"must be of {type_} type")
+            return value
+
+        check_with = rules.get("check_with")
+        if check_with is not None:
+            check_with(field, value, self._check_with(field))
+
+        schema = rules.get("schema")
+        if schema is None:
+            return value
+
+        if isinstance(value, list):
+            # schema applies to each item
+            return [
+                self._validate_value(f"{field}.{i}", schema, item)
+                for i, item in enumerate(value)
+            ]
+
+        if isinstance(value, dict):
+            # schema of the dict's fields
+            return self._validate_dict(f"{field}.", schema, value)
+
+        return value
+
+    def validate(
+        self,
+        document: dict,
+    ) -> bool:
+        """
+        validate and normalize the document; the normalized document
+        is available as document and the errors as errors afterwards
+
+        :param document: document
+        :type document: dict
+        :return: True, if the document is valid
+        :rtype: bool
+        """
+        self.errors = {}
+        if not isinstance(document, dict):
+            self._error("document", "must be of dict type")
+            self.document = None
+            return False
+
+        self.document = self._validate_dict("", self.schema, document)
+
+        return not self.errors
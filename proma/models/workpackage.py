@@ -1,5 +1,8 @@
 from dataclasses import dataclass, field
 
+from .task import Task
+from .milestone import Milestone
+
 
 @dataclass
 class Workpackage:
@@ -12,6 +15,39 @@ class Workpackage:
     tasks: list = field(default_factory=list)
     milestones: list = field(default_factory=list)
 
+    @staticmethod
+    def from_dict(wp: dict) -> "Workpackage":
+        """
+        create workpackage incl. tasks and milestones from validated doc
+        """
+        workpackage = Workpackage(
+            name=wp["name"],
+            responsible=wp.get("responsible", "unknown"),
+        )
+
+        # add tasks to workpackage
+        for t in wp.get("tasks", []):
+            task = Task(
+                name=t["name"],
+                responsible=t.get("responsible", "tbd"),
+                start_date=t.get("start_date", None),
+                duration=t["duration"],
+                depends_on=t.get("depends_on", []),
+                is_done=t.get("is_done", False),
+            )
+            workpackage.add_task(task)
+
+            # add milestones to workpackage
+            for ms in t.get("milestones", []):
+                milestone = Milestone(
+                    ms["name"],
+                    ms.get("responsible", "tbd"),
+                    ms["date"],
+                )
+                task.add_milestone(milestone)
+
+        return workpackage
+
     def add_task(self, task):
         """
         add a task to the workpackage
@@ -0,0 +1,142 @@
+import os
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import yaml
+
+from .schema import create_schema
+from .validator import ValidationError, Validator
+from .workpackage import Workpackage
+
+try:
+    # use libyaml based loader, if available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# prepare logger
+log = logging.getLogger(__file__)
+
+
+def load_workpackage_file(
+    filename: str,
+    strict_dates: bool = False,
+) -> List[Workpackage]:
+    """
+    load the workpackages of a workpackage file, which contains one
+    workpackage per yaml document
+
+    :param filename: filename of the workpackage file
+    :type filename: str
+    :param strict_dates: only accept ISO 8601 and explicit date formats,
+        defaults to False
+    :type strict_dates: bool, optional
+    :raises Exception: raised when a workpackage is invalid
+    :return: workpackages
+    :rtype: List[Workpackage]
+    """
+    schema = create_schema(strict_dates)["workpackages"]["schema"]["schema"]
+
+    workpackages = []
+    with open(filename, "r") as f:
+        for i, doc in enumerate(yaml.load_all(f, Loader=SafeLoader)):
+            v = Validator(schema)
+            if v.validate(doc) is False:
+                raise ValidationError(
+                    {
+                        f"{filename}.{i}.{key}": value
+                        for key, value in v.errors.items()
+                    }
+                )
+
+            workpackages.append(Workpackage.from_dict(v.document))
+
+    return workpackages
+
+
+@dataclass
+class WorkpackageFileCacheInfo:
+    """
+    statistics of the workpackage file cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+class WorkpackageFileCache:
+    """
+    thread-safe cache of loaded workpackage files; an entry is reused
+    as long as the file has the same modification time and size,
+    thus only changed files are parsed again
+
+    please note that the cached workpackages are shared, i.e., they
+    must not be modified
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, bool], tuple] = {}
+        self._lock = threading.Lock()
+        self._cache_info = WorkpackageFileCacheInfo()
+
+    @property
+    def cache_info(self) -> WorkpackageFileCacheInfo:
+        """
+        returns the statistics of the cache
+
+        :return: statistics of the cache
+        :rtype: WorkpackageFileCacheInfo
+        """
+        return self._cache_info
+
+    def load(
+        self,
+        filename: str,
+        strict_dates: bool = False,
+    ) -> List[Workpackage]:
+        """
+        returns the workpackages of the file, which is only loaded,
+        if it is not cached or changed
+
+        :param filename: filename of the workpackage file
+        :type filename: str
+        :param strict_dates: only accept ISO 8601 and explicit date
+            formats, defaults to False
+        :type strict_dates: bool, optional
+        :return: workpackages
+        :rtype: List[Workpackage]
+        """
+        key = (os.path.abspath(filename), strict_dates)
+        stat = os.stat(filename)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None) and (entry[0] == version):
+                self._cache_info.hits += 1
+                return entry[1]
+
+            self._cache_info.misses += 1
+
+        # load outside of the lock => files are loaded in parallel
+        log.debug(f"loading workpackage file '{filename}'...")
+        workpackages = load_workpackage_file(filename, strict_dates)
+
+        with self._lock:
+            self._entries[key] = (version, workpackages)
+
+        return workpackages
+
+    def clear(self):
+        """
+        remove all entries of the cache
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# cache shared by all projects
+workpackage_files = WorkpackageFileCache()
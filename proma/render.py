@@ -0,0 +1,322 @@
+import logging
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO
+
+import svgwrite
+
+from proma.utils.timetable import (
+    YEAR_MONTH_WEEK_FMT,
+    YEAR_QUARTER_MONTH_WEEK_DAY_FMT,
+)
+from proma.draw.base.consts import DEFAULT_CELL_HEIGHT, DEFAULT_CELL_WIDTH
+from proma.draw.output import StreamingDrawing, count_elements
+from proma.draw.widgets.gantt.gantt import Gantt
+from proma.draw.widgets.gantt.viewport import Viewport
+from proma.models import DependencyGraph, Project, Workpackage
+from proma.utils.instrumentation import instrumentation
+from proma.utils.rendercache import RenderCache, fingerprint
+
+
+# prepare logger
+log = logging.getLogger(__file__)
+
+# stylesheet referenced by the rendered SVGs
+DEFAULT_CSS = "css/default.css"
+
+# size of the rendered SVGs
+DEFAULT_SIZE = ("1900", "600")
+
+# width of the column with the descriptions
+DEFAULT_DESCRIPTION_WIDTH = 200
+
+# formats (hierarchy) of the timetable per view
+VIEW_FORMATS = {
+    "day": YEAR_QUARTER_MONTH_WEEK_DAY_FMT,
+    "week": YEAR_MONTH_WEEK_FMT,
+}
+
+
+class _SchedulingRequired(Exception):
+    """
+    raised while streaming, when a task needs to be scheduled
+    """
+
+
+def _scheduled(
+    workpackages: Iterable[Workpackage],
+) -> Iterator[Workpackage]:
+    """
+    yield the workpackages, as long as all their tasks have a start date;
+    afterwards, the dependencies are checked as when the tasks are
+    scheduled, i.e., unknown and cyclic dependencies are rejected
+
+    :param workpackages: workpackages
+    :type workpackages: Iterable[Workpackage]
+    :raises _SchedulingRequired: raised when a task has no start date
+    :yield: workpackages
+    :rtype: Iterator[Workpackage]
+    """
+    streamed = []
+    for wp in workpackages:
+        if any(t.start_date is None for t in wp.tasks):
+            raise _SchedulingRequired()
+
+        streamed.append(wp)
+        yield wp
+
+    DependencyGraph(streamed)
+
+
+def create_gantt(
+    project: Project,
+    view: str = "day",
+    compact: bool = False,
+    viewport: Optional[Viewport] = None,
+    cell_width: int = DEFAULT_CELL_WIDTH,
+    description_width: int = DEFAULT_DESCRIPTION_WIDTH,
+    workpackages: Optional[Iterable[Workpackage]] = None,
+    incremental: bool = False,
+    previous: Optional[Gantt] = None,
+    critical_path: bool = False,
+) -> Gantt:
+    """
+    create the gantt chart of the project
+
+    :param project: project
+    :type project: Project
+    :param view: view, i.e., "day" or "week", defaults to "day"
+    :type view: str, optional
+    :param compact: draw empty cells as merged paths, defaults to False
+    :type compact: bool, optional
+    :param viewport: window of the chart, defaults to None
+    :type viewport: Optional[Viewport], optional
+    :param cell_width: width of a cell, defaults to DEFAULT_CELL_WIDTH
+    :type cell_width: int, optional
+    :param description_width: width of the descriptions,
+        defaults to DEFAULT_DESCRIPTION_WIDTH
+    :type description_width: int, optional
+    :param workpackages: workpackages, defaults to None, i.e., the
+        project's workpackages
+    :type workpackages: Optional[Iterable[Workpackage]], optional
+    :param incremental: keep rows and drawn markup per workpackage for
+        following charts, defaults to False
+    :type incremental: bool, optional
+    :param previous: incremental chart of a previous version of the
+        project whose unchanged workpackages are reused, defaults to None
+    :type previous: Optional[Gantt], optional
+    :param critical_path: highlight the critical path, defaults to False
+    :type critical_path: bool, optional
+    :raises ValueError: raised when the view is unknown
+    :return: gantt chart
+    :rtype: Gantt
+    """
+    if view not in VIEW_FORMATS:
+        # unknown view
+        raise ValueError(
+            f"The view '{view}' is not in {list(VIEW_FORMATS)}! Abort."
+        )
+
+    with instrumentation.stage("layout"):
+        return Gantt(
+            x=100,
+            y=100,
+            project=project,
+            default_cell_width=cell_width,
+            description_width=description_width,
+            formats=VIEW_FORMATS[view],
+            compact=compact,
+            viewport=viewport,
+            workpackages=workpackages,
+            incremental=incremental,
+            previous=previous,
+            critical_path=critical_path,
+        )
+
+
+def write_gantt(
+    gantt: Gantt,
+    fileobj: TextIO,
+    debug: bool = False,
+):
+    """
+    draw the gantt chart and write the SVG to the file object while
+    drawing
+
+    :param gantt: gantt chart
+    :type gantt: Gantt
+    :param fileobj: file object, e.g., an opened file or io.StringIO
+    :type fileobj: TextIO
+    :param debug: validate the attributes of all SVG elements (slow),
+        defaults to False
+    :type debug: bool, optional
+    """
+    with instrumentation.stage("draw"), StreamingDrawing(
+        fileobj, size=DEFAULT_SIZE, debug=debug
+    ) as dwg:
+        # add default css for formatting
+        dwg.add_stylesheet(DEFAULT_CSS, "default")
+        dwg.add(gantt.draw(dwg))
+
+
+def save_gantt(
+    gantt: Gantt,
+    output_filename: str,
+    stream: bool = False,
+    debug: bool = False,
+):
+    """
+    draw the gantt chart and save it as SVG
+
+    :param gantt: gantt chart
+    :type gantt: Gantt
+    :param output_filename: filename of the SVG
+    :type output_filename: str
+    :param stream: write the SVG while drawing, defaults to False
+    :type stream: bool, optional
+    :param debug: validate the attributes of all SVG elements (slow),
+        defaults to False
+    :type debug: bool, optional
+    """
+    if stream is True:
+        # draw the gantt chart directly into the file
+        log.debug(f"streaming SVG to '{output_filename}'...")
+        with open(output_filename, "w", encoding="utf-8") as f:
+            write_gantt(gantt, f, debug=debug)
+
+        return
+
+    # draw the gantt chart
+    dwg = svgwrite.Drawing(size=DEFAULT_SIZE, debug=debug)
+
+    # add default css for formatting
+    # TODO: make configurable via parameter?!
+    dwg.add_stylesheet(DEFAULT_CSS, "default")
+    with instrumentation.stage("draw"):
+        dwg.add(gantt.draw(dwg))
+
+    if instrumentation.enabled:
+        # all elements except for the SVG element itself
+        instrumentation.count("svg_elements", count_elements(dwg) - 1)
+
+    # finally, save
+    log.debug(f"saving SVG to '{output_filename}'...")
+    with instrumentation.stage("serialize"):
+        dwg.saveas(output_filename)
+
+
+def render_gantt(
+    filename: str,
+    output_filename: Optional[str] = None,
+    view: str = "day",
+    compact: bool = False,
+    stream: bool = False,
+    viewport: Optional[Viewport] = None,
+    cache: Optional[RenderCache] = None,
+    snapshot: bool = False,
+    strict_dates: bool = False,
+    critical_path: bool = False,
+) -> str:
+    """
+    load the project file and save its gantt chart as SVG
+
+    :param filename: filename of the project
+    :type filename: str
+    :param output_filename: filename of the SVG, defaults to None, i.e.,
+        the project's filename with suffix .svg in the current directory
+    :type output_filename: Optional[str], optional
+    :param view: view, i.e., "day" or "week", defaults to "day"
+    :type view: str, optional
+    :param compact: draw empty cells as merged paths, defaults to False
+    :type compact: bool, optional
+    :param stream: write the SVG while drawing, defaults to False
+    :type stream: bool, optional
+    :param viewport: window of the chart, defaults to None
+    :type viewport: Optional[Viewport], optional
+    :param cache: cache of rendered SVGs, defaults to None (no cache)
+    :type cache: Optional[RenderCache], optional
+    :param snapshot: use snapshot of the loaded project, defaults to False
+    :type snapshot: bool, optional
+    :param strict_dates: only accept ISO 8601 and explicit date formats,
+        defaults to False
+    :type strict_dates: bool, optional
+    :param critical_path: highlight the critical path, defaults to False
+    :type critical_path: bool, optional
+    :return: filename of the SVG
+    :rtype: str
+    """
+    if output_filename is None:
+        output_filename = f"{Path(filename).stem}.svg"
+
+    if cache is not None:
+        with instrumentation.stage("cache"):
+            # all inputs that have an influence on the SVG
+            key = fingerprint(
+                [*Project.input_files(filename), DEFAULT_CSS],
+                view=view,
+                compact=compact,
+                stream=stream,
+                viewport=viewport,
+                strict_dates=strict_dates,
+                critical_path=critical_path,
+                cell_width=DEFAULT_CELL_WIDTH,
+                cell_height=DEFAULT_CELL_HEIGHT,
+                description_width=DEFAULT_DESCRIPTION_WIDTH,
+                size=DEFAULT_SIZE,
+            )
+            hit = cache.get(key, output_filename)
+
+        if hit is True:
+            # unchanged => previously rendered SVG
+            return output_filename
+
+    # get project data from file
+    log.debug(f"loading project file from '{filename}'...")
+    gantt = None
+    if (snapshot is False) and (critical_path is False):
+        # workpackages are loaded while the chart is prepared, as long as
+        # no task has to be scheduled
+        project, workpackages = Project.stream_from(
+            filename,
+            strict_dates=strict_dates,
+        )
+        try:
+            gantt = create_gantt(
+                project=project,
+                view=view,
+                compact=compact,
+                viewport=viewport,
+                workpackages=_scheduled(workpackages),
+            )
+
+        except _SchedulingRequired:
+            log.debug(
+                "tasks need to be scheduled => discarding the partial "
+                "chart and loading completely"
+            )
+
+        finally:
+            # => closes the file, if not all workpackages have been loaded
+            workpackages.close()
+
+    if gantt is None:
+        # completely, since the tasks are scheduled before the layout
+        project = Project.create_from(
+            filename,
+            snapshot=snapshot,
+            strict_dates=strict_dates,
+        )
+        gantt = create_gantt(
+            project=project,
+            view=view,
+            compact=compact,
+            viewport=viewport,
+            critical_path=critical_path,
+        )
+
+    save_gantt(gantt, output_filename, stream=stream)
+
+    if cache is not None:
+        with instrumentation.stage("cache"):
+            cache.put(key, output_filename)
+
+    return output_filename
@@ -0,0 +1,344 @@
+import io
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from proma.consts import DEFAULT_SVG_CACHE_SIZE, DEFAULT_WORKERS
+from proma.draw.widgets.gantt.viewport import Viewport
+from proma.models import Project
+from proma.render import VIEW_FORMATS, create_gantt, write_gantt
+from proma.utils.dateparser import DateParser
+from proma.utils.memorycache import MemoryCache
+
+
+# prepare logger
+log = logging.getLogger(__file__)
+
+# maximum number of cached projects and charts
+MAX_PROJECTS = 64
+MAX_CHARTS = 8
+
+# maximum size of a posted project file
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# parser of the dates of the viewport
+_parse_date = DateParser(strict=True)
+
+
+def _flag(value: str) -> bool:
+    """
+    returns the boolean value of a query parameter
+
+    :param value: value of the query parameter
+    :type value: str
+    :raises ValueError: raised when the value is not a boolean
+    :return: boolean value
+    :rtype: bool
+    """
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True
+
+    if value.lower() in ("0", "false", "no", "off"):
+        return False
+
+    raise ValueError(f"'{value}' is not a boolean! Abort.")
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """
+    options of a rendering, which are given as query parameters
+    """
+
+    view: str = "day"
+    compact: bool = False
+    strict_dates: bool = False
+    critical_path: bool = False
+    viewport: Viewport = field(default_factory=Viewport)
+
+    @staticmethod
+    def from_query(query: Dict[str, List[str]]) -> "RenderOptions":
+        """
+        returns the options of the query parameters, e.g.,
+        "view=week&compact=1&start_date=2023-03-01&row_count=10"
+
+        :param query: query parameters as returned by parse_qs()
+        :type query: Dict[str, List[str]]
+        :raises ValueError: raised when a parameter is invalid
+        :return: options
+        :rtype: RenderOptions
+        """
+        params = {key: values[-1] for key, values in query.items()}
+
+        view = params.pop("view", "day")
+        if view not in VIEW_FORMATS:
+            raise ValueError(
+                f"The view '{view}' is not in {list(VIEW_FORMATS)}! Abort."
+            )
+
+        compact = _flag(params.pop("compact", "0"))
+        strict_dates = _flag(params.pop("strict_dates", "0"))
+        critical_path = _flag(params.pop("critical_path", "0"))
+
+        # window of the chart
+        start_date = params.pop("start_date", None)
+        end_date = params.pop("end_date", None)
+        row_count = params.pop("row_count", None)
+        viewport = Viewport(
+            start_date=_parse_date(start_date) if start_date else None,
+            end_date=_parse_date(end_date) if end_date else None,
+            first_row=int(params.pop("first_row", "0")),
+            row_count=int(row_count) if row_count else None,
+        )
+
+        if params:
+            raise ValueError(f"Unknown parameters {list(params)}! Abort.")
+
+        return RenderOptions(
+            view=view,
+            compact=compact,
+            strict_dates=strict_dates,
+            critical_path=critical_path,
+            viewport=viewport,
+        )
+
+
+class RenderService:
+    """
+    renders posted project files into SVGs while keeping warm caches
+
+    the rendered SVGs and the loaded projects are cached by the hash of
+    the project file's content; additionally, the last chart per project
+    and options is kept, thus a changed version of a project only lays
+    out and draws the changed workpackages (see Gantt) and reuses the
+    timetable of the previous chart
+    """
+
+    def __init__(
+        self,
+        svg_cache_size: int = DEFAULT_SVG_CACHE_SIZE,
+        max_projects: int = MAX_PROJECTS,
+        max_charts: int = MAX_CHARTS,
+    ):
+        self.svgs = MemoryCache(max_size=svg_cache_size)
+        self.projects = MemoryCache(max_entries=max_projects)
+        self.charts = MemoryCache(max_entries=max_charts)
+
+    def load_project(
+        self,
+        content: bytes,
+        digest: str,
+        strict_dates: bool,
+    ) -> Project:
+        """
+        returns the project of the project file's content
+
+        :param content: content of the project file
+        :type content: bytes
+        :param digest: hash of the content
+        :type digest: str
+        :param strict_dates: only accept ISO 8601 and explicit date formats
+        :type strict_dates: bool
+        :return: project
+        :rtype: Project
+        """
+        project = self.projects.get((digest, strict_dates))
+        if project is None:
+            project = Project.create_from_string(
+                content.decode("utf-8"),
+                strict_dates=strict_dates,
+            )
+            self.projects.put((digest, strict_dates), project)
+
+        return project
+
+    def render(
+        self,
+        content: bytes,
+        options: RenderOptions,
+    ) -> bytes:
+        """
+        returns the SVG of the project file's content
+
+        :param content: content of the project file
+        :type content: bytes
+        :param options: options of the rendering
+        :type options: RenderOptions
+        :return: SVG (utf-8)
+        :rtype: bytes
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        svg = self.svgs.get((digest, options))
+        if svg is not None:
+            return svg
+
+        project = self.load_project(content, digest, options.strict_dates)
+
+        # previous chart of the same project
+        chart_key = (project.name, options)
+        gantt = create_gantt(
+            project=project,
+            view=options.view,
+            compact=options.compact,
+            viewport=options.viewport,
+            incremental=True,
+            previous=self.charts.get(chart_key),
+            critical_path=options.critical_path,
+        )
+
+        buffer = io.StringIO()
+        write_gantt(gantt, buffer)
+        svg = buffer.getvalue().encode("utf-8")
+
+        self.charts.put(chart_key, gantt)
+        self.svgs.put((digest, options), svg)
+
+        return svg
+
+    def info(self) -> dict:
+        """
+        returns the statistics of the caches
+
+        :return: statistics per cache
+        :rtype: dict
+        """
+        return {
+            "svgs": asdict(self.svgs.cache_info),
+            "projects": asdict(self.projects.cache_info),
+            "charts": asdict(self.charts.cache_info),
+        }
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    handler of the requests of the render server:
+
+    - POST /gantt (project file as body, options as query parameters)
+      returns the SVG of the gantt chart
+    - GET /status returns the statistics of the caches as JSON
+    """
+
+    server: "RenderServer"
+
+    def _send(
+        self,
+        status: int,
+        content_type: str,
+        body: bytes,
+    ):
+        """
+        send the response
+
+        :param status: HTTP status code
+        :type status: int
+        :param content_type: content type of the body
+        :type content_type: str
+        :param body: body
+        :type body: bytes
+        """
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(
+        self,
+        status: int,
+        text: str,
+    ):
+        """
+        send a plain text response, e.g., an error message
+
+        :param status: HTTP status code
+        :type status: int
+        :param text: text
+        :type text: str
+        """
+        self._send(status, "text/plain; charset=utf-8", f"{text}\n".encode())
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/status":
+            self._send_text(404, f"'{self.path}' not found")
+            return
+
+        self._send(
+            200,
+            "application/json",
+            json.dumps(self.server.service.info()).encode(),
+        )
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/gantt":
+            self._send_text(404, f"'{self.path}' not found")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_text(411, "Content-Length required")
+            return
+
+        if not 0 < length <= MAX_BODY_SIZE:
+            self._send_text(413, f"project file must be 1-{MAX_BODY_SIZE}B")
+            return
+
+        content = self.rfile.read(length)
+        try:
+            options = RenderOptions.from_query(parse_qs(url.query))
+        except ValueError as e:
+            self._send_text(400, str(e))
+            return
+
+        try:
+            svg = self.server.service.render(content, options)
+
+        except Exception as e:
+            # invalid project file, e.g., yaml or validation errors
+            log.debug(f"cannot render project: {e}", exc_info=True)
+            self._send_text(400, str(e))
+            return
+
+        self._send(200, "image/svg+xml", svg)
+
+    def log_message(self, format: str, *args):
+        log.debug(f"{self.address_string()} - {format % args}")
+
+
+class RenderServer(ThreadingHTTPServer):
+    """
+    HTTP server that renders gantt charts of posted project files;
+    requests are handled by a pool of threads, which share the caches
+    of the render service
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        service: RenderService,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        ThreadingHTTPServer.__init__(self, address, RenderRequestHandler)
+
+        self.service = service
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def process_request(self, request, client_address):
+        # handle the request in the pool instead of a new thread
+        self.executor.submit(
+            self.process_request_thread,
+            request,
+            client_address,
+        )
+
+    def server_close(self):
+        ThreadingHTTPServer.server_close(self)
+        self.executor.shutdown(wait=True)
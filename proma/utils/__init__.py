@@ -1,4 +1,31 @@
-from .timetable import Timetable
+import importlib
 
 
-__all__ = ["Timetable"]
+# submodule per exported name; the submodules are only imported on first
+# access (PEP 562), e.g., the timetable loads dateutil
+_exports = {
+    "Timetable": ".timetable",
+    "TimetableCacheInfo": ".timetable",
+    "RenderCache": ".rendercache",
+    "RenderCacheInfo": ".rendercache",
+    "fingerprint": ".rendercache",
+    "MemoryCache": ".memorycache",
+    "MemoryCacheInfo": ".memorycache",
+}
+
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_exports[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,122 @@
+import datetime
+from functools import lru_cache
+from typing import Sequence
+
+from dateutil.parser import parse as dateutil_parse
+
+
+# explicit formats that are tried after ISO 8601
+DEFAULT_DATE_FORMATS = (
+    "%d.%m.%Y",
+    "%d.%m.%Y %H:%M",
+    "%Y/%m/%d",
+)
+
+
+class DateParser:
+    """
+    date parser that tries ISO 8601 (datetime.fromisoformat) and the
+    given explicit formats first and only falls back to dateutil for
+    other inputs, unless it is strict
+
+    results are memoized per string, since project files repeat the
+    same dates a lot; the parser can directly be used as coercer
+    """
+
+    def __init__(
+        self,
+        strict: bool = False,
+        dayfirst: bool = False,
+        formats: Sequence[str] = DEFAULT_DATE_FORMATS,
+        maxsize: int = 4096,
+    ):
+        self.strict = strict
+        self.dayfirst = dayfirst
+        self.formats = tuple(formats)
+
+        # memoize per instance, since results depend on the settings
+        self._parse_str = lru_cache(maxsize=maxsize)(self._parse_str)
+
+    def _parse_str(
+        self,
+        value: str,
+    ) -> datetime.datetime:
+        """
+        parse the date string
+
+        :param value: date string
+        :type value: str
+        :raises ValueError: raised when value is not a valid date
+        :return: date
+        :rtype: datetime.datetime
+        """
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+        for fmt in self.formats:
+            try:
+                return datetime.datetime.strptime(value, fmt)
+            except ValueError:
+                pass
+
+        if self.strict is True:
+            # no guessing in strict mode
+            raise ValueError(f"'{value}' is not a valid date.")
+
+        try:
+            return dateutil_parse(value, dayfirst=self.dayfirst)
+
+        except (ValueError, OverflowError):
+            raise ValueError(f"'{value}' is not a valid date.")
+
+    def parse(
+        self,
+        value,
+    ) -> datetime.datetime:
+        """
+        returns the date of the given value, i.e., a date string,
+        a date or a datetime
+
+        :param value: value
+        :type value: Any
+        :raises ValueError: raised when value is not a valid date
+        :return: date
+        :rtype: datetime.datetime
+        """
+        if isinstance(value, datetime.datetime):
+            # already parsed
+            return value
+
+        if isinstance(value, datetime.date):
+            # unquoted date in yaml
+            return datetime.datetime.combine(value, datetime.time())
+
+        if not isinstance(value, str):
+            raise ValueError(f"'{value}' is not a valid date.")
+
+        return self._parse_str(value)
+
+    __call__ = parse
+
+    def cache_info(self):
+        """
+        returns the statistics of the memoized results
+
+        :return: statistics as returned by functools.lru_cache
+        :rtype: functools._CacheInfo
+        """
+        return self._parse_str.cache_info()
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the date parser
+
+        :return: string representation of the date parser
+        :rtype: str
+        """
+        return (
+            f"<DateParser(strict={self.strict}, dayfirst={self.dayfirst}, "
+            f"formats={self.formats})>"
+        )
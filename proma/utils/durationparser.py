@@ -0,0 +1,156 @@
+import re
+import datetime
+from functools import lru_cache
+
+from pytimeparse import parse as pytimeparse_parse
+
+
+# seconds per unit
+UNITS = {
+    **dict.fromkeys(("w", "wk", "wks", "week", "weeks"), 7 * 24 * 60 * 60),
+    **dict.fromkeys(("d", "day", "days"), 24 * 60 * 60),
+    **dict.fromkeys(("h", "hr", "hrs", "hour", "hours"), 60 * 60),
+    **dict.fromkeys(("m", "min", "mins", "minute", "minutes"), 60),
+    **dict.fromkeys(("s", "sec", "secs", "second", "seconds"), 1),
+}
+
+# units of working days (Monday to Friday)
+WORKING_DAY_UNITS = ("wd", "wds", "workday", "workdays")
+
+# single term of a duration, e.g., "3d" or "1.5 weeks"
+_TERM = r"(\d+(?:\.\d+)?)\s*([a-z]+)"
+_TERM_RE = re.compile(_TERM)
+_DURATION_RE = re.compile(rf"\s*{_TERM}(?:\s*,?\s*{_TERM})*\s*")
+
+
+class WorkingDays(datetime.timedelta):
+    """
+    duration in working days, i.e., weekends are skipped; as timedelta,
+    it is the same number of calendar days
+    """
+
+    def __new__(cls, working_days: int):
+        self = datetime.timedelta.__new__(cls, days=working_days)
+        self.working_days = working_days
+
+        return self
+
+    def __reduce__(self):
+        return (WorkingDays, (self.working_days,))
+
+    def add_to(
+        self,
+        start: datetime.datetime,
+    ) -> datetime.datetime:
+        """
+        returns the end of the working days starting at the given date,
+        i.e., the day after the last working day
+
+        :param start: start date
+        :type start: datetime.datetime
+        :return: end date
+        :rtype: datetime.datetime
+        """
+        if self.working_days <= 0:
+            return start
+
+        # first working day
+        dt = start
+        while dt.weekday() >= 5:
+            dt += datetime.timedelta(days=1)
+
+        # skip complete weeks at once
+        weeks, rest = divmod(self.working_days - 1, 5)
+        dt += datetime.timedelta(weeks=weeks)
+
+        for _ in range(rest):
+            # next working day
+            dt += datetime.timedelta(days=1)
+            while dt.weekday() >= 5:
+                dt += datetime.timedelta(days=1)
+
+        return dt + datetime.timedelta(days=1)
+
+    def subtract_from(
+        self,
+        end: datetime.datetime,
+    ) -> datetime.datetime:
+        """
+        returns the start of the working days ending at the given date,
+        i.e., the inverse of add_to()
+
+        :param end: end date, i.e., the day after the last working day
+        :type end: datetime.datetime
+        :return: start date
+        :rtype: datetime.datetime
+        """
+        if self.working_days <= 0:
+            return end
+
+        # last working day
+        dt = end - datetime.timedelta(days=1)
+        while dt.weekday() >= 5:
+            dt -= datetime.timedelta(days=1)
+
+        # skip complete weeks at once
+        weeks, rest = divmod(self.working_days - 1, 5)
+        dt -= datetime.timedelta(weeks=weeks)
+
+        for _ in range(rest):
+            # previous working day
+            dt -= datetime.timedelta(days=1)
+            while dt.weekday() >= 5:
+                dt -= datetime.timedelta(days=1)
+
+        return dt
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the working days
+
+        :return: string representation of the working days
+        :rtype: str
+        """
+        return f"WorkingDays({self.working_days})"
+
+
+@lru_cache(maxsize=4096)
+def parse_duration(value: str) -> datetime.timedelta:
+    """
+    parse duration string, e.g., "1w", "3d", "2 days 4h" or "5wd"
+    (working days); durations in other formats supported by
+    pytimeparse, e.g., "1:30:00", are parsed by pytimeparse
+
+    :param value: duration string
+    :type value: str
+    :raises ValueError: raised when value is not a valid duration
+    :return: duration
+    :rtype: datetime.timedelta
+    """
+    s = value.lower()
+    if _DURATION_RE.fullmatch(s) is None:
+        # other format => slow path
+        seconds = pytimeparse_parse(value)
+        if seconds is None:
+            raise ValueError(f"'{value}' is not a valid duration.")
+
+        return datetime.timedelta(seconds=seconds)
+
+    terms = _TERM_RE.findall(s)
+    if any(unit in WORKING_DAY_UNITS for _, unit in terms):
+        # working days cannot be combined with calendar units
+        if (len(terms) != 1) or not terms[0][0].isdigit():
+            raise ValueError(
+                f"'{value}' is not a valid duration in working days."
+            )
+
+        return WorkingDays(int(terms[0][0]))
+
+    seconds = 0
+    for number, unit in terms:
+        if unit not in UNITS:
+            raise ValueError(f"'{value}' is not a valid duration.")
+
+        seconds += float(number) * UNITS[unit]
+
+    return datetime.timedelta(seconds=seconds)
@@ -0,0 +1,201 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class Instrumentation:
+    """
+    lightweight instrumentation that the model and the draw layers
+    report their stages (e.g., "parse" or "layout") and counters (e.g.,
+    "cells") into; it is disabled by default, thus a report only costs
+    a check of the enabled flag
+
+    stages can be nested, where the time of a stage excludes the time
+    of its nested stages, i.e., the times of all stages add up to the
+    total time; stages are tracked per thread
+    """
+
+    def __init__(self):
+        self.enabled = False
+
+        # exclusive time and number of calls per stage
+        self.timings = {}
+        self.calls = {}
+
+        # counter values by name
+        self.counters = {}
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self):
+        """
+        reset all timings and counters and start recording
+        """
+        self.reset()
+        self.enabled = True
+
+    def disable(self):
+        """
+        stop recording
+        """
+        self.enabled = False
+
+    def reset(self):
+        """
+        reset all timings and counters
+        """
+        with self._lock:
+            self.timings = {}
+            self.calls = {}
+            self.counters = {}
+
+    def count(
+        self,
+        name: str,
+        n: int = 1,
+    ):
+        """
+        increase the counter by n
+
+        :param name: name of the counter
+        :type name: str
+        :param n: increment, defaults to 1
+        :type n: int, optional
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+    ) -> Iterator[None]:
+        """
+        context manager that records the time of the stage
+
+        :param name: name of the stage
+        :type name: str
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stack = self._local.__dict__.setdefault("stack", [])
+
+        # time of the nested stages
+        nested = [0.0]
+        stack.append(nested)
+        start = time.perf_counter()
+        try:
+            yield
+
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                # exclude from the enclosing stage
+                stack[-1][0] += elapsed
+
+            with self._lock:
+                self.timings[name] = (
+                    self.timings.get(name, 0.0) + elapsed - nested[0]
+                )
+                self.calls[name] = self.calls.get(name, 0) + 1
+
+    def iterate(
+        self,
+        name: str,
+        iterable: Iterable[T],
+    ) -> Iterator[T]:
+        """
+        iterate over the iterable, where the time to get each item is
+        recorded as the stage, e.g., to measure lazy loading
+
+        :param name: name of the stage
+        :type name: str
+        :param iterable: iterable
+        :type iterable: Iterable[T]
+        :return: iterator over the items of the iterable
+        :rtype: Iterator[T]
+        """
+        if not self.enabled:
+            # nothing to measure
+            return iter(iterable)
+
+        return self._iterate(name, iter(iterable))
+
+    def _iterate(
+        self,
+        name: str,
+        iterator: Iterator[T],
+    ) -> Iterator[T]:
+        """
+        yield the items of the iterator, while measuring the stage;
+        closing the generator closes the iterator as well
+
+        :param name: name of the stage
+        :type name: str
+        :param iterator: iterator
+        :type iterator: Iterator[T]
+        :yield: items of the iterator
+        :rtype: Iterator[T]
+        """
+        try:
+            while True:
+                with self.stage(name):
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+
+                yield item
+
+        finally:
+            # e.g., closes the file of the lazily loaded workpackages
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    def report(
+        self,
+        duration: Optional[float] = None,
+    ) -> str:
+        """
+        returns the recorded timings and counters as text
+
+        :param duration: total duration of the measured run, which adds
+            the time outside of all stages, defaults to None
+        :type duration: Optional[float], optional
+        :return: report
+        :rtype: str
+        """
+        timings = dict(self.timings)
+        calls = dict(self.calls)
+        if duration is not None:
+            timings["other"] = max(duration - sum(timings.values()), 0.0)
+            calls["other"] = ""
+
+        total = sum(timings.values())
+        lines = [f"{'stage':<16}{'time':>12}{'share':>8}{'calls':>10}"]
+        for name, seconds in timings.items():
+            share = seconds / total if total > 0 else 0.0
+            lines.append(
+                f"{name:<16}{seconds:>11.3f}s{share:>8.1%}{calls[name]:>10}"
+            )
+        lines.append(f"{'total':<16}{total:>11.3f}s")
+
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'counter':<16}{'value':>12}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<16}{value:>12}")
+
+        return "\n".join(lines)
+
+
+# instrumentation shared by all layers
+instrumentation = Instrumentation()
@@ -0,0 +1,145 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+
+@dataclass
+class MemoryCacheInfo:
+    """
+    statistics of the memory cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+class MemoryCache:
+    """
+    thread-safe in-memory cache that evicts the least recently used
+    entries, when the number of entries or their total size exceeds
+    the maximum
+
+    please note that the cached values are shared, i.e., they must
+    not be modified
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_size: Optional[int] = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.sizeof = sizeof
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._cache_info = MemoryCacheInfo()
+
+    @property
+    def cache_info(self) -> MemoryCacheInfo:
+        """
+        returns the statistics of the cache
+
+        :return: statistics of the cache
+        :rtype: MemoryCacheInfo
+        """
+        with self._lock:
+            self._cache_info.entries = len(self._entries)
+            self._cache_info.size = self._size
+
+            return MemoryCacheInfo(**vars(self._cache_info))
+
+    def _is_full(self) -> bool:
+        """
+        returns True, if the cache exceeds the maximum number of entries
+        or the maximum size (lock must be held)
+
+        :return: True, if entries must be evicted
+        :rtype: bool
+        """
+        if (self.max_entries is not None) and (
+            len(self._entries) > self.max_entries
+        ):
+            return True
+
+        return (self.max_size is not None) and (self._size > self.max_size)
+
+    def get(
+        self,
+        key: Hashable,
+    ) -> Optional[Any]:
+        """
+        returns the cached value of the key
+
+        :param key: key
+        :type key: Hashable
+        :return: value or None, if the key is not cached
+        :rtype: Optional[Any]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._cache_info.misses += 1
+                return None
+
+            # most recently used => last entry
+            self._entries.move_to_end(key)
+            self._cache_info.hits += 1
+
+            return entry[0]
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+    ):
+        """
+        add the value to the cache and evict the least recently used
+        entries, if the cache is too large afterwards
+
+        :param key: key
+        :type key: Hashable
+        :param value: value
+        :type value: Any
+        """
+        size = self.sizeof(value) if self.max_size is not None else 0
+        if (self.max_size is not None) and (size > self.max_size):
+            # larger than the whole cache => not cached
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+
+            self._entries[key] = (value, size)
+            self._size += size
+
+            while self._is_full():
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._cache_info.evictions += 1
+
+    def clear(self):
+        """
+        remove all entries of the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        """
+        returns the number of cached entries
+
+        :return: number of entries
+        :rtype: int
+        """
+        return len(self._entries)
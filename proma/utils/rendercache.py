@@ -0,0 +1,223 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from proma.consts import DEFAULT_CACHE_SIZE
+
+
+# prepare logger
+log = logging.getLogger(__file__)
+
+# version of the cache entries => increase when the output changes
+CACHE_VERSION = 4
+
+
+def default_cache_dir() -> str:
+    """
+    returns the default cache directory, i.e., $PROMA_CACHE_DIR or
+    proma in $XDG_CACHE_HOME (defaults to ~/.cache)
+
+    :return: cache directory
+    :rtype: str
+    """
+    if "PROMA_CACHE_DIR" in os.environ:
+        return os.environ["PROMA_CACHE_DIR"]
+
+    return os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "proma",
+    )
+
+
+def fingerprint(
+    filenames: Iterable[str],
+    **options,
+) -> str:
+    """
+    returns the fingerprint of the inputs of a rendering, i.e., a hash
+    of the content of the given files and the options; files that
+    do not exist are hashed as such
+
+    :param filenames: filenames of the input files, e.g., project and css
+    :type filenames: Iterable[str]
+    :return: hex digest of the inputs
+    :rtype: str
+    """
+    h = hashlib.sha256()
+    for filename in filenames:
+        try:
+            content = Path(filename).read_bytes()
+        except FileNotFoundError:
+            content = None
+
+        # prefix with length to keep the boundaries of the files
+        h.update(b"-" if content is None else b"%d:" % len(content))
+        h.update(content or b"")
+
+    h.update(json.dumps(options, sort_keys=True, default=str).encode())
+
+    return h.hexdigest()
+
+
+@dataclass
+class RenderCacheInfo:
+    """
+    statistics of the render cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class RenderCache:
+    """
+    on-disk cache of rendered SVGs that is addressed by the fingerprint
+    of the inputs; when the size of all entries exceeds the maximum
+    size, the least recently used entries are evicted
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.directory = Path(directory or default_cache_dir())
+        self.max_size = max_size
+        self._cache_info = RenderCacheInfo()
+
+    @property
+    def cache_info(self) -> RenderCacheInfo:
+        """
+        returns the statistics of the cache
+
+        :return: statistics of the cache
+        :rtype: RenderCacheInfo
+        """
+        return self._cache_info
+
+    def _entry(
+        self,
+        key: str,
+    ) -> Path:
+        """
+        returns the path of the cache entry
+
+        :param key: key, i.e., fingerprint
+        :type key: str
+        :return: path of the cache entry
+        :rtype: Path
+        """
+        return self.directory / f"v{CACHE_VERSION}-{key}.svg"
+
+    def get(
+        self,
+        key: str,
+        output_filename: str,
+    ) -> bool:
+        """
+        copy the cached SVG to the output filename
+
+        :param key: key, i.e., fingerprint
+        :type key: str
+        :param output_filename: filename to which the SVG is copied
+        :type output_filename: str
+        :return: True, if the key was in the cache
+        :rtype: bool
+        """
+        entry = self._entry(key)
+        try:
+            shutil.copyfile(entry, output_filename)
+
+            # mark as recently used
+            os.utime(entry)
+
+        except FileNotFoundError:
+            self._cache_info.misses += 1
+            return False
+
+        log.debug(f"cache hit for '{output_filename}' in '{entry}'")
+        self._cache_info.hits += 1
+
+        return True
+
+    def put(
+        self,
+        key: str,
+        filename: str,
+    ):
+        """
+        add the SVG of the given filename to the cache
+
+        :param key: key, i.e., fingerprint
+        :type key: str
+        :param filename: filename of the rendered SVG
+        :type filename: str
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # copy atomically, thus concurrent readers never see partial files
+        fd, tmp_filename = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(filename, tmp_filename)
+            os.replace(tmp_filename, self._entry(key))
+
+        except BaseException:
+            os.unlink(tmp_filename)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        """
+        remove the least recently used entries until the size of all
+        entries is within the maximum size
+        """
+        entries = []
+        size = 0
+        for entry in self.directory.glob("v*.svg"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # removed concurrently
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            size += stat.st_size
+
+        # oldest first
+        entries.sort()
+        for _, entry_size, entry in entries:
+            if size <= self.max_size:
+                break
+
+            log.debug(f"evicting '{entry}' from cache")
+            entry.unlink(missing_ok=True)
+            size -= entry_size
+            self._cache_info.evictions += 1
+
+    def clear(self):
+        """
+        remove all entries of the cache
+        """
+        for entry in self.directory.glob("v*.svg"):
+            entry.unlink(missing_ok=True)
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the render cache
+
+        :return: string representation of the render cache
+        :rtype: str
+        """
+        return (
+            f"<RenderCache(directory={self.directory}, "
+            f"max_size={self.max_size})>"
+        )
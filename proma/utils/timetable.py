@@ -1,11 +1,13 @@
+from array import array
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Tuple
 
 from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY
 
-from proma.models.timetableitem import TimetableItem
 from proma.models.timetablelevel import TimetableLevel
 from proma.models.types import DateType
+from proma.utils.instrumentation import instrumentation
 
 
 # default formats per hierachy
@@ -35,9 +37,23 @@ YEAR_MONTH_WEEK_FMT = {
 }
 
 
+@dataclass
+class TimetableCacheInfo:
+    """
+    statistics of the timetable's level cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
 class Timetable:
     """
     timetable
+
+    the timetable levels are materialized lazily on first access and
+    cached until start date, end date or formats are changed
     """
 
     def __init__(
@@ -47,11 +63,102 @@ class Timetable:
         formats: dict = YEAR_MONTH_WEEK_FMT,
     ):
         # start and end date
-        self.start_date = start_date
-        self.end_date = end_date
+        self._start_date = start_date
+        self._end_date = end_date
 
         # ensure valid format entries
-        self.formats = self._check_formats(formats)
+        self._formats = dict(self._check_formats(formats))
+
+        # cached levels, hierarchy and index (materialized lazily)
+        self._levels = {}
+        self._hierarchy = None
+        self._ordinals = None
+        self._pos_index = None
+        self._cache_info = TimetableCacheInfo()
+
+    def _invalidate(self):
+        """
+        drop all cached levels, hierarchy and index
+        """
+        self._levels = {}
+        self._hierarchy = None
+        self._ordinals = None
+        self._pos_index = None
+        self._cache_info.invalidations += 1
+
+    @property
+    def start_date(self) -> datetime:
+        """
+        returns the start date
+
+        :return: start date
+        :rtype: datetime
+        """
+        return self._start_date
+
+    @start_date.setter
+    def start_date(self, value: datetime):
+        """
+        set the start date and invalidate the cache
+
+        :param value: start date
+        :type value: datetime
+        """
+        self._start_date = value
+        self._invalidate()
+
+    @property
+    def end_date(self) -> datetime:
+        """
+        returns the end date
+
+        :return: end date
+        :rtype: datetime
+        """
+        return self._end_date
+
+    @end_date.setter
+    def end_date(self, value: datetime):
+        """
+        set the end date and invalidate the cache
+
+        :param value: end date
+        :type value: datetime
+        """
+        self._end_date = value
+        self._invalidate()
+
+    @property
+    def formats(self) -> dict:
+        """
+        returns the formats per date type
+
+        :return: formats
+        :rtype: dict
+        """
+        return self._formats
+
+    @formats.setter
+    def formats(self, value: dict):
+        """
+        set the formats and invalidate the cache;
+        a copy is stored, thus changes must be done by assignment
+
+        :param value: formats
+        :type value: dict
+        """
+        self._formats = dict(self._check_formats(value))
+        self._invalidate()
+
+    @property
+    def cache_info(self) -> TimetableCacheInfo:
+        """
+        returns the statistics of the level cache
+
+        :return: cache statistics
+        :rtype: TimetableCacheInfo
+        """
+        return self._cache_info
 
     @property
     def freq(self) -> int:
@@ -84,14 +191,49 @@ class Timetable:
         :rtype: dict
         """
         for k in formats:
-            if k not in DateType:
-                # invalid format
+            if not isinstance(k, DateType):
+                # e.g., a plain string instead of the date type
                 raise ValueError(
-                    f"Unknown format '{k}' for Timetable! Abort.",
+                    f"Unknown format '{k}' for Timetable, since it is not "
+                    "a DateType! Abort.",
                 )
 
         return formats
 
+    def _get_ordinals(self) -> array:
+        """
+        returns the ordinal day numbers of all items between start and
+        end date on the lowest level in hierarchy; the ordinals are
+        shared by all levels
+
+        :return: ordinal day numbers
+        :rtype: array
+        """
+        if self._ordinals is None:
+            if self.freq == DAILY:
+                # consecutive days can be computed directly
+                start = self.start_date.toordinal()
+                days = (self.end_date - self.start_date).days
+                self._ordinals = array("l", range(start, start + days + 1))
+
+            else:
+                # start at the beginning of the period of the start date
+                # (e.g., on Monday for weeks), thus the period of the end
+                # date is always included
+                self._ordinals = array(
+                    "l",
+                    (
+                        dt.toordinal()
+                        for dt in rrule(
+                            freq=self.freq,
+                            dtstart=self.hierarchy[-1].start(self.start_date),
+                            until=self.end_date,
+                        )
+                    ),
+                )
+
+        return self._ordinals
+
     def _get_timetable_level(
         self,
         dt_type: DateType,
@@ -105,21 +247,36 @@ class Timetable:
         :return: timetable level
         :rtype: TimetableLevel
         """
-        # get all timetable items based on rrule
-        items = [
-            TimetableItem(
-                dt_type=dt_type,
-                dt=dt,
-                format=self.formats[dt_type],
-            )
-            for dt in rrule(
-                freq=self.freq,
-                dtstart=self.start_date,
-                until=self.end_date,
-            )
-        ]
+        return TimetableLevel(
+            dt_type=dt_type,
+            ordinals=self._get_ordinals(),
+            format=self.formats[dt_type],
+        )
 
-        return TimetableLevel(dt_type=dt_type, items=items)
+    def get_level(
+        self,
+        dt_type: DateType,
+    ) -> TimetableLevel:
+        """
+        returns the cached timetable level of the date type;
+        the level is materialized on first access
+
+        :param dt_type: date type
+        :type dt_type: DateType
+        :return: timetable level
+        :rtype: TimetableLevel
+        """
+        level = self._levels.get(dt_type)
+        if level is None:
+            # not yet materialized
+            self._cache_info.misses += 1
+            level = self._get_timetable_level(dt_type)
+            self._levels[dt_type] = level
+
+        else:
+            self._cache_info.hits += 1
+
+        return level
 
     @property
     def items_per_hierarchy(self) -> list:
@@ -129,11 +286,18 @@ class Timetable:
         :return: list of timetable levels based on hierachy
         :rtype: list
         """
-        return [
-            self._get_timetable_level(level)
-            for level in DateType
-            if level in self.formats
-        ]
+        return [self.get_level(level) for level in self.hierarchy]
+
+    @property
+    def lowest_level(self) -> TimetableLevel:
+        """
+        return the lowest timetable level in hierarchy, i.e.,
+        the level that defines the columns
+
+        :return: lowest timetable level
+        :rtype: TimetableLevel
+        """
+        return self.get_level(self.hierarchy[-1])
 
     @property
     def hierarchy(self) -> list[str]:
@@ -143,7 +307,27 @@ class Timetable:
         :return: list of strings each from hierarchy
         :rtype: list[str]
         """
-        return [level for level in DateType if level in self.formats]
+        if self._hierarchy is None:
+            self._hierarchy = [
+                level for level in DateType if level in self.formats
+            ]
+
+        return self._hierarchy
+
+    def _build_pos_index(self) -> dict:
+        """
+        build the index that maps the calendar key of each item on the
+        lowest level in hierarchy to its position, i.e., its column
+
+        :return: dict of calendar key to position
+        :rtype: dict
+        """
+        index = {}
+        for pos, key in enumerate(self.lowest_level.keys):
+            # keep the first position, if the key is already existing
+            index.setdefault(key, pos)
+
+        return index
 
     def get_pos(
         self,
@@ -155,14 +339,23 @@ class Timetable:
 
         :param dt: datetime for which position is obtained
         :type dt: datetime
+        :raises ValueError: raised when date is not within the timetable
         :return: position of the given datetime
         :rtype: int
         """
-        # get all formatted dates of lowest level in hierarchy
-        dates = [str(item) for item in self.items_per_hierarchy[-1].items]
-
-        # find given date in prepared list
-        return dates.index(dt.strftime(self.formats[self.hierarchy[-1]]))
+        instrumentation.count("get_pos")
+        if self._pos_index is None:
+            # index of the lowest level to look up columns by date
+            self._pos_index = self._build_pos_index()
+
+        try:
+            # find the calendar period of the given date in the index
+            return self._pos_index[self.hierarchy[-1].key(dt)]
+
+        except KeyError:
+            raise ValueError(
+                f"The date '{dt}' is not within the timetable {self}! Abort."
+            )
 
     def get_from_and_length_pos(
         self,
@@ -0,0 +1,213 @@
+import os
+import time
+import logging
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+import yaml
+
+from proma.batch import input_files
+from proma.consts import DEFAULT_INTERVAL
+from proma.draw.widgets.gantt.gantt import Gantt
+from proma.draw.widgets.gantt.viewport import Viewport
+from proma.models import Project
+from proma.models.project import file_versions
+from proma.render import create_gantt, save_gantt
+
+
+# prepare logger
+log = logging.getLogger(__file__)
+
+
+@dataclass
+class WatchResult:
+    """
+    result of a re-rendering of the watched project file
+    """
+
+    output_filename: str
+    duration: float
+    changed: List[str] = field(default_factory=list)
+    workpackage_count: int = 0
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        """
+        True, if the project could not be rendered
+
+        :return: True, if the project could not be rendered
+        :rtype: bool
+        """
+        return self.error is not None
+
+
+class Watcher:
+    """
+    watches a project file and its included files and re-renders the
+    gantt chart whenever one of them changes
+
+    the chart of the last rendering is kept in memory, thus only the
+    workpackages that have changed (or moved) are laid out and drawn
+    again, while the others are written as previously drawn; included
+    workpackage files are only loaded again, if they have changed
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        output_filename: Optional[str] = None,
+        view: str = "day",
+        compact: bool = False,
+        viewport: Optional[Viewport] = None,
+        strict_dates: bool = False,
+        interval: float = DEFAULT_INTERVAL,
+        critical_path: bool = False,
+    ):
+        self.filename = filename
+        self.output_filename = output_filename or f"{Path(filename).stem}.svg"
+        self.view = view
+        self.compact = compact
+        self.viewport = viewport
+        self.strict_dates = strict_dates
+        self.interval = interval
+        self.critical_path = critical_path
+
+        # chart of the last successful rendering
+        self.gantt: Optional[Gantt] = None
+
+        # files the project is loaded from and their versions
+        self._input_files = [filename]
+        self._versions = None
+
+    def has_changed(self) -> bool:
+        """
+        returns True, if any of the input files has changed since the
+        last call, i.e., the project must be rendered again
+
+        :return: True, if any input file has changed
+        :rtype: bool
+        """
+        versions = file_versions(self._input_files)
+        if versions == self._versions:
+            return False
+
+        # includes may have changed => inputs of the new version
+        self._input_files = input_files(self.filename)
+        self._versions = file_versions(self._input_files)
+
+        return True
+
+    def _write(
+        self,
+        gantt: Gantt,
+    ):
+        """
+        draw the chart into a temporary file that replaces the output
+        file afterwards, thus viewers never see a partially written file
+
+        :param gantt: gantt chart
+        :type gantt: Gantt
+        """
+        path = Path(self.output_filename).absolute()
+        fd, tmp_filename = tempfile.mkstemp(
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+        )
+        os.close(fd)
+
+        try:
+            save_gantt(gantt, tmp_filename, stream=True)
+            os.replace(tmp_filename, path)
+
+        except BaseException:
+            os.unlink(tmp_filename)
+            raise
+
+    def render(self) -> WatchResult:
+        """
+        load the project file and render its gantt chart, where the
+        chart of the previous rendering is reused
+
+        :return: result of the rendering
+        :rtype: WatchResult
+        """
+        start = time.perf_counter()
+        try:
+            project = Project.create_from(
+                self.filename,
+                strict_dates=self.strict_dates,
+            )
+            gantt = create_gantt(
+                project=project,
+                view=self.view,
+                compact=self.compact,
+                viewport=self.viewport,
+                incremental=True,
+                previous=self.gantt,
+                critical_path=self.critical_path,
+            )
+            self._write(gantt)
+
+        except (OSError, ValueError, KeyError, yaml.YAMLError) as e:
+            # keep watching, e.g., while the file is edited
+            # => invalid documents raise a ValidationError (ValueError)
+            log.debug(f"cannot render '{self.filename}': {e}")
+            return WatchResult(
+                output_filename=self.output_filename,
+                duration=time.perf_counter() - start,
+                error=str(e),
+            )
+
+        # workpackages whose segments have not been reused
+        previous = set(self.gantt.segments) if self.gantt else set()
+        changed = [
+            segment.workpackage.name
+            for segment in gantt.segments[1:]
+            if segment not in previous
+        ]
+        self.gantt = gantt
+
+        return WatchResult(
+            output_filename=self.output_filename,
+            duration=time.perf_counter() - start,
+            changed=changed,
+            workpackage_count=len(gantt.segments) - 1,
+        )
+
+    def watch(
+        self,
+        max_renderings: Optional[int] = None,
+    ) -> Iterator[WatchResult]:
+        """
+        render the project and re-render it whenever its files change
+
+        :param max_renderings: stop after the given number of renderings,
+            defaults to None, i.e., watch until interrupted
+        :type max_renderings: Optional[int], optional
+        :yield: result per rendering
+        :rtype: Iterator[WatchResult]
+        """
+        renderings = 0
+        while (max_renderings is None) or (renderings < max_renderings):
+            if self.has_changed():
+                yield self.render()
+                renderings += 1
+                continue
+
+            time.sleep(self.interval)
+
+    def __repr__(self) -> str:
+        """
+        returns the string representation of the watcher
+
+        :return: string representation of the watcher
+        :rtype: str
+        """
+        return (
+            f"<Watcher(filename={self.filename}, "
+            f"output_filename={self.output_filename})>"
+        )
@@ -0,0 +1,28 @@
+import shutil
+from pathlib import Path
+
+import proma.batch
+from proma.batch import render_batch
+
+
+EXAMPLE = Path(__file__).parent.parent / "examples" / "example.yml"
+
+
+def statuses(filenames, output_dir) -> list:
+    return [
+        result.status
+        for result in render_batch(filenames, str(output_dir), workers=1)
+    ]
+
+
+def test_render_again_after_cache_version_change(tmp_path, monkeypatch):
+    filename = tmp_path / "example.yml"
+    shutil.copy(EXAMPLE, filename)
+    output_dir = tmp_path / "out"
+
+    assert statuses([str(filename)], output_dir) != ["skipped"]
+    assert statuses([str(filename)], output_dir) == ["skipped"]
+
+    # output of the new version differs => not skipped
+    monkeypatch.setattr(proma.batch, "CACHE_VERSION", -1)
+    assert statuses([str(filename)], output_dir) != ["skipped"]
@@ -0,0 +1,68 @@
+import os
+import datetime
+
+from proma.models import Project
+
+
+PROJECT = """
+name: project
+responsible: John Doe
+start_date: "2023-01-02"
+end_date: "2023-03-31"
+include:
+  - included.yml
+workpackages:
+  - name: Work Package A
+    responsible: John Doe
+    tasks:
+      - name: A1
+        start_date: "2023-01-02"
+        duration: {duration}
+"""
+
+INCLUDED = """
+name: Work Package B
+responsible: John Doe
+tasks:
+  - name: B1
+    duration: 1w
+    depends_on: A1
+"""
+
+
+def write(path, text: str, mtime_ns: int):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def task(project: Project, name: str):
+    return next(
+        t for wp in project.workpackages for t in wp.tasks if t.name == name
+    )
+
+
+def test_reload_changed_include_dependency(tmp_path):
+    filename = tmp_path / "project.yml"
+    write(filename, PROJECT.format(duration="1w"), 1_000_000_000)
+    write(tmp_path / "included.yml", INCLUDED, 1_000_000_000)
+
+    project = Project.create_from(str(filename))
+    assert task(project, "B1").start_date == datetime.datetime(2023, 1, 9)
+
+    # included file is unchanged => its cached workpackage is reused
+    write(filename, PROJECT.format(duration="3w"), 2_000_000_000)
+
+    project = Project.create_from(str(filename))
+    assert task(project, "B1").start_date == datetime.datetime(2023, 1, 23)
+
+
+def test_included_workpackages_are_copies(tmp_path):
+    filename = tmp_path / "project.yml"
+    write(filename, PROJECT.format(duration="1w"), 1_000_000_000)
+    write(tmp_path / "included.yml", INCLUDED, 1_000_000_000)
+
+    first = Project.create_from(str(filename))
+    second = Project.create_from(str(filename))
+
+    assert task(first, "B1") is not task(second, "B1")
+    assert task(first, "B1") == task(second, "B1")
@@ -0,0 +1,97 @@
+import pytest
+
+from proma.models import Project
+from proma.models import project as project_module
+from proma.render import render_gantt
+from proma.utils.instrumentation import instrumentation
+
+
+PROJECT = """
+name: project
+responsible: John Doe
+start_date: "2023-01-02"
+end_date: "2023-03-31"
+workpackages:
+  - name: Work Package A
+    responsible: John Doe
+    tasks:
+      - name: A1
+        start_date: "2023-01-02"
+        duration: 1w
+      - name: A2
+        {start_date}
+        duration: 1w
+        depends_on: {depends_on}
+"""
+
+
+def write_project(tmp_path, start_date: str = "", depends_on: str = "A1"):
+    filename = tmp_path / "project.yml"
+    filename.write_text(
+        PROJECT.format(start_date=start_date, depends_on=depends_on)
+    )
+
+    return str(filename)
+
+
+def test_streamed_without_scheduling(tmp_path, monkeypatch):
+    filename = write_project(tmp_path, start_date='start_date: "2023-01-16"')
+
+    def create_from(*args, **kwargs):
+        raise AssertionError("project must be streamed")
+
+    monkeypatch.setattr(Project, "create_from", create_from)
+    output = render_gantt(filename, str(tmp_path / "project.svg"))
+
+    assert "defaultbar" in open(output).read()
+
+
+def test_loaded_completely_for_scheduling(tmp_path):
+    filename = write_project(tmp_path)
+    output = render_gantt(filename, str(tmp_path / "project.svg"))
+
+    assert open(output).read().count('class="defaultbar"') == 2
+
+
+@pytest.mark.parametrize("timings", [False, True])
+def test_streamed_file_closed_for_scheduling(tmp_path, monkeypatch, timings):
+    filename = write_project(tmp_path)
+
+    # keep the streamed workpackages alive, thus only closing them closes
+    # the file
+    streamed = []
+    stream_from = Project.stream_from
+
+    def stream(*args, **kwargs):
+        project, workpackages = stream_from(*args, **kwargs)
+        streamed.append(workpackages)
+        return project, workpackages
+
+    files = []
+
+    def open_file(*args, **kwargs):
+        files.append(open(*args, **kwargs))
+        return files[-1]
+
+    monkeypatch.setattr(Project, "stream_from", staticmethod(stream))
+    monkeypatch.setattr(project_module, "open", open_file, raising=False)
+    if timings:
+        instrumentation.enable()
+    try:
+        render_gantt(filename, str(tmp_path / "project.svg"))
+    finally:
+        instrumentation.disable()
+
+    assert len(streamed) == 1
+    assert files and all(f.closed for f in files)
+
+
+def test_streamed_rejects_unknown_dependencies(tmp_path):
+    filename = write_project(
+        tmp_path,
+        start_date='start_date: "2023-01-16"',
+        depends_on="A3",
+    )
+
+    with pytest.raises(ValueError, match="unknown task 'A3'"):
+        render_gantt(filename, str(tmp_path / "project.svg"))
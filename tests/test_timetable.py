@@ -0,0 +1,44 @@
+import datetime
+from array import array
+
+import pytest
+
+from proma.models.timetablelevel import TimetableLevel
+from proma.models.types import DateType
+from proma.utils.timetable import Timetable
+
+
+START_DATE = datetime.datetime(2023, 1, 2)
+END_DATE = datetime.datetime(2023, 1, 31)
+
+
+@pytest.mark.parametrize("dt_type", list(DateType))
+def test_date_type_levels(dt_type):
+    level = TimetableLevel(dt_type=dt_type, ordinals=array("l"))
+
+    assert len(level) == 0
+
+
+def test_level_without_date_type_is_rejected():
+    # the value of a date type is not a date type
+    with pytest.raises(ValueError, match="not a DateType"):
+        TimetableLevel(dt_type="day", ordinals=array("l"))
+
+
+def test_all_date_type_formats():
+    timetable = Timetable(
+        start_date=START_DATE,
+        end_date=END_DATE,
+        formats={dt_type: "%d" for dt_type in DateType},
+    )
+
+    assert timetable.hierarchy == list(DateType)
+
+
+def test_format_without_date_type_is_rejected():
+    with pytest.raises(ValueError, match="not a DateType"):
+        Timetable(
+            start_date=START_DATE,
+            end_date=END_DATE,
+            formats={DateType.DAY: "%d", "week": "%V"},
+        )
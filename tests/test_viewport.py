@@ -0,0 +1,137 @@
+import datetime
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from proma.cmd import cli
+from proma.models import Project
+from proma.render import create_gantt
+from proma.draw.widgets.gantt.viewport import Viewport
+
+
+EXAMPLE = Path(__file__).parent.parent / "examples" / "example.yml"
+
+
+@pytest.fixture(scope="module")
+def project() -> Project:
+    return Project.create_from(str(EXAMPLE))
+
+
+@pytest.mark.parametrize("view", ["day", "week"])
+def test_unaligned_window(project, view):
+    viewport = Viewport(
+        start_date=datetime.datetime(2023, 3, 8),
+        end_date=datetime.datetime(2023, 3, 20),
+    )
+
+    gantt = create_gantt(project, view=view, viewport=viewport)
+
+    assert len(gantt.bars) > 0
+
+
+@pytest.mark.parametrize("view", ["day", "week"])
+@pytest.mark.parametrize("tile_days", [2, 3, 6, 7, 10])
+def test_tiles(project, view, tile_days):
+    tiles = list(
+        Viewport.tiles(
+            start_date=project.start_date,
+            end_date=project.end_date,
+            row_count=len(project.workpackages) + project.entries,
+            tile_days=tile_days,
+        )
+    )
+
+    bars, milestones, events = 0, 0, 0
+    for _, _, tile in tiles:
+        gantt = create_gantt(project, view=view, viewport=tile)
+
+        # bars are clipped to the tile's columns
+        cells = gantt.rows[-1]
+        for bar in gantt.bars:
+            assert cells[1].x1 <= bar.x1 < bar.x2 <= cells[-1].x2
+
+        bars += len(gantt.bars)
+        milestones += len(gantt.milestones)
+        events += len(gantt.events)
+
+    # each bar is drawn in at least one tile, but each milestone and
+    # event only in the tile of its date
+    assert bars >= project.entries
+    assert milestones == sum(
+        len(t.milestones) for wp in project.workpackages for t in wp.tasks
+    )
+    assert events == len(project.events)
+
+
+def test_culled_dates(project):
+    # from the middle of "My Task" to the middle of "My Task3"
+    viewport = Viewport(
+        start_date=datetime.datetime(2023, 3, 5),
+        end_date=datetime.datetime(2023, 3, 12),
+    )
+
+    gantt = create_gantt(project, view="day", viewport=viewport)
+
+    # "My Task4" (after the window) is culled
+    assert [bar.y for bar in gantt.bars] == [250, 275, 325]
+
+    # "My Task" is clipped at the start of the window (ends on 03-09)
+    cells = gantt.rows[-1]
+    first, second, third = gantt.bars
+    assert first.x1 == cells[1].x1
+    assert first.width == 4 * cells[1].width
+
+    # "My Task2" and "My Task3" are clipped at the end of the window
+    assert second.x1 == cells[7].x1
+    assert second.x2 == third.x2 == cells[-1].x2
+
+    # only "MS1" (03-08) is within the window, "today" (03-14) is not
+    assert [m.label.text.text for m in gantt.milestones] == ["MS1"]
+    assert gantt.events == []
+
+
+def test_culled_rows(project):
+    # "My Task" and "My Task2", i.e., without the workpackages' rows
+    viewport = Viewport(first_row=1, row_count=2)
+
+    gantt = create_gantt(project, viewport=viewport)
+
+    assert len(gantt.rows) == len(gantt.timetable.hierarchy) + 2
+    assert len(gantt.bars) == 2
+    assert [m.label.text.text for m in gantt.milestones] == ["MS1"]
+    assert len(gantt.events) == 1
+
+
+def test_week_includes_last_week(project):
+    # project ends on a Monday, i.e., in a new week
+    gantt = create_gantt(project, view="week")
+
+    assert gantt.timetable.get_pos(project.end_date) == (
+        len(gantt.timetable.lowest_level) - 1
+    )
+
+
+def test_window_past_the_last_row(project):
+    rows = len(project.workpackages) + project.entries
+    viewport = Viewport(first_row=rows + 10)
+
+    gantt = create_gantt(project, viewport=viewport)
+
+    # only the header is laid out
+    assert len(gantt.rows) == len(gantt.timetable.hierarchy)
+    assert (gantt.bars, gantt.milestones, gantt.events) == ([], [], [])
+
+
+@pytest.mark.parametrize("tiles", [[], ["--tile-days", "7"]])
+def test_window_outside_the_project(tmp_path, monkeypatch, tiles):
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(
+        cli,
+        ["gantt", str(EXAMPLE), "--no-cache", "--start-date", "2024-01-01"]
+        + tiles,
+    )
+
+    # usage error with the project's date range instead of a traceback
+    assert result.exit_code == 2
+    assert "2023-01-03 to 2023-05-01" in result.output
@@ -0,0 +1,53 @@
+import os
+
+from proma.watch import Watcher
+
+
+PROJECT = """
+name: project
+responsible: John Doe
+start_date: "2023-01-02"
+end_date: "2023-03-31"
+workpackages:
+  - name: Work Package A
+    responsible: John Doe
+    tasks:
+      - name: A1
+        start_date: "2023-01-02"
+        {duration}
+"""
+
+
+def write(path, text: str, mtime_ns: int):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_keep_watching_after_invalid_edit(tmp_path):
+    filename = tmp_path / "project.yml"
+    watcher = Watcher(str(filename), str(tmp_path / "project.svg"))
+
+    edits = [
+        # valid
+        PROJECT.format(duration="duration: 1w"),
+        # invalid duration => validation error
+        PROJECT.format(duration="duration: soon"),
+        # missing duration
+        PROJECT.format(duration=""),
+        # valid again
+        PROJECT.format(duration="duration: 2w"),
+    ]
+
+    results = []
+    for i, text in enumerate(edits, start=1):
+        write(filename, text, i * 1_000_000_000)
+        results.extend(watcher.watch(max_renderings=1))
+
+    assert [result.failed for result in results] == [
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert "not a valid duration" in results[1].error
+    assert os.path.isfile(tmp_path / "project.svg")